@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-import array
 import asyncio
+import audioop  # pylint: disable=deprecated-module
 from collections import defaultdict, deque
 from collections.abc import AsyncGenerator, AsyncIterable, Callable
 from dataclasses import asdict, dataclass, field
@@ -1248,16 +1248,8 @@ class PipelineRun:
 
 
 def _multiply_volume(chunk: bytes, volume_multiplier: float) -> bytes:
-    """Multiplies 16-bit PCM samples by a constant."""
-
-    def _clamp(val: float) -> float:
-        """Clamp to signed 16-bit."""
-        return max(-32768, min(32767, val))
-
-    return array.array(
-        "h",
-        (int(_clamp(value * volume_multiplier)) for value in array.array("h", chunk)),
-    ).tobytes()
+    """Multiplies 16-bit PCM samples by a constant, clamping to signed 16-bit."""
+    return audioop.mul(chunk, SAMPLE_WIDTH, volume_multiplier)
 
 
 def _pipeline_debug_recording_thread_proc(
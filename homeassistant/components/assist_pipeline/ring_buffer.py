@@ -28,8 +28,9 @@ class RingBuffer:
         """Return the length of data stored in the buffer."""
         return self._length
 
-    def put(self, data: bytes) -> None:
+    def put(self, data: bytes | memoryview) -> None:
         """Put a chunk of data into the buffer, possibly wrapping around."""
+        data = memoryview(data)
         data_len = len(data)
         new_pos = self._pos + data_len
         if new_pos >= self._maxlen:
@@ -49,9 +50,10 @@ class RingBuffer:
 
     def getvalue(self) -> bytes:
         """Get bytes written to the buffer."""
+        buffer = memoryview(self._buffer)
         if (self._pos + self._length) <= self._maxlen:
             # Single chunk
-            return bytes(self._buffer[: self._length])
+            return bytes(buffer[: self._length])
 
         # Two chunks
-        return bytes(self._buffer[self._pos :] + self._buffer[: self._pos])
+        return b"".join((buffer[self._pos :], buffer[: self._pos]))
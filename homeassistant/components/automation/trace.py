@@ -37,12 +37,12 @@ class AutomationTrace(ActionTrace):
         """Set trigger description."""
         self._trigger_description = trigger
 
-    def as_short_dict(self) -> dict[str, Any]:
-        """Return a brief dictionary version of this AutomationTrace."""
+    def _as_short_dict(self) -> dict[str, Any]:
+        """Return a brief dictionary version of this AutomationTrace without error."""
         if self._short_dict:
             return self._short_dict
 
-        result = super().as_short_dict()
+        result = super()._as_short_dict()
         result["trigger"] = self._trigger_description
         return result
 
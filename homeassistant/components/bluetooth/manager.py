@@ -6,6 +6,7 @@ from collections.abc import Callable, Iterable
 from functools import partial
 import itertools
 import logging
+from typing import Any
 
 from bleak_retry_connector import BleakSlotManager
 from bluetooth_adapters import BluetoothAdapters
@@ -49,6 +50,7 @@ class HomeAssistantBluetoothManager(BluetoothManager):
         "_integration_matcher",
         "_callback_index",
         "_cancel_logging_listener",
+        "_delivered_advertisements",
     )
 
     def __init__(
@@ -65,6 +67,8 @@ class HomeAssistantBluetoothManager(BluetoothManager):
         self._integration_matcher = integration_matcher
         self._callback_index = BluetoothCallbackMatcherIndex()
         self._cancel_logging_listener: CALLBACK_TYPE | None = None
+        # Advertisements with changed data that were dispatched, by address
+        self._delivered_advertisements: dict[str, int] = {}
         super().__init__(bluetooth_adapters, slot_manager)
         self._async_logging_changed()
 
@@ -102,6 +106,9 @@ class HomeAssistantBluetoothManager(BluetoothManager):
             self._async_trigger_matching_discovery(service_info)
 
     def _discover_service_info(self, service_info: BluetoothServiceInfoBleak) -> None:
+        delivered = self._delivered_advertisements
+        address = service_info.address
+        delivered[address] = delivered.get(address, 0) + 1
         matched_domains = self._integration_matcher.match_domains(service_info)
         if self._debug:
             _LOGGER.debug(
@@ -138,12 +145,19 @@ class HomeAssistantBluetoothManager(BluetoothManager):
     def _address_disappeared(self, address: str) -> None:
         """Dismiss all discoveries for the given address."""
         self._integration_matcher.async_clear_address(address)
+        self._delivered_advertisements.pop(address, None)
         for flow in self.hass.config_entries.flow.async_progress_by_init_data_type(
             BluetoothServiceInfoBleak,
             lambda service_info: bool(service_info.address == address),
         ):
             self.hass.config_entries.flow.async_abort(flow["flow_id"])
 
+    async def async_diagnostics(self) -> dict[str, Any]:
+        """Diagnostics for the manager."""
+        diagnostics = await super().async_diagnostics()
+        diagnostics["delivered_advertisements"] = dict(self._delivered_advertisements)
+        return diagnostics
+
     async def async_setup(self) -> None:
         """Set up the bluetooth manager."""
         await super().async_setup()
@@ -67,6 +67,7 @@ from homeassistant.loader import bind_hass
 from .const import (  # noqa: F401
     _DEPRECATED_STREAM_TYPE_HLS,
     _DEPRECATED_STREAM_TYPE_WEB_RTC,
+    CAMERA_IMAGE_CACHE_TTL,
     CAMERA_IMAGE_TIMEOUT,
     CAMERA_STREAM_SOURCE_TIMEOUT,
     CONF_DURATION,
@@ -176,6 +177,89 @@ async def async_request_stream(hass: HomeAssistant, entity_id: str, fmt: str) ->
     return await _async_stream_endpoint_url(hass, camera, fmt)
 
 
+class _CameraSnapshotBroker:
+    """Share snapshot fetches between the requesters of a camera.
+
+    Requests for the same size that arrive while a fetch is in flight
+    wait for that fetch instead of starting their own, and images fetched
+    within the last CAMERA_IMAGE_CACHE_TTL seconds are served from memory
+    so thumbnails are not fetched and scaled again for every requester.
+    """
+
+    __slots__ = ("_camera", "_fetches", "_images")
+
+    def __init__(self, camera: Camera) -> None:
+        """Initialize the snapshot broker."""
+        self._camera = camera
+        self._fetches: dict[
+            tuple[int | None, int | None], asyncio.Task[Image | None]
+        ] = {}
+        self._images: dict[tuple[int | None, int | None], tuple[float, Image]] = {}
+
+    async def async_get_image(
+        self, timeout: int, width: int | None, height: int | None
+    ) -> Image | None:
+        """Return a recent image, fetching one if needed."""
+        size = (width, height)
+        if (cached := self._images.get(size)) is not None and (
+            time.monotonic() - cached[0] < CAMERA_IMAGE_CACHE_TTL
+        ):
+            return cached[1]
+        if (fetch := self._fetches.get(size)) is None:
+            # Not started eagerly so the task is registered before
+            # it can finish and remove itself
+            fetch = self._camera.hass.async_create_task(
+                self._async_fetch_image(size, timeout),
+                f"camera {self._camera.entity_id} snapshot",
+                eager_start=False,
+            )
+            self._fetches[size] = fetch
+        # Shielded so a requester that gives up does not cancel
+        # the fetch for the others
+        return await asyncio.shield(fetch)
+
+    async def _async_fetch_image(
+        self, size: tuple[int | None, int | None], timeout: int
+    ) -> Image | None:
+        """Fetch an image from the camera and cache it."""
+        camera = self._camera
+        width, height = size
+        try:
+            async with asyncio.timeout(timeout):
+                image_bytes = (
+                    await _async_get_stream_image(
+                        camera,
+                        width=width,
+                        height=height,
+                        wait_for_next_keyframe=False,
+                    )
+                    if camera.use_stream_for_stills
+                    else await camera.async_camera_image(width=width, height=height)
+                )
+            if not image_bytes:
+                return None
+            content_type = camera.content_type
+            image = Image(content_type, image_bytes)
+            if (
+                width is not None
+                and height is not None
+                and ("jpeg" in content_type or "jpg" in content_type)
+            ):
+                image = Image(
+                    content_type, scale_jpeg_camera_image(image, width, height)
+                )
+            now = time.monotonic()
+            self._images = {
+                cached_size: cached
+                for cached_size, cached in self._images.items()
+                if now - cached[0] < CAMERA_IMAGE_CACHE_TTL
+            }
+            self._images[size] = (now, image)
+            return image
+        finally:
+            del self._fetches[size]
+
+
 async def _async_get_image(
     camera: Camera,
     timeout: int = 10,
@@ -189,30 +273,14 @@ async def _async_get_image(
     Not all cameras can scale images or return jpegs
     that we can scale, however the majority of cases
     are handled.
+
+    Concurrent requests share a single fetch and recent
+    images are served from the camera's snapshot cache.
     """
     with suppress(asyncio.CancelledError, TimeoutError):
         async with asyncio.timeout(timeout):
-            image_bytes = (
-                await _async_get_stream_image(
-                    camera, width=width, height=height, wait_for_next_keyframe=False
-                )
-                if camera.use_stream_for_stills
-                else await camera.async_camera_image(width=width, height=height)
-            )
-            if image_bytes:
-                content_type = camera.content_type
-                image = Image(content_type, image_bytes)
-                if (
-                    width is not None
-                    and height is not None
-                    and ("jpeg" in content_type or "jpg" in content_type)
-                ):
-                    assert width is not None
-                    assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
-                    )
-
+            broker = camera._snapshot_broker  # noqa: SLF001
+            if image := await broker.async_get_image(timeout, width, height):
                 return image
 
     raise HomeAssistantError("Unable to get image")
@@ -461,6 +529,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
         self._webrtc_providers: list[CameraWebRTCProvider] = []
+        self._snapshot_broker = _CameraSnapshotBroker(self)
 
     @cached_property
     def entity_picture(self) -> str:
@@ -35,6 +35,7 @@ CONF_DURATION: Final = "duration"
 
 CAMERA_STREAM_SOURCE_TIMEOUT: Final = 10
 CAMERA_IMAGE_TIMEOUT: Final = 10
+CAMERA_IMAGE_CACHE_TTL: Final = 1
 
 
 class CameraState(StrEnum):
@@ -13,7 +13,13 @@ import time
 from typing import IO, Any, cast
 
 from hassil.expression import Expression, ListReference, Sequence
-from hassil.intents import Intents, SlotList, TextSlotList, WildcardSlotList
+from hassil.intents import (
+    Intents,
+    SlotList,
+    TextSlotList,
+    TextSlotValue,
+    WildcardSlotList,
+)
 from hassil.recognize import (
     MISSING_ENTITY,
     RecognizeResult,
@@ -160,6 +166,17 @@ class DefaultAgent(ConversationEntity):
         self._config_intents: dict[str, Any] = config_intents
         self._slot_lists: dict[str, SlotList] | None = None
 
+        # Names of all entities (including unexposed), used as a fallback
+        self._all_names_list: TextSlotList | None = None
+
+        # entity_id -> (exposed names, all names)
+        self._entity_names: (
+            dict[str, tuple[list[TextSlotValue], list[TextSlotValue]]] | None
+        ) = None
+        # Entities renamed in the registry, whose next state has their new name
+        self._renamed_entity_ids: set[str] = set()
+        self._area_floor_lists: dict[str, SlotList] | None = None
+
         # Sentences that will trigger a callback (skipping intent recognition)
         self._trigger_sentences: list[TriggerData] = []
         self._trigger_intents: Intents | None = None
@@ -183,7 +200,11 @@ class DefaultAgent(ConversationEntity):
     @core.callback
     def _filter_state_changes(self, event_data: core.EventStateChangedData) -> bool:
         """Filter state changed events."""
-        return not event_data["old_state"] or not event_data["new_state"]
+        return (
+            not event_data["old_state"]
+            or not event_data["new_state"]
+            or event_data["entity_id"] in self._renamed_entity_ids
+        )
 
     @core.callback
     def _listen_clear_slot_list(self) -> None:
@@ -193,20 +214,20 @@ class DefaultAgent(ConversationEntity):
         self._unsub_clear_slot_list = [
             self.hass.bus.async_listen(
                 ar.EVENT_AREA_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_clear_area_floor_lists,
             ),
             self.hass.bus.async_listen(
                 fr.EVENT_FLOOR_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_clear_area_floor_lists,
             ),
             self.hass.bus.async_listen(
                 er.EVENT_ENTITY_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_update_entity_names,
                 event_filter=self._filter_entity_registry_changes,
             ),
             self.hass.bus.async_listen(
                 EVENT_STATE_CHANGED,
-                self._async_clear_slot_list,
+                self._async_update_entity_names,
                 event_filter=self._filter_state_changes,
             ),
             async_listen_entity_updates(self.hass, DOMAIN, self._async_clear_slot_list),
@@ -228,6 +249,8 @@ class DefaultAgent(ConversationEntity):
             return None
 
         slot_lists = self._make_slot_lists()
+        all_names_list = self._all_names_list
+        assert all_names_list is not None
         intent_context = self._make_intent_context(user_input)
 
         start = time.monotonic()
@@ -239,6 +262,7 @@ class DefaultAgent(ConversationEntity):
             slot_lists,
             intent_context,
             language,
+            all_names_list,
         )
 
         _LOGGER.debug(
@@ -435,6 +459,7 @@ class DefaultAgent(ConversationEntity):
         slot_lists: dict[str, SlotList],
         intent_context: dict[str, Any] | None,
         language: str,
+        all_names_list: TextSlotList,
     ) -> RecognizeResult | None:
         """Search intents for a match to user input."""
         strict_result = self._recognize_strict(
@@ -446,40 +471,7 @@ class DefaultAgent(ConversationEntity):
             return strict_result
 
         # Try again with all entities (including unexposed)
-        entity_registry = er.async_get(self.hass)
-        all_entity_names: list[tuple[str, str, dict[str, Any]]] = []
-
-        for state in self.hass.states.async_all():
-            context = {"domain": state.domain}
-            if state.attributes:
-                # Include some attributes
-                for attr in DEFAULT_EXPOSED_ATTRIBUTES:
-                    if attr not in state.attributes:
-                        continue
-                    context[attr] = state.attributes[attr]
-
-            if entity := entity_registry.async_get(state.entity_id):
-                # Skip config/hidden entities
-                if (entity.entity_category is not None) or (
-                    entity.hidden_by is not None
-                ):
-                    continue
-
-                if entity.aliases:
-                    # Also add aliases
-                    for alias in entity.aliases:
-                        if not alias.strip():
-                            continue
-
-                        all_entity_names.append((alias, alias, context))
-
-            # Default name
-            all_entity_names.append((state.name, state.name, context))
-
-        slot_lists = {
-            **slot_lists,
-            "name": TextSlotList.from_tuples(all_entity_names, allow_template=False),
-        }
+        slot_lists = {**slot_lists, "name": all_names_list}
 
         strict_result = self._recognize_strict(
             user_input,
@@ -721,6 +713,9 @@ class DefaultAgent(ConversationEntity):
 
         self._make_slot_lists()
 
+        if self._trigger_sentences and (self._trigger_intents is None):
+            self._rebuild_trigger_intents()
+
     async def async_get_or_load_intents(self, language: str) -> LanguageIntents | None:
         """Load all intents of a language with lock."""
         if lang_intents := self._lang_intents.get(language):
@@ -871,6 +866,11 @@ class DefaultAgent(ConversationEntity):
 
         intents = Intents.from_dict(intents_dict)
 
+        # Parse sentence templates now instead of during the first recognition
+        for intent_obj in intents.intents.values():
+            for intent_data in intent_obj.data:
+                _ = intent_data.sentences
+
         # Load responses
         responses_dict = intents_dict.get("responses", {})
         intent_responses = responses_dict.get("intents", {})
@@ -892,58 +892,92 @@ class DefaultAgent(ConversationEntity):
         if self._unsub_clear_slot_list is None:
             return
         self._slot_lists = None
+        self._all_names_list = None
+        self._entity_names = None
+        self._renamed_entity_ids.clear()
+        self._area_floor_lists = None
         for unsub in self._unsub_clear_slot_list:
             unsub()
         self._unsub_clear_slot_list = None
 
     @core.callback
-    def _make_slot_lists(self) -> dict[str, SlotList]:
-        """Create slot lists with areas and entity names/aliases."""
-        if self._slot_lists is not None:
-            return self._slot_lists
+    def _async_clear_area_floor_lists(self, event: core.Event[Any]) -> None:
+        """Clear area and floor slot lists when their registry has changed."""
+        self._area_floor_lists = None
+        self._slot_lists = None
 
-        start = time.monotonic()
+    @core.callback
+    def _async_update_entity_names(
+        self,
+        event: core.Event[core.EventStateChangedData]
+        | core.Event[er.EventEntityRegistryUpdatedData],
+    ) -> None:
+        """Update the names of a single entity when it has changed."""
+        if self._entity_names is None:
+            return
 
-        entity_registry = er.async_get(self.hass)
-
-        # Gather entity names, keeping track of exposed names.
-        # We try intent recognition with only exposed names first, then all names.
-        #
-        # NOTE: We do not pass entity ids in here because multiple entities may
-        # have the same name. The intent matcher doesn't gather all matching
-        # values for a list, just the first. So we will need to match by name no
-        # matter what.
-        exposed_entity_names = []
-        for state in self.hass.states.async_all():
-            is_exposed = async_should_expose(self.hass, DOMAIN, state.entity_id)
-
-            # Checked against "requires_context" and "excludes_context" in hassil
-            context = {"domain": state.domain}
-            if state.attributes:
-                # Include some attributes
-                for attr in DEFAULT_EXPOSED_ATTRIBUTES:
-                    if attr not in state.attributes:
-                        continue
-                    context[attr] = state.attributes[attr]
+        entity_id = event.data["entity_id"]
+        if event.event_type == er.EVENT_ENTITY_REGISTRY_UPDATED:
+            # The state may not have the new name yet, it depends on which
+            # listener runs first. Update again when the state is written.
+            self._renamed_entity_ids.add(entity_id)
+        else:
+            self._renamed_entity_ids.discard(entity_id)
+        if (state := self.hass.states.get(entity_id)) is None:
+            if self._entity_names.pop(entity_id, None) is None:
+                return
+        else:
+            self._entity_names[entity_id] = self._make_entity_names(
+                state, er.async_get(self.hass)
+            )
 
-            if (
-                entity := entity_registry.async_get(state.entity_id)
-            ) and entity.aliases:
-                for alias in entity.aliases:
-                    if not alias.strip():
-                        continue
+        self._slot_lists = None
+        self._all_names_list = None
 
-                    name_tuple = (alias, alias, context)
-                    if is_exposed:
-                        exposed_entity_names.append(name_tuple)
+    @core.callback
+    def _make_entity_names(
+        self, state: core.State, entity_registry: er.EntityRegistry
+    ) -> tuple[list[TextSlotValue], list[TextSlotValue]]:
+        """Return exposed and listed slot values for the names of an entity."""
+        is_exposed = async_should_expose(self.hass, DOMAIN, state.entity_id)
+
+        # Checked against "requires_context" and "excludes_context" in hassil
+        context = {"domain": state.domain}
+        if state.attributes:
+            # Include some attributes
+            for attr in DEFAULT_EXPOSED_ATTRIBUTES:
+                if attr not in state.attributes:
+                    continue
+                context[attr] = state.attributes[attr]
+
+        names: list[TextSlotValue] = []
+        # Config/hidden entities are only matched when exposed
+        is_listed = True
+        if entity := entity_registry.async_get(state.entity_id):
+            is_listed = (entity.entity_category is None) and (entity.hidden_by is None)
 
-            # Default name
-            name_tuple = (state.name, state.name, context)
-            if is_exposed:
-                exposed_entity_names.append(name_tuple)
+            for alias in entity.aliases:
+                if not alias.strip():
+                    continue
+
+                names.append(
+                    TextSlotValue.from_tuple(
+                        (alias, alias, context), allow_template=False
+                    )
+                )
+
+        # Default name
+        names.append(
+            TextSlotValue.from_tuple(
+                (state.name, state.name, context), allow_template=False
+            )
+        )
 
-        _LOGGER.debug("Exposed entities: %s", exposed_entity_names)
+        return (names if is_exposed else [], names if is_listed else [])
 
+    @core.callback
+    def _make_area_floor_lists(self) -> dict[str, SlotList]:
+        """Create slot lists with area and floor names/aliases."""
         # Expose all areas.
         areas = ar.async_get(self.hass)
         area_names = []
@@ -974,15 +1008,58 @@ class DefaultAgent(ConversationEntity):
 
                 floor_names.append((alias, floor.name))
 
-        self._slot_lists = {
+        return {
             "area": TextSlotList.from_tuples(area_names, allow_template=False),
-            "name": TextSlotList.from_tuples(
-                exposed_entity_names, allow_template=False
-            ),
             "floor": TextSlotList.from_tuples(floor_names, allow_template=False),
         }
 
-        self._listen_clear_slot_list()
+    @core.callback
+    def _make_slot_lists(self) -> dict[str, SlotList]:
+        """Create slot lists with areas and entity names/aliases."""
+        if self._slot_lists is not None:
+            return self._slot_lists
+
+        start = time.monotonic()
+
+        if self._entity_names is None:
+            entity_registry = er.async_get(self.hass)
+
+            # Gather entity names, keeping track of exposed names.
+            # We try intent recognition with only exposed names first, then all
+            # names. Names are kept per entity so that changes to a single
+            # entity don't require gathering the names of all entities again.
+            #
+            # NOTE: We do not pass entity ids in here because multiple entities
+            # may have the same name. The intent matcher doesn't gather all
+            # matching values for a list, just the first. So we will need to
+            # match by name no matter what.
+            self._entity_names = {
+                state.entity_id: self._make_entity_names(state, entity_registry)
+                for state in self.hass.states.async_all()
+            }
+
+        if self._area_floor_lists is None:
+            self._area_floor_lists = self._make_area_floor_lists()
+
+        exposed_entity_names: list[TextSlotValue] = []
+        all_entity_names: list[TextSlotValue] = []
+        for exposed_names, all_names in self._entity_names.values():
+            exposed_entity_names.extend(exposed_names)
+            all_entity_names.extend(all_names)
+
+        _LOGGER.debug(
+            "Exposed entities: %s",
+            [value.value_out for value in exposed_entity_names],
+        )
+
+        self._slot_lists = {
+            **self._area_floor_lists,
+            "name": TextSlotList(name=None, values=exposed_entity_names),
+        }
+        self._all_names_list = TextSlotList(name=None, values=all_entity_names)
+
+        if self._unsub_clear_slot_list is None:
+            self._listen_clear_slot_list()
 
         _LOGGER.debug(
             "Created slot lists in %.2f seconds",
@@ -83,13 +83,22 @@ class DhcpServiceInfo(BaseServiceInfo):
     macaddress: str
 
 
+@dataclass(slots=True, frozen=True)
+class CompiledDhcpMatcher:
+    """A dhcp entry with its hostname pattern compiled."""
+
+    matcher: DHCPMatcher
+    domain: str
+    hostname: re.Pattern | None
+
+
 @dataclass(slots=True)
 class DhcpMatchers:
     """Prepared info from dhcp entries."""
 
     registered_devices_domains: set[str]
-    no_oui_matchers: dict[str, list[DHCPMatcher]]
-    oui_matchers: dict[str, list[DHCPMatcher]]
+    no_oui_matchers: dict[str, list[CompiledDhcpMatcher]]
+    oui_matchers: dict[str, list[CompiledDhcpMatcher]]
 
 
 def async_index_integration_matchers(
@@ -102,23 +111,32 @@ def async_index_integration_matchers(
     1. Registered devices
     2. Devices with no OUI - index by first char of lower() hostname
     3. Devices with OUI - index by OUI
+
+    Hostname patterns are compiled once here, so matching a packet does
+    not have to look them up again.
     """
     registered_devices_domains: set[str] = set()
-    no_oui_matchers: dict[str, list[DHCPMatcher]] = {}
-    oui_matchers: dict[str, list[DHCPMatcher]] = {}
+    no_oui_matchers: dict[str, list[CompiledDhcpMatcher]] = {}
+    oui_matchers: dict[str, list[CompiledDhcpMatcher]] = {}
     for matcher in integration_matchers:
         domain = matcher["domain"]
         if REGISTERED_DEVICES in matcher:
             registered_devices_domains.add(domain)
             continue
 
+        hostname = matcher.get(HOSTNAME)
+        compiled = CompiledDhcpMatcher(
+            matcher,
+            domain,
+            None if hostname is None else _compile_fnmatch(hostname),
+        )
         if mac_address := matcher.get(MAC_ADDRESS):
-            oui_matchers.setdefault(mac_address[:6], []).append(matcher)
+            oui_matchers.setdefault(mac_address[:6], []).append(compiled)
             continue
 
-        if hostname := matcher.get(HOSTNAME):
+        if hostname:
             first_char = hostname[0].lower()
-            no_oui_matchers.setdefault(first_char, []).append(matcher)
+            no_oui_matchers.setdefault(first_char, []).append(compiled)
 
     return DhcpMatchers(
         registered_devices_domains=registered_devices_domains,
@@ -268,20 +286,17 @@ class WatcherBase:
         lowercase_hostname_first_char = (
             lowercase_hostname[0] if len(lowercase_hostname) else ""
         )
-        for matcher in itertools.chain(
+        for compiled in itertools.chain(
             matchers.no_oui_matchers.get(lowercase_hostname_first_char, ()),
             matchers.oui_matchers.get(oui, ()),
         ):
-            domain = matcher["domain"]
             if (
-                matcher_hostname := matcher.get(HOSTNAME)
-            ) is not None and not _memorized_fnmatch(
-                lowercase_hostname, matcher_hostname
-            ):
+                hostname_pattern := compiled.hostname
+            ) is not None and not hostname_pattern.match(lowercase_hostname):
                 continue
 
-            _LOGGER.debug("Matched %s against %s", data, matcher)
-            matched_domains.add(domain)
+            _LOGGER.debug("Matched %s against %s", data, compiled.matcher)
+            matched_domains.add(compiled.domain)
 
         if not matched_domains:
             return  # avoid creating DiscoveryKey if there are no matches
@@ -471,18 +486,3 @@ class RediscoveryWatcher(WatcherBase):
 def _compile_fnmatch(pattern: str) -> re.Pattern:
     """Compile a fnmatch pattern."""
     return re.compile(translate(pattern))
-
-
-@lru_cache(maxsize=1024, typed=True)
-def _memorized_fnmatch(name: str, pattern: str) -> bool:
-    """Memorized version of fnmatch that has a larger lru_cache.
-
-    The default version of fnmatch only has a lru_cache of 256 entries.
-    With many devices we quickly reach that limit and end up compiling
-    the same pattern over and over again.
-
-    DHCP has its own memorized fnmatch with its own lru_cache
-    since the data is going to be relatively the same
-    since the devices will not change frequently
-    """
-    return bool(_compile_fnmatch(pattern).match(name))
@@ -398,20 +398,22 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     static_paths_configs: list[StaticPathConfig] = []
 
-    for path, should_cache in (
-        ("service_worker.js", False),
-        ("sw-modern.js", False),
-        ("sw-modern.js.map", False),
-        ("sw-legacy.js", False),
-        ("sw-legacy.js.map", False),
-        ("robots.txt", False),
-        ("onboarding.html", not is_dev),
-        ("static", not is_dev),
-        ("frontend_latest", not is_dev),
-        ("frontend_es5", not is_dev),
+    for path, should_cache, memory_cache in (
+        ("service_worker.js", False, False),
+        ("sw-modern.js", False, False),
+        ("sw-modern.js.map", False, False),
+        ("sw-legacy.js", False, False),
+        ("sw-legacy.js.map", False, False),
+        ("robots.txt", False, False),
+        ("onboarding.html", not is_dev, False),
+        ("static", not is_dev, not is_dev),
+        ("frontend_latest", not is_dev, not is_dev),
+        ("frontend_es5", not is_dev, not is_dev),
     ):
         static_paths_configs.append(
-            StaticPathConfig(f"/{path}", str(root_path / path), should_cache)
+            StaticPathConfig(
+                f"/{path}", str(root_path / path), should_cache, memory_cache
+            )
         )
 
     static_paths_configs.append(
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import bisect
+from collections.abc import Callable, Hashable
 from datetime import timedelta
+from functools import partial
 import logging
+import math
 from typing import Any
 
 import voluptuous as vol
@@ -40,6 +43,15 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
+
+type _NumericStateMatchListener = Callable[
+    [Event[EventStateChangedData], bool, exceptions.ConditionError | None], None
+]
+
+DATA_NUMERIC_STATE_INDEXES: HassKey[dict[str, _NumericStateIndex]] = HassKey(
+    "homeassistant_numeric_state_trigger_indexes"
+)
 
 
 def validate_above_below[_T: dict[str, Any]](value: _T) -> _T:
@@ -95,6 +107,260 @@ async def async_validate_trigger_config(
     return config
 
 
+class _NumericStateMatcher:
+    """Evaluate a numeric state trigger predicate on state changes of an entity.
+
+    Numeric state triggers of different automations which watch the same entity
+    with the same thresholds and without a value template share a matcher. The
+    predicate is evaluated once per state change, and the result is passed to
+    all of them.
+    """
+
+    __slots__ = ("_check", "_entity_id", "listeners")
+
+    def __init__(
+        self,
+        entity_id: str,
+        check: Callable[[str, State | None, str | State | None], bool],
+    ) -> None:
+        """Initialize the matcher."""
+        self._check = check
+        self._entity_id = entity_id
+        self.listeners: list[_NumericStateMatchListener] = []
+
+    @callback
+    def async_evaluate(self, event: Event[EventStateChangedData]) -> None:
+        """Evaluate a state change and pass the result on to the listeners."""
+        from_s = event.data["old_state"]
+        to_s = event.data["new_state"]
+
+        error: exceptions.ConditionError | None = None
+        try:
+            matching = self._check(self._entity_id, from_s, to_s)
+        except exceptions.ConditionError as ex:
+            matching = False
+            error = ex
+
+        for listener in self.listeners.copy():
+            try:
+                listener(event, matching, error)
+            except Exception:
+                _LOGGER.exception(
+                    "Error while dispatching state change of %s to %s",
+                    event.data["entity_id"],
+                    listener,
+                )
+
+
+def _numeric_value(state: State, attribute: str | None) -> float | None:
+    """Return the numeric value of a state or attribute, or None."""
+    if attribute is None:
+        value: Any = state.state
+    elif (value := state.attributes.get(attribute)) is None:
+        return None
+    try:
+        fvalue = float(value)
+    except (ValueError, TypeError):
+        return None
+    return fvalue if math.isfinite(fvalue) else None
+
+
+class _NumericThresholds:
+    """Matchers of an entity sorted by their constant thresholds."""
+
+    __slots__ = ("matchers", "thresholds", "value")
+
+    def __init__(self) -> None:
+        """Initialize the thresholds."""
+        self.matchers: list[_NumericStateMatcher] = []
+        self.thresholds: list[float] = []
+        self.value: float | None = None
+
+    @callback
+    def async_add(self, threshold: float, matcher: _NumericStateMatcher) -> None:
+        """Add a matcher with one of its thresholds."""
+        index = bisect.bisect_right(self.thresholds, threshold)
+        self.thresholds.insert(index, threshold)
+        self.matchers.insert(index, matcher)
+
+    @callback
+    def async_remove(self, matcher: _NumericStateMatcher) -> None:
+        """Remove all thresholds of a matcher."""
+        while matcher in self.matchers:
+            index = self.matchers.index(matcher)
+            del self.thresholds[index]
+            del self.matchers[index]
+
+    @callback
+    def async_crossed(self, value: float | None) -> list[_NumericStateMatcher]:
+        """Return the matchers with a threshold crossed by a new value.
+
+        Only the result of these matchers can differ from the previous value,
+        all matchers are returned when either value is not numeric.
+        """
+        previous = self.value
+        self.value = value
+        if value is None or previous is None:
+            crossed = self.matchers
+        else:
+            low, high = (previous, value) if previous < value else (value, previous)
+            crossed = self.matchers[
+                bisect.bisect_left(self.thresholds, low) : bisect.bisect_right(
+                    self.thresholds, high
+                )
+            ]
+        return list(dict.fromkeys(crossed))
+
+
+class _NumericStateIndex:
+    """Dispatch state changes of an entity to its numeric state matchers.
+
+    Matchers with constant thresholds are indexed per attribute, so that a
+    state change only evaluates the matchers with a threshold between the
+    previous and the new value. Matchers with a value template or with an
+    entity as threshold are evaluated on every state change.
+    """
+
+    __slots__ = ("_always", "_indexed", "_unsub", "matchers")
+
+    def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
+        """Initialize the index."""
+        self.matchers: dict[Hashable, _NumericStateMatcher] = {}
+        self._always: list[_NumericStateMatcher] = []
+        self._indexed: dict[str | None, _NumericThresholds] = {}
+        self._unsub = async_track_state_change_event(
+            hass, entity_id, self._async_state_changed
+        )
+
+    @callback
+    def async_add(
+        self,
+        predicate: Hashable,
+        matcher: _NumericStateMatcher,
+        attribute: str | None,
+        thresholds: list[float] | None,
+    ) -> None:
+        """Add a matcher, thresholds are None when they are not constant."""
+        self.matchers[predicate] = matcher
+        if thresholds is None:
+            self._always.append(matcher)
+            return
+        if (indexed := self._indexed.get(attribute)) is None:
+            indexed = self._indexed[attribute] = _NumericThresholds()
+        for threshold in thresholds:
+            indexed.async_add(threshold, matcher)
+
+    @callback
+    def async_remove(self, predicate: Hashable) -> None:
+        """Remove a matcher."""
+        matcher = self.matchers.pop(predicate)
+        if matcher in self._always:
+            self._always.remove(matcher)
+            return
+        for attribute, indexed in list(self._indexed.items()):
+            indexed.async_remove(matcher)
+            if not indexed.matchers:
+                del self._indexed[attribute]
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop listening for state changes."""
+        self._unsub()
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Evaluate the matchers affected by a state change."""
+        if (to_s := event.data["new_state"]) is None:
+            return
+
+        for matcher in self._always.copy():
+            matcher.async_evaluate(event)
+
+        for attribute, indexed in list(self._indexed.items()):
+            for matcher in indexed.async_crossed(_numeric_value(to_s, attribute)):
+                matcher.async_evaluate(event)
+
+
+@callback
+def _async_check_thresholds(
+    hass: HomeAssistant,
+    below: float | str | None,
+    above: float | str | None,
+    attribute: str | None,
+    entity_id: str,
+    from_s: State | None,
+    to_s: str | State | None,
+) -> bool:
+    """Return whether the thresholds are met, raise ConditionError if unknown."""
+    return condition.async_numeric_state(
+        hass, to_s, below, above, None, None, attribute
+    )
+
+
+@callback
+def _async_track_numeric_state_match(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    config: ConfigType,
+    check_numeric_state: Callable[[str, State | None, str | State | None], bool],
+    listener: _NumericStateMatchListener,
+) -> CALLBACK_TYPE:
+    """Call listener with the evaluated numeric state changes of entity_ids.
+
+    check_numeric_state is only used for triggers with a value template, the
+    matchers of other triggers do not depend on the automation.
+    """
+    indexes = hass.data.setdefault(DATA_NUMERIC_STATE_INDEXES, {})
+    attribute = config.get(CONF_ATTRIBUTE)
+    below = config.get(CONF_BELOW)
+    above = config.get(CONF_ABOVE)
+    predicate: Hashable
+    thresholds: list[float] | None = None
+    if CONF_VALUE_TEMPLATE in config:
+        # Templates are rendered with the variables of the automation
+        predicate = object()
+    else:
+        check_numeric_state = partial(
+            _async_check_thresholds, hass, below, above, attribute
+        )
+        predicate = (attribute, below, above)
+        try:
+            hash(predicate)
+        except TypeError:
+            predicate = object()
+        else:
+            if not isinstance(below, str) and not isinstance(above, str):
+                thresholds = [
+                    float(threshold)
+                    for threshold in (below, above)
+                    if threshold is not None
+                ]
+
+    for entity_id in entity_ids:
+        if (index := indexes.get(entity_id)) is None:
+            index = indexes[entity_id] = _NumericStateIndex(hass, entity_id)
+        if (matcher := index.matchers.get(predicate)) is None:
+            matcher = _NumericStateMatcher(entity_id, check_numeric_state)
+            index.async_add(predicate, matcher, attribute, thresholds)
+        matcher.listeners.append(listener)
+
+    @callback
+    def async_remove() -> None:
+        """Remove the listener from the matchers."""
+        for entity_id in entity_ids:
+            index = indexes[entity_id]
+            matcher = index.matchers[predicate]
+            matcher.listeners.remove(listener)
+            if matcher.listeners:
+                continue
+            index.async_remove(predicate)
+            if not index.matchers:
+                index.async_shutdown()
+                del indexes[entity_id]
+
+    return async_remove
+
+
 async def async_attach_trigger(
     hass: HomeAssistant,
     config: ConfigType,
@@ -104,7 +370,9 @@ async def async_attach_trigger(
     platform_type: str = "numeric_state",
 ) -> CALLBACK_TYPE:
     """Listen for state changes based on configuration."""
-    entity_ids: list[str] = config[CONF_ENTITY_ID]
+    entity_ids: list[str] | str = config[CONF_ENTITY_ID]
+    if isinstance(entity_ids, str):
+        entity_ids = [entity_ids]
     below = config.get(CONF_BELOW)
     above = config.get(CONF_ABOVE)
     time_delta = config.get(CONF_FOR)
@@ -153,14 +421,16 @@ async def async_attach_trigger(
             )
 
     @callback
-    def state_automation_listener(event: Event[EventStateChangedData]) -> None:
-        """Listen for state changes and calls action."""
+    def state_automation_listener(
+        event: Event[EventStateChangedData],
+        matching: bool,
+        error: exceptions.ConditionError | None,
+    ) -> None:
+        """Listen for evaluated state changes and calls action."""
         entity_id = event.data["entity_id"]
         from_s = event.data["old_state"]
         to_s = event.data["new_state"]
-
-        if to_s is None:
-            return
+        assert to_s is not None
 
         @callback
         def call_action() -> None:
@@ -196,10 +466,8 @@ async def async_attach_trigger(
                 # primary async_track_state_change_event() listener.
                 return False
 
-        try:
-            matching = check_numeric_state(entity_id, from_s, to_s)
-        except exceptions.ConditionError as ex:
-            _LOGGER.warning("Error in '%s' trigger: %s", trigger_info["name"], ex)
+        if error is not None:
+            _LOGGER.warning("Error in '%s' trigger: %s", trigger_info["name"], error)
             return
 
         if not matching:
@@ -230,7 +498,9 @@ async def async_attach_trigger(
             else:
                 call_action()
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    unsub = _async_track_numeric_state_match(
+        hass, entity_ids, config, check_numeric_state, state_automation_listener
+    )
 
     @callback
     def async_remove() -> None:
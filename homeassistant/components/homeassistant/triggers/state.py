@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from datetime import timedelta
 import logging
+from typing import Any
 
 import voluptuous as vol
 
@@ -31,6 +32,7 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,6 +42,14 @@ CONF_TO = "to"
 CONF_NOT_FROM = "not_from"
 CONF_NOT_TO = "not_to"
 
+type _StateMatchListener = Callable[
+    [Event[EventStateChangedData], object, object], None
+]
+
+DATA_STATE_MATCHERS: HassKey[dict[Hashable, _SharedStateMatcher]] = HassKey(
+    "homeassistant_state_trigger_matchers"
+)
+
 BASE_SCHEMA = cv.TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_PLATFORM): "state",
@@ -91,49 +101,71 @@ async def async_validate_trigger_config(
     return config
 
 
-async def async_attach_trigger(
-    hass: HomeAssistant,
-    config: ConfigType,
-    action: TriggerActionType,
-    trigger_info: TriggerInfo,
-    *,
-    platform_type: str = "state",
-) -> CALLBACK_TYPE:
-    """Listen for state changes based on configuration."""
-    entity_ids = config[CONF_ENTITY_ID]
+def _hashable_match(value: Any) -> Any:
+    """Convert a from or to value to a hashable key."""
+    if isinstance(value, list):
+        return tuple(_hashable_match(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(
+            sorted((key, _hashable_match(item)) for key, item in value.items())
+        )
+    return value
 
-    if (from_state := config.get(CONF_FROM)) is not None:
-        match_from_state = process_state_match(from_state)
-    elif (not_from_state := config.get(CONF_NOT_FROM)) is not None:
-        match_from_state = process_state_match(not_from_state, invert=True)
-    else:
-        match_from_state = process_state_match(MATCH_ALL)
 
-    if (to_state := config.get(CONF_TO)) is not None:
-        match_to_state = process_state_match(to_state)
-    elif (not_to_state := config.get(CONF_NOT_TO)) is not None:
-        match_to_state = process_state_match(not_to_state, invert=True)
-    else:
-        match_to_state = process_state_match(MATCH_ALL)
+class _SharedStateMatcher:
+    """Match state changes of an entity against a state trigger predicate.
 
-    time_delta = config.get(CONF_FOR)
-    # If neither CONF_FROM or CONF_TO are specified,
-    # fire on all changes to the state or an attribute
-    match_all = all(
-        item not in config for item in (CONF_FROM, CONF_NOT_FROM, CONF_NOT_TO, CONF_TO)
+    State triggers of different automations which watch the same entity with
+    the same predicate share a matcher. The predicate is evaluated once per
+    state change, and the result is passed to all of them.
+    """
+
+    __slots__ = (
+        "_attribute",
+        "_match_all",
+        "_match_from_state",
+        "_match_to_state",
+        "_unsub",
+        "listeners",
     )
-    unsub_track_same: dict[str, Callable[[], None]] = {}
-    period: dict[str, timedelta] = {}
-    attribute = config.get(CONF_ATTRIBUTE)
-    job = HassJob(action, f"state trigger {trigger_info}")
 
-    trigger_data = trigger_info["trigger_data"]
-    _variables = trigger_info["variables"] or {}
+    def __init__(self, hass: HomeAssistant, entity_id: str, config: ConfigType) -> None:
+        """Initialize the matcher."""
+        if (from_state := config.get(CONF_FROM)) is not None:
+            self._match_from_state = process_state_match(from_state)
+        elif (not_from_state := config.get(CONF_NOT_FROM)) is not None:
+            self._match_from_state = process_state_match(not_from_state, invert=True)
+        else:
+            self._match_from_state = process_state_match(MATCH_ALL)
+
+        if (to_state := config.get(CONF_TO)) is not None:
+            self._match_to_state = process_state_match(to_state)
+        elif (not_to_state := config.get(CONF_NOT_TO)) is not None:
+            self._match_to_state = process_state_match(not_to_state, invert=True)
+        else:
+            self._match_to_state = process_state_match(MATCH_ALL)
+
+        # If neither CONF_FROM or CONF_TO are specified,
+        # fire on all changes to the state or an attribute
+        self._match_all = all(
+            item not in config
+            for item in (CONF_FROM, CONF_NOT_FROM, CONF_NOT_TO, CONF_TO)
+        )
+        self._attribute = config.get(CONF_ATTRIBUTE)
+        self.listeners: list[_StateMatchListener] = []
+        self._unsub = async_track_state_change_event(
+            hass, entity_id, self._async_state_changed
+        )
 
     @callback
-    def state_automation_listener(event: Event[EventStateChangedData]) -> None:
-        """Listen for state changes and calls action."""
-        entity = event.data["entity_id"]
+    def async_shutdown(self) -> None:
+        """Stop listening for state changes."""
+        self._unsub()
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Match a state change and pass it on to the listeners."""
+        attribute = self._attribute
         from_s = event.data["old_state"]
         to_s = event.data["new_state"]
 
@@ -159,12 +191,92 @@ async def async_attach_trigger(
             return
 
         if (
-            not match_from_state(old_value)
-            or not match_to_state(new_value)
-            or (not match_all and old_value == new_value)
+            not self._match_from_state(old_value)
+            or not self._match_to_state(new_value)
+            or (not self._match_all and old_value == new_value)
         ):
             return
 
+        for listener in self.listeners.copy():
+            try:
+                listener(event, old_value, new_value)
+            except Exception:
+                _LOGGER.exception(
+                    "Error while dispatching state change of %s to %s",
+                    event.data["entity_id"],
+                    listener,
+                )
+
+
+@callback
+def _async_track_state_match(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    config: ConfigType,
+    listener: _StateMatchListener,
+) -> CALLBACK_TYPE:
+    """Call listener with state changes of entity_ids matching the config."""
+    matchers = hass.data.setdefault(DATA_STATE_MATCHERS, {})
+    predicate: Hashable = tuple(
+        (key, _hashable_match(config[key]))
+        for key in (CONF_ATTRIBUTE, CONF_FROM, CONF_NOT_FROM, CONF_NOT_TO, CONF_TO)
+        if key in config
+    )
+    try:
+        hash(predicate)
+    except TypeError:
+        # Not shared with other triggers
+        predicate = object()
+
+    keys = [(entity_id, predicate) for entity_id in entity_ids]
+    for key in keys:
+        if (matcher := matchers.get(key)) is None:
+            matcher = matchers[key] = _SharedStateMatcher(hass, key[0], config)
+        matcher.listeners.append(listener)
+
+    @callback
+    def async_remove() -> None:
+        """Remove the listener from the matchers."""
+        for key in keys:
+            matcher = matchers[key]
+            matcher.listeners.remove(listener)
+            if not matcher.listeners:
+                matcher.async_shutdown()
+                del matchers[key]
+
+    return async_remove
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+    *,
+    platform_type: str = "state",
+) -> CALLBACK_TYPE:
+    """Listen for state changes based on configuration."""
+    entity_ids = config[CONF_ENTITY_ID]
+    if isinstance(entity_ids, str):
+        entity_ids = [entity_ids]
+    time_delta = config.get(CONF_FOR)
+    unsub_track_same: dict[str, Callable[[], None]] = {}
+    period: dict[str, timedelta] = {}
+    attribute = config.get(CONF_ATTRIBUTE)
+    job = HassJob(action, f"state trigger {trigger_info}")
+
+    trigger_data = trigger_info["trigger_data"]
+    _variables = trigger_info["variables"] or {}
+
+    @callback
+    def state_automation_listener(
+        event: Event[EventStateChangedData], old_value: object, new_value: object
+    ) -> None:
+        """Listen for matching state changes and calls action."""
+        entity = event.data["entity_id"]
+        from_s = event.data["old_state"]
+        to_s = event.data["new_state"]
+
         @callback
         def call_action() -> None:
             """Call action with right context."""
@@ -232,7 +344,9 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    unsub = _async_track_state_match(
+        hass, entity_ids, config, state_automation_listener
+    )
 
     @callback
     def async_remove() -> None:
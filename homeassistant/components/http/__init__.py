@@ -147,12 +147,8 @@ class StaticPathConfig:
     url_path: str
     path: str
     cache_headers: bool = True
-
-
-_STATIC_CLASSES = {
-    True: CachingStaticResource,
-    False: web.StaticResource,
-}
+    # Serve small hashed files from memory, for paths not changed at runtime
+    memory_cache: bool = False
 
 
 class ConfData(TypedDict, total=False):
@@ -461,8 +457,12 @@ class HomeAssistantHTTP:
     ) -> dict[str, CachingStaticResource | web.StaticResource | None]:
         """Create a list of static resources."""
         return {
-            config.url_path: _STATIC_CLASSES[config.cache_headers](
-                config.url_path, config.path
+            config.url_path: (
+                CachingStaticResource(
+                    config.url_path, config.path, memory_cache=config.memory_cache
+                )
+                if config.cache_headers
+                else web.StaticResource(config.url_path, config.path)
             )
             if os.path.isdir(config.path)
             else None
@@ -2,13 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Mapping
+from contextlib import suppress
+import os
 from pathlib import Path
-from typing import Final
+import re
+from stat import S_ISREG
+from typing import Any, Final
 
-from aiohttp.hdrs import CACHE_CONTROL, CONTENT_TYPE
-from aiohttp.web import FileResponse, Request, StreamResponse
-from aiohttp.web_fileresponse import CONTENT_TYPES, FALLBACK_CONTENT_TYPE
+from aiohttp.hdrs import (
+    ACCEPT_ENCODING,
+    ACCEPT_RANGES,
+    CACHE_CONTROL,
+    CONTENT_ENCODING,
+    CONTENT_TYPE,
+    IF_MATCH,
+    IF_RANGE,
+    IF_UNMODIFIED_SINCE,
+    RANGE,
+    VARY,
+)
+from aiohttp.helpers import ETAG_ANY
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
+from aiohttp.web_exceptions import HTTPNotModified
+from aiohttp.web_fileresponse import (
+    CONTENT_TYPES,
+    ENCODING_EXTENSIONS,
+    FALLBACK_CONTENT_TYPE,
+)
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU
 
@@ -17,10 +39,78 @@ CACHE_HEADER = f"public, max-age={CACHE_TIME}"
 CACHE_HEADERS: Mapping[str, str] = {CACHE_CONTROL: CACHE_HEADER}
 RESPONSE_CACHE: LRU[tuple[str, Path], tuple[Path, str]] = LRU(512)
 
+# Files with a content hash in their name never change, so small ones of
+# resources with memory_cache are kept in memory and served without touching
+# the disk.
+HASHED_NAME = re.compile(r"\.[0-9a-f]{8,}\.\w+$")
+MEMORY_CACHE_MAX_FILE_SIZE: Final = 128 * 1024
+MEMORY_CACHE: LRU[tuple[Path, tuple[str, ...]], _CachedFile | None] = LRU(256)
+
+# Conditional and range requests are left to FileResponse
+_FILE_RESPONSE_HEADERS = (RANGE, IF_MATCH, IF_UNMODIFIED_SINCE, IF_RANGE)
+
+
+class _CachedFile:
+    """Contents of a small static file variant kept in memory."""
+
+    __slots__ = ("body", "encoding", "etag", "last_modified")
+
+    def __init__(
+        self, body: bytes, encoding: str | None, etag: str, last_modified: float
+    ) -> None:
+        """Initialize the cached file."""
+        self.body = body
+        self.encoding = encoding
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+def _read_small_file(file_path: Path, encodings: tuple[str, ...]) -> _CachedFile | None:
+    """Read the best variant of a file if it is small enough to keep in memory.
+
+    Mirrors the variant selection of FileResponse. Returns None if the file
+    should be served from disk.
+    """
+    for file_extension, file_encoding in ENCODING_EXTENSIONS.items():
+        if file_encoding not in encodings:
+            continue
+        compressed_path = file_path.with_suffix(file_path.suffix + file_extension)
+        with suppress(OSError):
+            if S_ISREG(compressed_path.lstat().st_mode):
+                return _read_file_variant(compressed_path, file_encoding)
+
+    return _read_file_variant(file_path, None)
+
+
+def _read_file_variant(file_path: Path, encoding: str | None) -> _CachedFile | None:
+    """Read a file variant if it is small enough to keep in memory."""
+    try:
+        with file_path.open("rb") as file:
+            st = os.fstat(file.fileno())
+            if not S_ISREG(st.st_mode) or st.st_size > MEMORY_CACHE_MAX_FILE_SIZE:
+                return None
+            body = file.read()
+    except OSError:
+        return None
+
+    return _CachedFile(
+        body, encoding, f"{st.st_mtime_ns:x}-{st.st_size:x}", st.st_mtime
+    )
+
 
 class CachingStaticResource(StaticResource):
     """Static Resource handler that will add cache headers."""
 
+    def __init__(self, *args: Any, memory_cache: bool = False, **kwargs: Any) -> None:
+        """Initialize the resource.
+
+        With memory_cache, small hashed files are served from memory. Only
+        use it for directories which are not changed at runtime, as a file
+        with a hash like name, such as a date, may still be overwritten.
+        """
+        super().__init__(*args, **kwargs)
+        self._memory_cache = memory_cache
+
     async def _handle(self, request: Request) -> StreamResponse:
         """Wrap base handler to cache file path resolution and content type guess."""
         rel_url = request.match_info["filename"]
@@ -29,7 +119,18 @@ class CachingStaticResource(StaticResource):
 
         if key in RESPONSE_CACHE:
             file_path, content_type = RESPONSE_CACHE[key]
-            response = FileResponse(file_path, chunk_size=self._chunk_size)
+            if (
+                self._memory_cache
+                and HASHED_NAME.search(file_path.name)
+                and not any(
+                    header in request.headers for header in _FILE_RESPONSE_HEADERS
+                )
+            ):
+                response = await self._async_memory_response(
+                    request, file_path
+                ) or FileResponse(file_path, chunk_size=self._chunk_size)
+            else:
+                response = FileResponse(file_path, chunk_size=self._chunk_size)
             response.headers[CONTENT_TYPE] = content_type
         else:
             response = await super()._handle(request)
@@ -46,3 +147,50 @@ class CachingStaticResource(StaticResource):
 
         response.headers[CACHE_CONTROL] = CACHE_HEADER
         return response
+
+    async def _async_memory_response(
+        self, request: Request, file_path: Path
+    ) -> Response | None:
+        """Serve a small hashed file from memory, or None to serve it from disk."""
+        # Encoding comparisons should be case-insensitive
+        accept_encoding = request.headers.get(ACCEPT_ENCODING, "").lower()
+        encodings = tuple(
+            encoding
+            for encoding in ENCODING_EXTENSIONS.values()
+            if encoding in accept_encoding
+        )
+        cache_key = (file_path, encodings)
+        if cache_key in MEMORY_CACHE:
+            cached = MEMORY_CACHE[cache_key]
+        else:
+            cached = await asyncio.get_running_loop().run_in_executor(
+                None, _read_small_file, file_path, encodings
+            )
+            MEMORY_CACHE[cache_key] = cached
+
+        if cached is None:
+            return None
+
+        response: Response
+        if_none_match = request.if_none_match
+        if_modified_since = request.if_modified_since
+        if (
+            if_none_match is not None
+            and any(etag.value in (cached.etag, ETAG_ANY) for etag in if_none_match)
+        ) or (
+            if_none_match is None
+            and if_modified_since is not None
+            and cached.last_modified <= if_modified_since.timestamp()
+        ):
+            response = Response(status=HTTPNotModified.status_code)
+        else:
+            response = Response(body=cached.body)
+            response.headers[ACCEPT_RANGES] = "bytes"
+            if cached.encoding:
+                response.headers[CONTENT_ENCODING] = cached.encoding
+
+        if cached.encoding:
+            response.headers[VARY] = ACCEPT_ENCODING
+        response.etag = cached.etag  # type: ignore[assignment]
+        response.last_modified = cached.last_modified  # type: ignore[assignment]
+        return response
@@ -73,7 +73,9 @@ class MQTTDiscoveryPayload(dict[str, Any]):
 
 def clear_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
     """Clear entry from already discovered list."""
-    hass.data[DATA_MQTT].discovery_already_discovered.discard(discovery_hash)
+    mqtt_data = hass.data[DATA_MQTT]
+    mqtt_data.discovery_already_discovered.discard(discovery_hash)
+    mqtt_data.discovery_payloads.pop(discovery_hash, None)
 
 
 def set_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
@@ -239,6 +241,24 @@ async def async_start(  # noqa: C901
 
         component, node_id, object_id = match.groups()
 
+        # If present, the node_id will be included in the discovered object id
+        discovery_id = f"{node_id} {object_id}" if node_id else object_id
+        discovery_hash = (component, discovery_id)
+
+        if (
+            payload
+            and mqtt_data.discovery_payloads.get(discovery_hash) == payload
+            and discovery_hash in mqtt_data.discovery_already_discovered
+            and discovery_hash not in mqtt_data.discovery_pending_discovered
+        ):
+            # Re-published unchanged config, skip parsing and validating it
+            _LOGGER.debug(
+                "Ignoring unchanged discovery payload for: %s %s",
+                component,
+                discovery_id,
+            )
+            return
+
         if payload:
             try:
                 discovery_payload = MQTTDiscoveryPayload(json_loads_object(payload))
@@ -253,11 +273,8 @@ async def async_start(  # noqa: C901
         else:
             discovery_payload = MQTTDiscoveryPayload({})
 
-        # If present, the node_id will be included in the discovered object id
-        discovery_id = f"{node_id} {object_id}" if node_id else object_id
-        discovery_hash = (component, discovery_id)
-
         if discovery_payload:
+            mqtt_data.discovery_payloads[discovery_hash] = payload
             # Attach MQTT topic to the payload, used for debug prints
             setattr(
                 discovery_payload,
@@ -272,6 +289,8 @@ async def async_start(  # noqa: C901
             setattr(discovery_payload, "discovery_data", discovery_data)
 
             discovery_payload[CONF_PLATFORM] = "mqtt"
+        else:
+            mqtt_data.discovery_payloads.pop(discovery_hash, None)
 
         if discovery_hash in mqtt_data.discovery_pending_discovered:
             pending = mqtt_data.discovery_pending_discovered[discovery_hash]["pending"]
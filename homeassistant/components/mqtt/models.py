@@ -18,12 +18,14 @@ from homeassistant.helpers import template
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.service_info.mqtt import ReceivePayloadType
 from homeassistant.helpers.typing import (
+    UNDEFINED,
     ConfigType,
     DiscoveryInfoType,
     TemplateVarsType,
     VolSchemaType,
 )
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 if TYPE_CHECKING:
     from paho.mqtt.client import MQTTMessage
@@ -254,6 +256,32 @@ class MqttValueTemplateException(TemplateError):
         return self._message
 
 
+class PayloadJson:
+    """Share the JSON parsed from a received payload between value templates.
+
+    The client passes the same payload object to all subscribers of a
+    message, so the payload is only parsed again when it is another object.
+    """
+
+    __slots__ = ("_payload", "_value_json")
+
+    def __init__(self) -> None:
+        """Initialize the shared payload JSON."""
+        self._payload: ReceivePayloadType | None = None
+        self._value_json: Any = UNDEFINED
+
+    @callback
+    def async_get(self, payload: ReceivePayloadType) -> Any:
+        """Return the JSON of the payload, or UNDEFINED if it is not valid JSON."""
+        if payload is not self._payload:
+            self._payload = payload
+            try:
+                self._value_json = json_loads(payload)
+            except JSON_DECODE_EXCEPTIONS:
+                self._value_json = UNDEFINED
+        return self._value_json
+
+
 class MqttValueTemplate:
     """Class for rendering MQTT value template with possible json values."""
 
@@ -300,6 +328,19 @@ class MqttValueTemplate:
                 )
             values[ATTR_THIS] = self._template_state
 
+        render = self._value_template.async_render_with_possible_json_value
+        if (
+            not self._value_template.is_static
+            and (hass := self._value_template.hass) is not None
+            and (mqtt_data := hass.data.get(DATA_MQTT)) is not None
+        ):
+            # Share the JSON parsed from the payload with the other subscribers
+            if (
+                value_json := mqtt_data.payload_json.async_get(payload)
+            ) is not UNDEFINED:
+                values["value_json"] = value_json
+            render = self._value_template.async_render_with_value
+
         if default is PayloadSentinel.NONE:
             _LOGGER.debug(
                 "Rendering incoming payload '%s' with variables %s and %s",
@@ -308,11 +349,7 @@ class MqttValueTemplate:
                 self._value_template,
             )
             try:
-                rendered_payload = (
-                    self._value_template.async_render_with_possible_json_value(
-                        payload, variables=values
-                    )
-                )
+                rendered_payload = render(payload, variables=values)
             except TEMPLATE_ERRORS as exc:
                 raise MqttValueTemplateException(
                     base_exception=exc,
@@ -334,11 +371,7 @@ class MqttValueTemplate:
             self._value_template,
         )
         try:
-            rendered_payload = (
-                self._value_template.async_render_with_possible_json_value(
-                    payload, default, variables=values
-                )
-            )
+            rendered_payload = render(payload, default, variables=values)
         except TEMPLATE_ERRORS as exc:
             raise MqttValueTemplateException(
                 base_exception=exc,
@@ -392,6 +425,9 @@ class MqttData:
     device_triggers: dict[str, Trigger] = field(default_factory=dict)
     data_config_flow_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     discovery_already_discovered: set[tuple[str, str]] = field(default_factory=set)
+    discovery_payloads: dict[tuple[str, str], ReceivePayloadType] = field(
+        default_factory=dict
+    )
     discovery_pending_discovered: dict[tuple[str, str], PendingDiscovered] = field(
         default_factory=dict
     )
@@ -401,6 +437,7 @@ class MqttData:
     discovery_unsubscribe: list[CALLBACK_TYPE] = field(default_factory=list)
     integration_unsubscribe: dict[str, CALLBACK_TYPE] = field(default_factory=dict)
     last_discovery: float = 0.0
+    payload_json: PayloadJson = field(default_factory=PayloadJson)
     platforms_loaded: set[Platform | str] = field(default_factory=set)
     reload_dispatchers: list[CALLBACK_TYPE] = field(default_factory=list)
     reload_handlers: dict[str, CALLBACK_TYPE] = field(default_factory=dict)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections import deque
+from collections import Counter, deque
 from collections.abc import Callable, Coroutine, Iterable
 from dataclasses import dataclass, field
 import datetime
@@ -23,6 +23,7 @@ from .const import (
     ATTR_STREAMS,
     DOMAIN,
     SEGMENT_DURATION_ADJUSTER,
+    SEGMENT_MEMORY_LIMIT,
     TARGET_SEGMENT_DURATION_NON_LL_HLS,
 )
 
@@ -77,8 +78,8 @@ class Part:
 
     duration: float
     has_keyframe: bool
-    # video data (moof+mdat)
-    data: bytes
+    # video data (moof+mdat), a view into the Segment data once complete
+    data: bytes | memoryview
 
 
 @dataclass(slots=True)
@@ -102,6 +103,8 @@ class Segment:
     hls_num_parts_rendered: int = 0
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = False
+    # Data for all parts, joined once when the last part is added
+    _data: bytes | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Run after init."""
@@ -121,6 +124,8 @@ class Segment:
     @property
     def data_size(self) -> int:
         """Return the size of all part data without init in bytes."""
+        if self._data is not None:
+            return len(self._data)
         return sum(len(part.data) for part in self.parts)
 
     @callback
@@ -135,11 +140,29 @@ class Segment:
         """
         self.parts.append(part)
         self.duration = duration
+        if duration:
+            self._join_parts()
         for output in self._stream_outputs:
             output.part_put()
 
+    def _join_parts(self) -> None:
+        """Join the part data into one buffer that the parts become views of.
+
+        The segment is then held in memory once and served for every
+        segment and part request without copying.
+        """
+        data = self._data = b"".join([part.data for part in self.parts])
+        view = memoryview(data)
+        start = 0
+        for part in self.parts:
+            end = start + len(part.data)
+            part.data = view[start:end]
+            start = end
+
     def get_data(self) -> bytes:
         """Return reconstructed data for all parts as bytes, without init."""
+        if self._data is not None:
+            return self._data
         return b"".join([part.data for part in self.parts])
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
@@ -268,9 +291,50 @@ class IdleTimer:
         self._hass.async_create_task(self._callback())
 
 
+@callback
+def async_trim_segments(hass: HomeAssistant) -> None:
+    """Drop the oldest segments of outputs when over the memory limit.
+
+    The limit is shared by all streams. Only outputs with a minimum number
+    of segments to keep are trimmed, oldest segments first, so this is a
+    best effort: the segments of the playlists and of recorders are always
+    kept, even if they exceed the limit. A segment held by several outputs
+    is only freed once none of them holds it.
+    """
+    outputs = [
+        output
+        for stream in hass.data[DOMAIN][ATTR_STREAMS]
+        for output in stream.outputs().values()
+    ]
+    holders: Counter[int] = Counter()
+    total = 0
+    for output in outputs:
+        for segment in output.get_segments():
+            if not holders[id(segment)]:
+                total += segment.data_size
+            holders[id(segment)] += 1
+    while total > SEGMENT_MEMORY_LIMIT and (
+        trimmable := [
+            output
+            for output in outputs
+            if output.min_segments is not None
+            and len(output.get_segments()) > output.min_segments
+        ]
+    ):
+        output = min(trimmable, key=lambda output: output.get_segments()[0].start_time)
+        segment = output.get_segments().popleft()
+        holders[id(segment)] -= 1
+        if not holders[id(segment)]:
+            total -= segment.data_size
+
+
 class StreamOutput:
     """Represents a stream output."""
 
+    # Number of segments to keep when trimming segments to stay within
+    # SEGMENT_MEMORY_LIMIT, or None if the output's segments are never trimmed
+    min_segments: int | None = None
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -359,6 +423,7 @@ class StreamOutput:
         # Start idle timeout when we start receiving data
         self.idle_timer.start()
         self._segments.append(segment)
+        async_trim_segments(self._hass)
         self._event.set()
         self._event.clear()
 
@@ -422,7 +487,7 @@ class KeyFrameConverter:
     An overview of the thread and state interaction:
         the worker thread sets a packet
         get_image is called from the main asyncio loop
-        get_image schedules _generate_image in an executor thread
+        get_image schedules _generate_image in an executor thread if there is a packet
         _generate_image will try to create an image from the packet
         _generate_image will clear the packet, so there will only be one attempt per packet
     If successful, self._image will be updated and returned by get_image
@@ -514,14 +579,31 @@ class KeyFrameConverter:
             return
         if frames:
             frame = frames[0]
+            orientation = self._dynamic_stream_settings.orientation
             if width and height:
-                if self._dynamic_stream_settings.orientation >= 5:
+                if orientation >= 5:
                     frame = frame.reformat(width=height, height=width)
                 else:
                     frame = frame.reformat(width=width, height=height)
+            if (
+                orientation == Orientation.NO_TRANSFORM
+                and not frame.width % 8
+                and not frame.height % 2
+            ):
+                # Encode straight from the decoded planes to skip the
+                # conversion to a BGR array, which costs more than the encode.
+                # TurboJPEG expects plane rows padded to 4 bytes, while the
+                # planes are packed, so the half width chroma rows must
+                # already be a multiple of 4 bytes.
+                frame = frame.reformat(format="yuv420p")
+                self._image = bytes(
+                    self._turbojpeg.encode_from_yuv(
+                        frame.to_ndarray(), frame.height, frame.width
+                    )
+                )
+                return
             bgr_array = self.transform_image(
-                frame.to_ndarray(format="bgr24"),
-                self._dynamic_stream_settings.orientation,
+                frame.to_ndarray(format="bgr24"), orientation
             )
             self._image = bytes(self._turbojpeg.encode(bgr_array))
 
@@ -538,5 +620,10 @@ class KeyFrameConverter:
             self._event.clear()
             await self._event.wait()
         async with self._lock:
-            await self._hass.async_add_executor_job(self._generate_image, width, height)
+            # Requests that arrive before the next keyframe share the image
+            # generated from the previous one without a trip to the executor
+            if self._packet is not None:
+                await self._hass.async_add_executor_job(
+                    self._generate_image, width, height
+                )
         return self._image
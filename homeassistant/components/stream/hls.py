@@ -48,6 +48,9 @@ def async_setup_hls(hass: HomeAssistant) -> str:
 class HlsStreamOutput(StreamOutput):
     """Represents HLS Output formats."""
 
+    # The playlist also lists the segment in progress
+    min_segments = NUM_PLAYLIST_SEGMENTS + 1
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -88,12 +88,13 @@ class RecorderOutput(StreamOutput):
                 return
             last_sequence = segment.sequence
 
-            # Open segment
-            source = av.open(
-                BytesIO(segment.init + segment.get_data()),
-                "r",
-                format=SEGMENT_CONTAINER_FORMAT,
-            )
+            # Open segment, the init and the data are written to one buffer
+            # instead of being concatenated into a new bytes object first
+            segment_data = BytesIO()
+            segment_data.write(segment.init)
+            segment_data.write(segment.get_data())
+            segment_data.seek(0)
+            source = av.open(segment_data, "r", format=SEGMENT_CONTAINER_FORMAT)
             # Skip this segment if it doesn't have data
             if source.duration is None:
                 source.close()
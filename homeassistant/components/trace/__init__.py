@@ -10,7 +10,6 @@ from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Event, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 
@@ -18,10 +17,12 @@ from . import websocket_api
 from .const import (
     CONF_STORED_TRACES,
     DATA_TRACE,
+    DATA_TRACE_MEMORY_BUDGET,
     DATA_TRACE_STORE,
     DEFAULT_STORED_TRACES,
+    TRACE_MEMORY_LIMIT,
 )
-from .models import ActionTrace
+from .models import ActionTrace, TraceMemoryBudget
 from .util import async_store_trace
 
 _LOGGER = logging.getLogger(__name__)
@@ -48,10 +49,11 @@ __all__ = [
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the trace integration."""
     hass.data[DATA_TRACE] = {}
-    websocket_api.async_setup(hass)
-    store = Store[dict[str, list]](
-        hass, STORAGE_VERSION, STORAGE_KEY, encoder=ExtendedJSONEncoder
+    hass.data[DATA_TRACE_MEMORY_BUDGET] = TraceMemoryBudget(
+        hass.data[DATA_TRACE], TRACE_MEMORY_LIMIT
     )
+    websocket_api.async_setup(hass)
+    store = Store[dict[str, list]](hass, STORAGE_VERSION, STORAGE_KEY)
     hass.data[DATA_TRACE_STORE] = store
 
     async def _async_store_traces_at_stop(_: Event) -> None:
@@ -60,7 +62,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         try:
             await store.async_save(
                 {
-                    key: list(traces.values())
+                    key: [trace.as_json_fragment() for trace in traces.values()]
                     for key, traces in hass.data[DATA_TRACE].items()
                 }
             )
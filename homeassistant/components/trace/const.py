@@ -9,11 +9,13 @@ from homeassistant.util.hass_dict import HassKey
 if TYPE_CHECKING:
     from homeassistant.helpers.storage import Store
 
-    from .models import TraceData
+    from .models import TraceData, TraceMemoryBudget
 
 
 CONF_STORED_TRACES = "stored_traces"
 DATA_TRACE: HassKey[TraceData] = HassKey("trace")
 DATA_TRACE_STORE: HassKey[Store[dict[str, list]]] = HassKey("trace_store")
 DATA_TRACES_RESTORED: HassKey[bool] = HassKey("trace_traces_restored")
+DATA_TRACE_MEMORY_BUDGET: HassKey[TraceMemoryBudget] = HassKey("trace_memory_budget")
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+TRACE_MEMORY_LIMIT = 64 * 1024 * 1024  # Bytes of finished traces of all items
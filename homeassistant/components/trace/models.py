@@ -5,9 +5,17 @@ from __future__ import annotations
 import abc
 from collections import deque
 import datetime as dt
-from typing import Any
+import json
+from typing import Any, cast
+
+import orjson
 
 from homeassistant.core import Context
+from homeassistant.helpers.json import (
+    ExtendedJSONEncoder,
+    json_encoder_default,
+    json_fragment,
+)
 from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_get,
@@ -16,12 +24,70 @@ from homeassistant.helpers.trace import (
     trace_set_child_id,
 )
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads_object
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 import homeassistant.util.uuid as uuid_util
 
 type TraceData = dict[str, LimitedSizeDict[str, BaseTrace]]
 
 
+def _trace_json_default(obj: Any) -> Any:
+    """Convert objects orjson can't serialize, falling back to their repr."""
+    try:
+        return json_encoder_default(obj)
+    except TypeError:
+        return ExtendedJSONEncoder().default(obj)
+
+
+def trace_json_bytes(data: Any) -> bytes:
+    """Serialize trace data to JSON bytes."""
+    try:
+        return orjson.dumps(
+            data, option=orjson.OPT_NON_STR_KEYS, default=_trace_json_default
+        )
+    except TypeError:
+        return json.dumps(data, cls=ExtendedJSONEncoder).encode()
+
+
+class TraceMemoryBudget:
+    """Limit the memory used by the finished traces of all scripts and automations.
+
+    Finished traces are kept as JSON bytes. When their total size exceeds the
+    limit, the oldest traces are dropped, regardless of their key.
+    """
+
+    def __init__(self, traces: TraceData, limit: int) -> None:
+        """Initialize the budget."""
+        self.limit = limit
+        self.size = 0
+        self._traces = traces
+        self._sizes: dict[tuple[str, str], int] = {}
+
+    def async_add(self, trace: BaseTrace, size: int) -> None:
+        """Account for a finished trace and drop old traces if needed."""
+        self._sizes[(trace.key, trace.run_id)] = size
+        self.size += size
+        if self.size > self.limit:
+            self._async_evict()
+
+    def _async_evict(self) -> None:
+        """Drop the oldest traces until the size is within the limit."""
+        traces = self._traces
+        sizes = self._sizes
+        # Forget traces already dropped because of the stored_traces limit
+        for key, run_id in [
+            (key, run_id)
+            for key, run_id in sizes
+            if key not in traces or run_id not in traces[key]
+        ]:
+            self.size -= sizes.pop((key, run_id))
+        # The newest trace is always kept
+        while self.size > self.limit and len(sizes) > 1:
+            key, run_id = next(iter(sizes))
+            self.size -= sizes.pop((key, run_id))
+            traces[key].pop(run_id, None)
+
+
 class BaseTrace(abc.ABC):
     """Base container for a script or automation trace."""
 
@@ -36,6 +102,10 @@ class BaseTrace(abc.ABC):
             "short_dict": self.as_short_dict(),
         }
 
+    def as_json_fragment(self) -> json_fragment:
+        """Return a JSON fragment of this trace for saving."""
+        return json_fragment(trace_json_bytes(self.as_dict()))
+
     @abc.abstractmethod
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this ActionTrace."""
@@ -71,6 +141,8 @@ class ActionTrace(BaseTrace):
         self.key = f"{self._domain}.{item_id}"
         self._dict: dict[str, Any] | None = None
         self._short_dict: dict[str, Any] | None = None
+        self._json: bytes | None = None
+        self.memory_budget: TraceMemoryBudget | None = None
         if trace_id_get():
             trace_set_child_id(self.key, self.run_id)
         trace_id_set((self.key, self.run_id))
@@ -88,13 +160,56 @@ class ActionTrace(BaseTrace):
         self._timestamp_finish = dt_util.utcnow()
         self._state = "stopped"
         self._script_execution = script_execution_get()
+        self._compact()
+
+    def _compact(self) -> None:
+        """Keep the finished trace as JSON and drop its trace elements.
+
+        The extended dictionary is only rebuilt when the trace is requested.
+        """
+        self._json = trace_json_bytes(
+            {
+                "extended_dict": self._as_extended_dict(),
+                "short_dict": self._as_short_dict(),
+            }
+        )
+        self._trace = None
+        self._config = None
+        self._blueprint_inputs = None
+        self._dict = None
+        if self.memory_budget is not None:
+            self.memory_budget.async_add(self, len(self._json))
+
+    def _with_error(self, result: dict[str, Any]) -> dict[str, Any]:
+        """Add the error to a dictionary version of this ActionTrace.
+
+        The error is converted to a string when requested, since its message
+        may be translated.
+        """
+        if self._error is None:
+            return result
+        return {**result, "error": str(self._error)}
+
+    def as_json_fragment(self) -> json_fragment:
+        """Return a JSON fragment of this trace for saving."""
+        if self._json is not None and self._error is None:
+            return json_fragment(self._json)
+        return super().as_json_fragment()
 
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this ActionTrace."""
+        if self._json is not None:
+            return self._with_error(
+                cast(dict[str, Any], json_loads_object(self._json)["extended_dict"])
+            )
+        return self._with_error(self._as_extended_dict())
+
+    def _as_extended_dict(self) -> dict[str, Any]:
+        """Return an extended dictionary version of this ActionTrace without error."""
         if self._dict:
             return self._dict
 
-        result = dict(self.as_short_dict())
+        result = dict(self._as_short_dict())
 
         traces = {}
         if self._trace:
@@ -117,6 +232,10 @@ class ActionTrace(BaseTrace):
 
     def as_short_dict(self) -> dict[str, Any]:
         """Return a brief dictionary version of this ActionTrace."""
+        return self._with_error(self._as_short_dict())
+
+    def _as_short_dict(self) -> dict[str, Any]:
+        """Return a brief dictionary version of this ActionTrace without error."""
         if self._short_dict:
             return self._short_dict
 
@@ -138,8 +257,6 @@ class ActionTrace(BaseTrace):
             "domain": domain,
             "item_id": item_id,
         }
-        if self._error is not None:
-            result["error"] = str(self._error)
 
         if self._state == "stopped":
             # Execution has stopped, save the result
@@ -10,7 +10,12 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 
-from .const import DATA_TRACE, DATA_TRACE_STORE, DATA_TRACES_RESTORED
+from .const import (
+    DATA_TRACE,
+    DATA_TRACE_MEMORY_BUDGET,
+    DATA_TRACE_STORE,
+    DATA_TRACES_RESTORED,
+)
 from .models import ActionTrace, BaseTrace, RestoredTrace, TraceData
 
 _LOGGER = logging.getLogger(__name__)
@@ -89,6 +94,7 @@ def async_store_trace(
         else:
             traces[key].size_limit = stored_traces
         traces[key][trace.run_id] = trace
+        trace.memory_budget = hass.data.get(DATA_TRACE_MEMORY_BUDGET)
 
 
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Mapping
-from datetime import datetime
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterable, Mapping
 from functools import partial
 import hashlib
 from http import HTTPStatus
@@ -15,11 +15,12 @@ import os
 import re
 import subprocess
 import tempfile
+import time
 from typing import Any, Final, TypedDict, final
 
 from aiohttp import web
 import mutagen
-from mutagen.id3 import ID3, TextFrame as ID3Text
+from mutagen.id3 import ID3, TALB, TIT2, TPE1, TextFrame as ID3Text
 from propcache import cached_property
 import voluptuous as vol
 
@@ -40,11 +41,10 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import HassJob, HomeAssistant, ServiceCall, callback
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_component import EntityComponent
-from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.network import get_url
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import UNDEFINED, ConfigType
@@ -64,6 +64,8 @@ from .const import (
     DEFAULT_CACHE_DIR,
     DEFAULT_TIME_MEMORY,
     DOMAIN,
+    MEM_CACHE_MAX_SIZE,
+    TtsAudioStreamType,
     TtsAudioType,
 )
 from .helper import get_engine_instance
@@ -87,6 +89,7 @@ __all__ = [
     "PLATFORM_SCHEMA",
     "SampleFormat",
     "Provider",
+    "TtsAudioStreamType",
     "TtsAudioType",
     "Voice",
 ]
@@ -130,7 +133,146 @@ class TTSCache(TypedDict):
 
     filename: str
     voice: bytes
-    pending: asyncio.Task | None
+    pending: asyncio.Task[bytes] | None
+    stream: _AudioStream | None
+
+
+class _TTSMemoryCache:
+    """Least recently used TTS audio, bounded by size in bytes.
+
+    Entries not used for time_memory seconds are dropped as well. Entries
+    that are still being synthesized are never dropped.
+    """
+
+    __slots__ = (
+        "_entries",
+        "_last_used",
+        "_max_size",
+        "_time_memory",
+        "hits",
+        "misses",
+        "size",
+    )
+
+    def __init__(self, max_size: int, time_memory: int) -> None:
+        """Initialize the memory cache."""
+        self._entries: OrderedDict[str, TTSCache] = OrderedDict()
+        self._last_used: dict[str, float] = {}
+        self._max_size = max_size
+        self._time_memory = time_memory
+        self.hits = 0
+        self.misses = 0
+        self.size = 0
+
+    @callback
+    def async_get(self, cache_key: str) -> TTSCache | None:
+        """Return an entry and mark it as recently used."""
+        self._async_evict()
+        if (cached := self._entries.get(cache_key)) is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(cache_key)
+        self._last_used[cache_key] = time.monotonic()
+        return cached
+
+    @callback
+    def async_peek(self, cache_key: str) -> TTSCache | None:
+        """Return an entry without marking it as used."""
+        return self._entries.get(cache_key)
+
+    @callback
+    def async_set(self, cache_key: str, cached: TTSCache) -> None:
+        """Store an entry and drop the least recently used ones over the limit."""
+        self.async_pop(cache_key)
+        self._entries[cache_key] = cached
+        self._last_used[cache_key] = time.monotonic()
+        self.size += len(cached["voice"])
+        self._async_evict()
+
+    @callback
+    def async_pop(self, cache_key: str) -> None:
+        """Remove an entry."""
+        if (cached := self._entries.pop(cache_key, None)) is not None:
+            del self._last_used[cache_key]
+            self.size -= len(cached["voice"])
+
+    @callback
+    def async_clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._last_used.clear()
+        self.size = 0
+
+    @callback
+    def _async_evict(self) -> None:
+        """Drop idle entries and the least recently used ones over the limit."""
+        expired = time.monotonic() - self._time_memory
+        # Entries are ordered by last use, the most recent one is always kept
+        for cache_key in list(self._entries)[:-1]:
+            if self.size <= self._max_size and self._last_used[cache_key] > expired:
+                break
+            if self._entries[cache_key]["pending"] is None:
+                self.async_pop(cache_key)
+
+
+class _AudioStream:
+    """Audio chunks of a message that is still being synthesized.
+
+    Chunks are kept so every reader gets the audio from the start,
+    no matter when it started reading.
+    """
+
+    __slots__ = ("chunks", "done", "error", "_event")
+
+    def __init__(self) -> None:
+        """Initialize the audio stream."""
+        self.chunks: list[bytes] = []
+        self.done = False
+        self.error: BaseException | None = None
+        self._event = asyncio.Event()
+
+    @callback
+    def async_add_chunk(self, chunk: bytes) -> None:
+        """Add a chunk and wake up the readers."""
+        self.chunks.append(chunk)
+        self._event.set()
+        self._event.clear()
+
+    @callback
+    def async_finish(self, error: BaseException | None = None) -> None:
+        """Mark the stream as complete and wake up the readers."""
+        self.done = True
+        self.error = error
+        self._event.set()
+
+    async def async_iter_chunks(self) -> AsyncGenerator[bytes]:
+        """Yield all chunks, waiting for new ones until the stream is done."""
+        index = 0
+        while True:
+            if index < len(self.chunks):
+                yield self.chunks[index]
+                index += 1
+            elif self.done:
+                if self.error is not None:
+                    raise HomeAssistantError(
+                        f"Audio stream failed: {self.error}"
+                    ) from self.error
+                return
+            else:
+                await self._event.wait()
+
+
+async def _async_single_chunk(data: bytes) -> AsyncGenerator[bytes]:
+    """Yield complete audio data as one chunk."""
+    yield data
+
+
+async def _async_read_voice(cached: TTSCache) -> bytes:
+    """Return the audio of a cache entry, waiting for pending synthesis."""
+    if pending := cached["pending"]:
+        return await pending
+    return cached["voice"]
 
 
 @callback
@@ -492,6 +634,17 @@ class TextToSpeechEntity(RestoreEntity, cached_properties=CACHED_PROPERTIES_WITH
             message=message, language=language, options=options
         )
 
+    @final
+    async def internal_async_stream_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> TtsAudioStreamType:
+        """Process an audio stream to TTS service as chunks."""
+        self.__last_tts_loaded = dt_util.utcnow().isoformat()
+        self.async_write_ha_state()
+        return await self.async_stream_tts_audio(
+            message=message, language=language, options=options
+        )
+
     def get_tts_audio(
         self, message: str, language: str, options: dict[str, Any]
     ) -> TtsAudioType:
@@ -509,6 +662,22 @@ class TextToSpeechEntity(RestoreEntity, cached_properties=CACHED_PROPERTIES_WITH
             partial(self.get_tts_audio, message, language, options=options)
         )
 
+    async def async_stream_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> TtsAudioStreamType:
+        """Load tts audio from the engine as a stream of chunks.
+
+        Return a tuple of file extension and an async iterable of audio
+        chunks. Engines that synthesize incrementally should override this,
+        by default the complete audio is returned as a single chunk.
+        """
+        extension, data = await self.async_get_tts_audio(
+            message=message, language=language, options=options
+        )
+        if data is None:
+            return extension, None
+        return extension, _async_single_chunk(data)
+
 
 def _hash_options(options: dict) -> str:
     """Hashes an options dictionary."""
@@ -538,27 +707,50 @@ class SpeechManager:
         self.cache_dir = cache_dir
         self.time_memory = time_memory
         self.file_cache: dict[str, str] = {}
-        self.mem_cache: dict[str, TTSCache] = {}
+        self.mem_cache = _TTSMemoryCache(MEM_CACHE_MAX_SIZE, time_memory)
+        self._file_cache_indexed: asyncio.Task[None] | None = None
 
-    def _init_cache(self) -> dict[str, str]:
-        """Init cache folder and fetch files."""
+    def _init_cache(self) -> str:
+        """Init cache folder."""
         try:
-            self.cache_dir = _init_tts_cache_dir(self.hass, self.cache_dir)
+            return _init_tts_cache_dir(self.hass, self.cache_dir)
         except OSError as err:
             raise HomeAssistantError(f"Can't init cache dir {err}") from err
 
+    async def async_init_cache(self) -> None:
+        """Init config folder and start indexing the file cache.
+
+        The file cache is only waited for when a voice is not in memory,
+        so a large cache folder does not delay the setup.
+        """
+        self.cache_dir = await self.hass.async_add_executor_job(self._init_cache)
+        self._file_cache_indexed = self.hass.async_create_task(
+            self._async_index_file_cache(), "tts index file cache"
+        )
+
+    async def _async_index_file_cache(self) -> None:
+        """Add the files of the cache folder to the file cache."""
         try:
-            return _get_cache_files(self.cache_dir)
+            files = await self.hass.async_add_executor_job(
+                _get_cache_files, self.cache_dir
+            )
         except OSError as err:
-            raise HomeAssistantError(f"Can't read cache dir {err}") from err
+            _LOGGER.error("Can't read cache dir %s", err)
+            return
+        # Keep files that were saved while indexing
+        self.file_cache = files | self.file_cache
 
-    async def async_init_cache(self) -> None:
-        """Init config folder and load file cache."""
-        self.file_cache.update(await self.hass.async_add_executor_job(self._init_cache))
+    async def _async_get_cache_file(self, cache_key: str) -> str | None:
+        """Return the file name of a voice in the file cache."""
+        if self._file_cache_indexed and not self._file_cache_indexed.done():
+            await self._file_cache_indexed
+        return self.file_cache.get(cache_key)
 
     async def async_clear_cache(self) -> None:
         """Read file cache and delete files."""
-        self.mem_cache = {}
+        self.mem_cache.async_clear()
+        if self._file_cache_indexed and not self._file_cache_indexed.done():
+            await self._file_cache_indexed
 
         def remove_files() -> None:
             """Remove files from filesystem."""
@@ -644,17 +836,18 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # Is speech already in memory
-        if cache_key in self.mem_cache:
-            filename = self.mem_cache[cache_key]["filename"]
+        if (cached := self.mem_cache.async_get(cache_key)) is not None:
+            filename = cached["filename"]
         # Is file store in file cache
-        elif use_cache and cache_key in self.file_cache:
-            filename = self.file_cache[cache_key]
+        elif use_cache and (cache_file := await self._async_get_cache_file(cache_key)):
+            filename = cache_file
             self.hass.async_create_task(self._async_file_to_mem(cache_key))
         # Load speech from engine into memory
         else:
-            filename = await self._async_get_tts_audio(
+            cached = await self._async_get_tts_audio(
                 engine_instance, cache_key, message, use_cache, language, options
             )
+            filename = cached["filename"]
 
         return f"/api/tts_proxy/{filename}"
 
@@ -675,20 +868,16 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # If we have the file, load it into memory if necessary
-        if cache_key not in self.mem_cache:
-            if use_cache and cache_key in self.file_cache:
-                await self._async_file_to_mem(cache_key)
+        if (cached := self.mem_cache.async_get(cache_key)) is None:
+            if use_cache and await self._async_get_cache_file(cache_key):
+                cached = await self._async_file_to_mem(cache_key)
             else:
-                await self._async_get_tts_audio(
+                cached = await self._async_get_tts_audio(
                     engine_instance, cache_key, message, use_cache, language, options
                 )
 
-        extension = os.path.splitext(self.mem_cache[cache_key]["filename"])[1][1:]
-        cached = self.mem_cache[cache_key]
-        if pending := cached.get("pending"):
-            await pending
-            cached = self.mem_cache[cache_key]
-        return extension, cached["voice"]
+        extension = os.path.splitext(cached["filename"])[1][1:]
+        return extension, await _async_read_voice(cached)
 
     @callback
     def _generate_cache_key(
@@ -713,8 +902,8 @@ class SpeechManager:
         cache: bool,
         language: str,
         options: dict[str, Any],
-    ) -> str:
-        """Receive TTS, store for view in cache and return filename.
+    ) -> TTSCache:
+        """Receive TTS, store for view in cache and return the cache entry.
 
         This method is a coroutine.
         """
@@ -758,25 +947,41 @@ class SpeechManager:
         if sample_bytes is not None:
             sample_bytes = int(sample_bytes)
 
-        async def get_tts_data() -> str:
+        async def get_tts_data() -> bytes:
             """Handle data available."""
             if engine_instance.name is None or engine_instance.name is UNDEFINED:
                 raise HomeAssistantError("TTS engine name is not set.")
 
+            audio_chunks: AsyncIterable[bytes] | None
             if isinstance(engine_instance, Provider):
                 extension, data = await engine_instance.async_get_tts_audio(
                     message, language, options
                 )
+                audio_chunks = None if data is None else _async_single_chunk(data)
             else:
-                extension, data = await engine_instance.internal_async_get_tts_audio(
+                (
+                    extension,
+                    audio_chunks,
+                ) = await engine_instance.internal_async_stream_tts_audio(
                     message, language, options
                 )
 
-            if data is None or extension is None:
+            if audio_chunks is None or extension is None:
                 raise HomeAssistantError(
                     f"No TTS from {engine_instance.name} for '{message}'"
                 )
 
+            # Create file infos
+            filename = f"{cache_key}.{final_extension}".lower()
+
+            # Validate filename
+            if not _RE_VOICE_FILE.match(filename) and not _RE_LEGACY_VOICE_FILE.match(
+                filename
+            ):
+                raise HomeAssistantError(
+                    f"TTS filename '{filename}' from {engine_instance.name} is invalid!"
+                )
+
             # Only convert if we have a preferred format different than the
             # expected format from the TTS system, or if a specific sample
             # rate/format/channel count is requested.
@@ -791,30 +996,40 @@ class SpeechManager:
                 data = await async_convert_audio(
                     self.hass,
                     extension,
-                    data,
+                    b"".join([chunk async for chunk in audio_chunks]),
                     to_extension=final_extension,
                     to_sample_rate=sample_rate,
                     to_sample_channels=sample_channels,
                     to_sample_bytes=sample_bytes,
                 )
-
-            # Create file infos
-            filename = f"{cache_key}.{final_extension}".lower()
-
-            # Validate filename
-            if not _RE_VOICE_FILE.match(filename) and not _RE_LEGACY_VOICE_FILE.match(
-                filename
-            ):
-                raise HomeAssistantError(
-                    f"TTS filename '{filename}' from {engine_instance.name} is invalid!"
-                )
+                if final_extension == "mp3":
+                    data = self.write_tags(
+                        filename, data, engine_instance.name, message, language, options
+                    )
+            else:
+                # Audio that needs no conversion can be played by readers
+                # of the URL while it is still being synthesized
+                stream = _AudioStream()
+                if (cached := self.mem_cache.async_peek(cache_key)) is not None:
+                    cached["stream"] = stream
+                # The first chunk may be too short to be parsed as mp3, so
+                # the tags are sent as a separate ID3 header before the audio
+                if final_extension == "mp3":
+                    stream.async_add_chunk(
+                        self.id3_header(
+                            engine_instance.name, message, language, options
+                        )
+                    )
+                try:
+                    async for chunk in audio_chunks:
+                        stream.async_add_chunk(chunk)
+                except BaseException as err:
+                    stream.async_finish(err)
+                    raise
+                stream.async_finish()
+                data = b"".join(stream.chunks)
 
             # Save to memory
-            if final_extension == "mp3":
-                data = self.write_tags(
-                    filename, data, engine_instance.name, message, language, options
-                )
-
             self._async_store_to_memcache(cache_key, filename, data)
 
             if cache:
@@ -822,24 +1037,25 @@ class SpeechManager:
                     self._async_save_tts_audio(cache_key, filename, data)
                 )
 
-            return filename
+            return data
 
         audio_task = self.hass.async_create_task(get_tts_data(), eager_start=False)
 
         def handle_error(_future: asyncio.Future) -> None:
             """Handle error."""
             if audio_task.exception():
-                self.mem_cache.pop(cache_key, None)
+                self.mem_cache.async_pop(cache_key)
 
         audio_task.add_done_callback(handle_error)
 
-        filename = f"{cache_key}.{final_extension}".lower()
-        self.mem_cache[cache_key] = {
-            "filename": filename,
+        cached: TTSCache = {
+            "filename": f"{cache_key}.{final_extension}".lower(),
             "voice": b"",
             "pending": audio_task,
+            "stream": None,
         }
-        return filename
+        self.mem_cache.async_set(cache_key, cached)
+        return cached
 
     async def _async_save_tts_audio(
         self, cache_key: str, filename: str, data: bytes
@@ -861,7 +1077,7 @@ class SpeechManager:
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
 
-    async def _async_file_to_mem(self, cache_key: str) -> None:
+    async def _async_file_to_mem(self, cache_key: str) -> TTSCache:
         """Load voice from file cache into memory.
 
         This method is a coroutine.
@@ -882,60 +1098,77 @@ class SpeechManager:
             del self.file_cache[cache_key]
             raise HomeAssistantError(f"Can't read {voice_file}") from err
 
-        self._async_store_to_memcache(cache_key, filename, data)
+        return self._async_store_to_memcache(cache_key, filename, data)
 
     @callback
     def _async_store_to_memcache(
         self, cache_key: str, filename: str, data: bytes
-    ) -> None:
-        """Store data to memcache and set timer to remove it."""
-        self.mem_cache[cache_key] = {
+    ) -> TTSCache:
+        """Store data to memcache."""
+        cached: TTSCache = {
             "filename": filename,
             "voice": data,
             "pending": None,
+            "stream": None,
         }
+        self.mem_cache.async_set(cache_key, cached)
+        return cached
 
-        @callback
-        def async_remove_from_mem(_: datetime) -> None:
-            """Cleanup memcache."""
-            self.mem_cache.pop(cache_key, None)
-
-        async_call_later(
-            self.hass,
-            self.time_memory,
-            HassJob(
-                async_remove_from_mem,
-                name="tts remove_from_mem",
-                cancel_on_shutdown=True,
-            ),
-        )
+    @callback
+    def async_read_tts_stream(
+        self, filename: str
+    ) -> tuple[str | None, AsyncIterable[bytes]] | None:
+        """Return the audio chunks of a voice that is still being synthesized.
+
+        Return None if the voice is not being streamed, use async_read_tts
+        to read it instead.
+        """
+        if (
+            (cached := self.mem_cache.async_peek(_filename_to_cache_key(filename)))
+            is None
+            or not cached["pending"]
+            or (stream := cached["stream"]) is None
+        ):
+            return None
+        content, _ = mimetypes.guess_type(filename)
+        return content, stream.async_iter_chunks()
 
     async def async_read_tts(self, filename: str) -> tuple[str | None, bytes]:
         """Read a voice file and return binary.
 
         This method is a coroutine.
         """
-        if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
-            record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
-        ):
-            raise HomeAssistantError("Wrong tts file format!")
+        cache_key = _filename_to_cache_key(filename)
 
-        cache_key = KEY_PATTERN.format(
-            record.group(1), record.group(2), record.group(3), record.group(4)
-        )
-
-        if cache_key not in self.mem_cache:
-            if cache_key not in self.file_cache:
+        # The URL of the file was resolved with async_get_url_path, which
+        # already counted the lookup and marked the audio as used
+        if (cached := self.mem_cache.async_peek(cache_key)) is None:
+            if not await self._async_get_cache_file(cache_key):
                 raise HomeAssistantError(f"{cache_key} not in cache!")
-            await self._async_file_to_mem(cache_key)
-
-        cached = self.mem_cache[cache_key]
-        if pending := cached.get("pending"):
-            await pending
-            cached = self.mem_cache[cache_key]
+            cached = await self._async_file_to_mem(cache_key)
 
         content, _ = mimetypes.guess_type(filename)
-        return content, cached["voice"]
+        return content, await _async_read_voice(cached)
+
+    @staticmethod
+    def id3_header(
+        engine_name: str, message: str, language: str, options: dict | None
+    ) -> bytes:
+        """Return an ID3 tag to send in front of streamed mp3 audio.
+
+        Async friendly.
+        """
+        artist = language
+        if options is not None and (voice := options.get("voice")) is not None:
+            artist = voice
+
+        tags = ID3()
+        tags.add(TPE1(encoding=3, text=artist))  # type: ignore[no-untyped-call]
+        tags.add(TALB(encoding=3, text=engine_name))  # type: ignore[no-untyped-call]
+        tags.add(TIT2(encoding=3, text=message))  # type: ignore[no-untyped-call]
+        header = io.BytesIO()
+        tags.save(header, padding=lambda _info: 0)
+        return header.getvalue()
 
     @staticmethod
     def write_tags(
@@ -990,6 +1223,18 @@ class SpeechManager:
         return data_bytes.getvalue()
 
 
+def _filename_to_cache_key(filename: str) -> str:
+    """Return the cache key of a voice file name."""
+    if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
+        record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
+    ):
+        raise HomeAssistantError("Wrong tts file format!")
+
+    return KEY_PATTERN.format(
+        record.group(1), record.group(2), record.group(3), record.group(4)
+    )
+
+
 def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
     """Init cache folder."""
     if not os.path.isabs(cache_dir):
@@ -1073,9 +1318,11 @@ class TextToSpeechView(HomeAssistantView):
         """Initialize a tts view."""
         self.tts = tts
 
-    async def get(self, request: web.Request, filename: str) -> web.Response:
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
         """Start a get request."""
         try:
+            if streaming := self.tts.async_read_tts_stream(filename):
+                return await self._async_stream(request, *streaming)
             content, data = await self.tts.async_read_tts(filename)
         except HomeAssistantError as err:
             _LOGGER.error("Error on load tts: %s", err)
@@ -1083,6 +1330,30 @@ class TextToSpeechView(HomeAssistantView):
 
         return web.Response(body=data, content_type=content)
 
+    async def _async_stream(
+        self,
+        request: web.Request,
+        content: str | None,
+        audio_chunks: AsyncIterable[bytes],
+    ) -> web.StreamResponse:
+        """Send audio chunks as they are synthesized."""
+        response = web.StreamResponse()
+        if content is not None:
+            response.content_type = content
+        await response.prepare(request)
+        try:
+            async for chunk in audio_chunks:
+                await response.write(chunk)
+        except HomeAssistantError as err:
+            _LOGGER.error("Error on stream tts: %s", err)
+            # Drop the connection before the end of the body, so the player
+            # sees incomplete audio instead of a finished response
+            if request.transport is not None:
+                request.transport.close()
+            return response
+        await response.write_eof()
+        return response
+
 
 @websocket_api.websocket_command(
     {
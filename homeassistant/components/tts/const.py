@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterable
 from typing import TYPE_CHECKING
 
 from homeassistant.util.hass_dict import HassKey
@@ -25,9 +26,13 @@ DEFAULT_CACHE = True
 DEFAULT_CACHE_DIR = "tts"
 DEFAULT_TIME_MEMORY = 300
 
+# Max bytes of audio kept in memory, least recently used audio is dropped first
+MEM_CACHE_MAX_SIZE = 32 * 1024 * 1024
+
 DOMAIN = "tts"
 DATA_COMPONENT: HassKey[EntityComponent[TextToSpeechEntity]] = HassKey(DOMAIN)
 
 DATA_TTS_MANAGER: HassKey[SpeechManager] = HassKey("tts_manager")
 
 type TtsAudioType = tuple[str | None, bytes | None]
+type TtsAudioStreamType = tuple[str | None, AsyncIterable[bytes] | None]
@@ -9,6 +9,7 @@ from contextlib import contextmanager
 from datetime import datetime, time as dt_time, timedelta
 import functools as ft
 import logging
+from operator import attrgetter
 import re
 import sys
 from typing import Any, Protocol, cast
@@ -65,6 +66,7 @@ from .template import Template, render_complex
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_cv,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -92,6 +94,20 @@ _PLATFORM_ALIASES = {
     "zone": None,
 }
 
+# Relative cost of checking a built-in condition. These conditions have no
+# side effects, so the conditions of an and, or and not condition, and of an
+# automation, are checked cheapest first. Device and platform conditions are
+# not moved and conditions are never moved across them.
+_CONDITION_COSTS = {
+    "state": 1,
+    "trigger": 1,
+    "numeric_state": 2,
+    "time": 2,
+    "zone": 3,
+    "sun": 4,
+    "template": 5,
+}
+
 INPUT_ENTITY_ID = re.compile(
     r"^input_(?:select|text|number|boolean|datetime)\.(?!.+__)(?!_)[\da-z_]+(?<!_)$"
 )
@@ -171,12 +187,25 @@ def trace_condition(variables: TemplateVarsType) -> Generator[TraceElement]:
             trace_stack_pop(trace_stack_cv)
 
 
+@contextmanager
+def _trace_entity_condition(index: int, variables: TemplateVarsType) -> Generator[None]:
+    """Trace the condition of one entity, if tracing is on."""
+    if trace_cv.get() is None:
+        yield
+        return
+    with trace_path(["entity_id", str(index)]), trace_condition(variables):
+        yield
+
+
 def trace_condition_function(condition: ConditionCheckerType) -> ConditionCheckerType:
     """Wrap a condition function to enable basic tracing."""
 
     @ft.wraps(condition)
     def wrapper(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool | None:
         """Trace condition."""
+        if trace_cv.get() is None:
+            # Tracing is off, don't create trace elements
+            return condition(hass, variables)
         with trace_condition(variables):
             result = condition(hass, variables)
             condition_trace_update_result(result=result)
@@ -218,7 +247,7 @@ async def async_from_config(
     platform = await _async_get_condition_platform(hass, config)
 
     if platform is None:
-        condition = config.get(CONF_CONDITION)
+        condition: str = config.get(CONF_CONDITION, "")
         for fmt in (ASYNC_FROM_CONFIG_FORMAT, FROM_CONFIG_FORMAT):
             factory = getattr(sys.modules[__name__], fmt.format(condition), None)
 
@@ -258,33 +287,98 @@ async def async_from_config(
     return cast(ConditionCheckerType, factory(config))
 
 
+def _condition_cost(config: ConfigType) -> int | None:
+    """Return the relative cost of checking a condition.
+
+    Return None if the condition is not a built-in condition which can be moved.
+    """
+    condition: str = config.get(CONF_CONDITION, "")
+    if condition in ("and", "or", "not"):
+        cost = 0
+        for entry in config.get("conditions", ()):
+            if (entry_cost := _condition_cost(entry)) is None:
+                return None
+            cost += entry_cost
+        return cost
+    if condition == "numeric_state" and CONF_VALUE_TEMPLATE in config:
+        return _CONDITION_COSTS["template"]
+    return _CONDITION_COSTS.get(condition)
+
+
+def _check_conditions(
+    hass: HomeAssistant,
+    variables: TemplateVarsType,
+    condition: str,
+    checks: list[ConditionCheckerType],
+    checks_by_cost: list[tuple[int, ConditionCheckerType]],
+    stop: Callable[[bool | None], bool],
+) -> bool:
+    """Check the conditions of an and, or or not condition.
+
+    Return True as soon as the result of a check stops the evaluation. The
+    checks run cheapest first, which doesn't change the result, as the result
+    doesn't depend on the order of the checks. Traced checks keep the trace
+    path of their declared index.
+    """
+    errors = []
+    tracing = trace_cv.get() is not None
+    for index, check in checks_by_cost:
+        try:
+            if tracing:
+                with trace_path(["conditions", str(index)]):
+                    if stop(check(hass, variables)):
+                        return True
+            elif stop(check(hass, variables)):
+                return True
+        except ConditionError as ex:
+            errors.append(
+                ConditionErrorIndex(condition, index=index, total=len(checks), error=ex)
+            )
+    errors.sort(key=attrgetter("index"))
+
+    # Raise the errors if no check stopped the evaluation
+    if errors:
+        raise ConditionErrorContainer(condition, errors=errors)
+
+    return False
+
+
+def _checks_by_cost(
+    configs: list[ConfigType], checks: list[ConditionCheckerType]
+) -> list[tuple[int, ConditionCheckerType]]:
+    """Return the checks with their index, cheapest first.
+
+    Only the built-in conditions between two device or platform conditions
+    are sorted, the device and platform conditions keep their position.
+    """
+    # Device and platform conditions get a group of their own, the checks
+    # are sorted by group first to never be moved across them
+    keys: list[tuple[int, int]] = []
+    group = 0
+    for config in configs:
+        if (cost := _condition_cost(config)) is None:
+            keys.append((group + 1, 0))
+            group += 2
+        else:
+            keys.append((group, cost))
+    return sorted(enumerate(checks), key=lambda item: keys[item[0]])
+
+
 async def async_and_from_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'AND'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    checks_by_cost = _checks_by_cost(config["conditions"], checks)
 
     @trace_condition_function
     def if_and_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
         """Test and condition."""
-        errors = []
-        for index, check in enumerate(checks):
-            try:
-                with trace_path(["conditions", str(index)]):
-                    if check(hass, variables) is False:
-                        return False
-            except ConditionError as ex:
-                errors.append(
-                    ConditionErrorIndex("and", index=index, total=len(checks), error=ex)
-                )
-
-        # Raise the errors if no check was false
-        if errors:
-            raise ConditionErrorContainer("and", errors=errors)
-
-        return True
+        return not _check_conditions(
+            hass, variables, "and", checks, checks_by_cost, _is_false
+        )
 
     return if_and_condition
 
@@ -294,28 +388,16 @@ async def async_or_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'OR'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    checks_by_cost = _checks_by_cost(config["conditions"], checks)
 
     @trace_condition_function
     def if_or_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
         """Test or condition."""
-        errors = []
-        for index, check in enumerate(checks):
-            try:
-                with trace_path(["conditions", str(index)]):
-                    if check(hass, variables) is True:
-                        return True
-            except ConditionError as ex:
-                errors.append(
-                    ConditionErrorIndex("or", index=index, total=len(checks), error=ex)
-                )
-
-        # Raise the errors if no check was true
-        if errors:
-            raise ConditionErrorContainer("or", errors=errors)
-
-        return False
+        return _check_conditions(
+            hass, variables, "or", checks, checks_by_cost, _is_true
+        )
 
     return if_or_condition
 
@@ -325,30 +407,28 @@ async def async_not_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'NOT'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    checks_by_cost = _checks_by_cost(config["conditions"], checks)
 
     @trace_condition_function
     def if_not_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
         """Test not condition."""
-        errors = []
-        for index, check in enumerate(checks):
-            try:
-                with trace_path(["conditions", str(index)]):
-                    if check(hass, variables):
-                        return False
-            except ConditionError as ex:
-                errors.append(
-                    ConditionErrorIndex("not", index=index, total=len(checks), error=ex)
-                )
+        return not _check_conditions(
+            hass, variables, "not", checks, checks_by_cost, bool
+        )
 
-        # Raise the errors if no check was true
-        if errors:
-            raise ConditionErrorContainer("not", errors=errors)
+    return if_not_condition
 
-        return True
 
-    return if_not_condition
+def _is_false(result: bool | None) -> bool:
+    """Return if a condition check is false."""
+    return result is False
+
+
+def _is_true(result: bool | None) -> bool:
+    """Return if a condition check is true."""
+    return result is True
 
 
 def numeric_state(
@@ -514,7 +594,7 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
         errors = []
         for index, entity_id in enumerate(entity_ids):
             try:
-                with trace_path(["entity_id", str(index)]), trace_condition(variables):
+                with _trace_entity_condition(index, variables):
                     if not async_numeric_state(
                         hass,
                         entity_id,
@@ -632,7 +712,7 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
         result: bool = match != ENTITY_MATCH_ANY
         for index, entity_id in enumerate(entity_ids):
             try:
-                with trace_path(["entity_id", str(index)]), trace_condition(variables):
+                with _trace_entity_condition(index, variables):
                     if state(
                         hass, entity_id, req_states, for_period, attribute, variables
                     ):
@@ -1076,11 +1156,12 @@ async def async_conditions_from_config(
         await async_from_config(hass, condition_config)
         for condition_config in condition_configs
     ]
+    checks_by_cost = _checks_by_cost(condition_configs, checks)
 
     def check_conditions(variables: TemplateVarsType = None) -> bool:
-        """AND all conditions."""
+        """AND all conditions, cheapest first."""
         errors: list[ConditionErrorIndex] = []
-        for index, check in enumerate(checks):
+        for index, check in checks_by_cost:
             try:
                 with trace_path(["condition", str(index)]):
                     if check(hass, variables) is False:
@@ -1093,6 +1174,7 @@ async def async_conditions_from_config(
                 )
 
         if errors:
+            errors.sort(key=attrgetter("index"))
             logger.warning(
                 "Error evaluating condition in '%s':\n%s",
                 name,
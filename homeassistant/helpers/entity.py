@@ -45,6 +45,7 @@ from homeassistant.core import (
     HassJobType,
     HomeAssistant,
     ReleaseChannel,
+    State,
     callback,
     get_hassjob_callable_job_type,
     get_release_channel,
@@ -71,6 +72,7 @@ timer = time.time
 
 if TYPE_CHECKING:
     from .entity_platform import EntityPlatform
+    from .entity_values import EntityValues
 
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
@@ -278,6 +280,8 @@ class CachedProperties(type):
       data, which will be stored in an attribute prefixed with __attr_
     - The _attr_-property setter will invalidate the @cached_property by calling
       delattr on it
+    - The _attr_-property setter and deleter mark the state of the object as dirty
+      by setting _state_dirty to True
     """
 
     def __new__(
@@ -324,6 +328,7 @@ class CachedProperties(type):
                 o.__dict__.pop(name, None)
                 # Delete the __attr_ attribute
                 delattr(o, private_attr_name)
+                o._state_dirty = True  # noqa: SLF001
 
             return _deleter
 
@@ -342,6 +347,7 @@ class CachedProperties(type):
                 setattr(o, private_attr_name, val)
                 # Invalidate the cache of the cached property
                 o.__dict__.pop(name, None)
+                o._state_dirty = True  # noqa: SLF001
 
             return _setter
 
@@ -475,6 +481,15 @@ class Entity(
     # to be writable. This is used to avoid repeated checks.
     _verified_state_writable = False
 
+    # If _state_dirty_tracking is set to True, writing the state only calculates
+    # the state and attributes when _state_dirty is True, the last written state
+    # is otherwise reported again. _state_dirty is set by changing any _attr_
+    # which backs a cached property. Entities which opt in must derive their state
+    # only from those _attr_, or set _state_dirty themselves when anything else
+    # the state depends on changes.
+    _state_dirty_tracking = False
+    _state_dirty = True
+
     # Process updates in parallel
     parallel_updates: asyncio.Semaphore | None = None
 
@@ -521,6 +536,13 @@ class Entity(
     __capabilities_updated_at_reported: bool = False
     __remove_future: asyncio.Future[None] | None = None
 
+    # What the state was last calculated from, only set if _state_dirty_tracking
+    __written_state: State | None = None
+    __written_available: bool | None = None
+    __written_registry_entry: er.RegistryEntry | None = None
+    __written_device_entry: dr.DeviceEntry | None = None
+    __written_customize: EntityValues | None = None
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_attribution: str | None = None
@@ -1125,6 +1147,11 @@ class Entity(
                 )
             return
 
+        if self._state_dirty_tracking:
+            if not self._state_dirty and self.__async_report_unchanged_state(entry):
+                return
+            self._state_dirty = False
+
         state_calculate_start = timer()
         state, attr, capabilities, original_device_class, supported_features = (
             self.__async_calculate_state()
@@ -1198,12 +1225,7 @@ class Entity(
             if custom := customize.get(entity_id):
                 attr.update(custom)
 
-        if (
-            self._context_set is not None
-            and time_now - self._context_set > CONTEXT_RECENT_TIME_SECONDS
-        ):
-            self._context = None
-            self._context_set = None
+        self.__async_expire_context(time_now)
 
         try:
             hass.states.async_set_internal(
@@ -1222,6 +1244,57 @@ class Entity(
             hass.states.async_set(
                 entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
             )
+            self._state_dirty = True
+
+        if self._state_dirty_tracking:
+            self.__written_state = hass.states.get(entity_id)
+            self.__written_available = self.available
+            self.__written_registry_entry = self.registry_entry
+            self.__written_device_entry = self.device_entry
+            self.__written_customize = hass.data.get(DATA_CUSTOMIZE)
+
+    @callback
+    def __async_expire_context(self, time_now: float) -> None:
+        """Forget the context if it was not set recently."""
+        if (
+            self._context_set is not None
+            and time_now - self._context_set > CONTEXT_RECENT_TIME_SECONDS
+        ):
+            self._context = None
+            self._context_set = None
+
+    @callback
+    def __async_report_unchanged_state(self, entry: er.RegistryEntry | None) -> bool:
+        """Report the last written state again if nothing it depends on changed.
+
+        Returns False if the state needs to be calculated.
+        """
+        hass = self.hass
+        entity_id = self.entity_id
+        if (
+            (old_state := self.__written_state) is None
+            or hass.states.get(entity_id) is not old_state
+            or entry is not self.__written_registry_entry
+            or self.device_entry is not self.__written_device_entry
+            or hass.data.get(DATA_CUSTOMIZE) is not self.__written_customize
+            or self.available != self.__written_available
+        ):
+            return False
+
+        time_now = timer()
+        self.__async_expire_context(time_now)
+        hass.states.async_set_internal(
+            entity_id,
+            old_state.state,
+            old_state.attributes,
+            self.force_update,
+            self._context,
+            self._state_info,
+            time_now,
+        )
+        if self.force_update:
+            self.__written_state = hass.states.get(entity_id)
+        return True
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
@@ -44,6 +44,7 @@ from . import (
     service,
     translation,
 )
+from .device_registry import DeviceInfo
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
@@ -71,6 +72,43 @@ PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 _LOGGER = getLogger(__name__)
 
 
+class _DeviceCache:
+    """Cache the devices created for the entities added in one call.
+
+    Entities of the same device usually provide equal device info. Only the
+    first of them needs to go through device_registry.async_get_or_create,
+    the others are linked to the device it returned.
+    """
+
+    __slots__ = ("_devices", "_device_registry")
+
+    def __init__(self, device_registry: dev_reg.DeviceRegistry) -> None:
+        """Initialize the device cache."""
+        self._device_registry = device_registry
+        self._devices: dict[frozenset[tuple[str, str]], tuple[DeviceInfo, str]] = {}
+
+    @callback
+    def async_get_or_create(
+        self, config_entry_id: str, device_info: DeviceInfo
+    ) -> dev_reg.DeviceEntry:
+        """Get or create the device described by device_info."""
+        key = frozenset(device_info.get("identifiers") or ()) | frozenset(
+            device_info.get("connections") or ()
+        )
+        if (
+            (cached := self._devices.get(key))
+            and cached[0] == device_info
+            and (device := self._device_registry.async_get(cached[1]))
+        ):
+            return device
+        device = self._device_registry.async_get_or_create(
+            config_entry_id=config_entry_id, **device_info
+        )
+        if key:
+            self._devices[key] = (device_info.copy(), device.id)
+        return device
+
+
 class AddEntitiesCallback(Protocol):
     """Protocol type for EntityPlatform.add_entities callback."""
 
@@ -627,11 +665,14 @@ class EntityPlatform:
 
         hass = self.hass
         entity_registry = ent_reg.async_get(hass)
+        device_cache = _DeviceCache(dev_reg.async_get(hass))
         coros: list[Coroutine[Any, Any, None]] = []
         entities: list[Entity] = []
         for entity in new_entities:
             coros.append(
-                self._async_add_entity(entity, update_before_add, entity_registry)
+                self._async_add_entity(
+                    entity, update_before_add, entity_registry, device_cache
+                )
             )
             entities.append(entity)
 
@@ -710,6 +751,7 @@ class EntityPlatform:
         entity: Entity,
         update_before_add: bool,
         entity_registry: EntityRegistry,
+        device_cache: _DeviceCache,
     ) -> None:
         """Add an entity to the platform."""
         if entity is None:
@@ -767,9 +809,8 @@ class EntityPlatform:
 
             if self.config_entry and (device_info := entity.device_info):
                 try:
-                    device = dev_reg.async_get(self.hass).async_get_or_create(
-                        config_entry_id=self.config_entry.entry_id,
-                        **device_info,
+                    device = device_cache.async_get_or_create(
+                        self.config_entry.entry_id, device_info
                     )
                 except dev_reg.DeviceInfoError as exc:
                     self.logger.error(
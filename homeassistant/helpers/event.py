@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import partial, wraps
 import logging
+import math
 from random import randint
 import time
 from typing import TYPE_CHECKING, Any, Concatenate, Generic, TypeVar
@@ -75,6 +76,7 @@ _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
+_TIMER_WHEEL: HassKey[_TimerWheel] = HassKey("timer_wheel")
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -89,6 +91,10 @@ _LOGGER = logging.getLogger(__name__)
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
+# Timers of point in time listeners and same state trackers which are due in
+# the same tick of this many seconds are run by a single event loop wakeup
+TIMER_WHEEL_TICK = 0.05
+
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 _StateEventDataT = TypeVar("_StateEventDataT", bound=EventStateEventData)
 
@@ -1427,7 +1433,10 @@ def async_track_same_state(
         if not async_check_same_func(entity, from_state, to_state):
             clear_listener()
 
-    async_remove_state_for_listener = async_call_later(hass, period, state_for_listener)
+    async_remove_state_for_listener = _async_get_timer_wheel(hass).async_schedule(
+        hass.loop.time() + period.total_seconds(),
+        partial(state_for_listener, None),
+    )
 
     if entity_ids == MATCH_ALL:
         async_remove_state_for_cancel = hass.bus.async_listen(
@@ -1481,19 +1490,113 @@ def async_track_point_in_time(
 track_point_in_time = threaded_listener_factory(async_track_point_in_time)
 
 
+@dataclass(slots=True, eq=False)
+class _WheelTimer:
+    when: float
+    callback: Callable[[], None]
+
+
+class _TimerWheel:
+    """Run timers which are due in the same tick with one event loop wakeup.
+
+    Timers are grouped in slots of TIMER_WHEEL_TICK seconds of loop time, and
+    only a slot with pending timers has a handle in the event loop. A timer
+    never runs before it is due, and cancelling or rearming it only touches
+    the event loop when its slot becomes empty.
+    """
+
+    __slots__ = ("_handles", "_loop", "_slots")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Initialize the timer wheel."""
+        self._loop = loop
+        self._slots: dict[int, dict[_WheelTimer, None]] = {}
+        self._handles: dict[int, asyncio.TimerHandle] = {}
+
+    @callback
+    def async_schedule(
+        self, when: float, timer_callback: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Run a callback at or after the loop time when."""
+        slot = math.ceil(when / TIMER_WHEEL_TICK)
+        timer = _WheelTimer(when, timer_callback)
+        if (timers := self._slots.get(slot)) is None:
+            timers = self._slots[slot] = {}
+            self._handles[slot] = self._loop.call_at(
+                slot * TIMER_WHEEL_TICK, self._async_run_slot, slot
+            )
+        timers[timer] = None
+        return partial(self._async_cancel, slot, timer)
+
+    @callback
+    def _async_cancel(self, slot: int, timer: _WheelTimer) -> None:
+        """Cancel a timer."""
+        if (timers := self._slots.get(slot)) is None or timer not in timers:
+            return
+        del timers[timer]
+        if not timers:
+            del self._slots[slot]
+            # The handle is gone when the slot is being run
+            if handle := self._handles.pop(slot, None):
+                handle.cancel()
+
+    @callback
+    def async_run_due(self, when: float) -> None:
+        """Run the timers due at or before the loop time when.
+
+        The timers run without waiting for the end of their slot.
+        """
+        for slot, timers in list(self._slots.items()):
+            for timer in [timer for timer in timers if timer.when <= when]:
+                # A timer which ran before may have cancelled this one
+                if timer in timers:
+                    self._async_cancel(slot, timer)
+                    self._async_run_timer(timer)
+
+    @callback
+    def _async_run_slot(self, slot: int) -> None:
+        """Run all timers of a slot."""
+        del self._handles[slot]
+        timers = self._slots[slot]
+        # Timers stay in the slot until they run, so a timer can still cancel
+        # the timers after it
+        while timers:
+            timer = next(iter(timers))
+            del timers[timer]
+            self._async_run_timer(timer)
+        if self._slots.get(slot) is timers:
+            del self._slots[slot]
+
+    @staticmethod
+    def _async_run_timer(timer: _WheelTimer) -> None:
+        """Run a timer."""
+        try:
+            timer.callback()
+        except Exception:
+            _LOGGER.exception("Exception in callback %s", timer.callback)
+
+
+@callback
+def _async_get_timer_wheel(hass: HomeAssistant) -> _TimerWheel:
+    """Return the timer wheel of a Home Assistant instance."""
+    if (wheel := hass.data.get(_TIMER_WHEEL)) is None:
+        wheel = hass.data[_TIMER_WHEEL] = _TimerWheel(hass.loop)
+    return wheel
+
+
 @dataclass(slots=True)
 class _TrackPointUTCTime:
     hass: HomeAssistant
     job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     utc_point_in_time: datetime
     expected_fire_timestamp: float
-    _cancel_callback: asyncio.TimerHandle | None = None
+    _cancel_callback: CALLBACK_TYPE | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
-        loop = self.hass.loop
-        self._cancel_callback = loop.call_at(
-            loop.time() + self.expected_fire_timestamp - time.time(), self
+        hass = self.hass
+        self._cancel_callback = _async_get_timer_wheel(hass).async_schedule(
+            hass.loop.time() + self.expected_fire_timestamp - time.time(), self
         )
 
     @callback
@@ -1512,18 +1615,20 @@ class _TrackPointUTCTime:
         # time.
         if (delta := (self.expected_fire_timestamp - time_tracker_timestamp())) > 0:
             _LOGGER.debug("Called %f seconds too early, rearming", delta)
-            loop = self.hass.loop
-            self._cancel_callback = loop.call_at(loop.time() + delta, self)
+            hass = self.hass
+            self._cancel_callback = _async_get_timer_wheel(hass).async_schedule(
+                hass.loop.time() + delta, self
+            )
             return
 
         self.hass.async_run_hass_job(self.job, self.utc_point_in_time)
 
     @callback
     def async_cancel(self) -> None:
-        """Cancel the call_at."""
+        """Cancel the timer."""
         if TYPE_CHECKING:
             assert self._cancel_callback is not None
-        self._cancel_callback.cancel()
+        self._cancel_callback()
 
 
 @callback
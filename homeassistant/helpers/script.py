@@ -79,11 +79,13 @@ from homeassistant.core import (
     State,
     SupportsResponse,
     callback,
+    valid_entity_id,
 )
 from homeassistant.util import slugify
 from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.dt import utcnow
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.signal_type import SignalType, SignalTypeFormat
 
 from . import condition, config_validation as cv, service, template
@@ -91,6 +93,7 @@ from .condition import ConditionCheckerType, trace_condition_function
 from .dispatcher import async_dispatcher_connect, async_dispatcher_send_internal
 from .event import async_call_later, async_track_template
 from .script_variables import ScriptVariables
+from .service import ServiceParams
 from .template import Template
 from .trace import (
     TraceElement,
@@ -171,6 +174,58 @@ class ScriptStoppedError(Exception):
     """Error to indicate that the script has been stopped."""
 
 
+@dataclass(slots=True)
+class _PlannedAction:
+    """An action of a script sequence, prepared before the first run."""
+
+    action: dict[str, Any]
+    action_type: str | None
+    handler: str | None
+    continue_on_error: bool
+    static_service_call: bool = False
+    service_params: ServiceParams | None = None
+
+
+def _is_static(value: Any) -> bool:
+    """Test if a data structure does not contain dynamic templates."""
+    if isinstance(value, Template):
+        return value.is_static
+    if isinstance(value, list):
+        return all(_is_static(val) for val in value)
+    if isinstance(value, Mapping):
+        return all(_is_static(key) and _is_static(val) for key, val in value.items())
+    return True
+
+
+def _plan_action(action: dict[str, Any]) -> _PlannedAction:
+    """Resolve what can be resolved of an action before running it."""
+    try:
+        action_type: str | None = cv.determine_script_action(action)
+    except ValueError:
+        # Raised again when the action is run
+        action_type = None
+
+    static_service_call = False
+    if action_type == cv.SCRIPT_ACTION_CALL_SERVICE and _is_static(action):
+        # Entity registry IDs in the target are resolved to entity IDs when the
+        # service is called, their result may change between runs.
+        target = action.get(CONF_TARGET) or {}
+        entity_ids = target.get(ATTR_ENTITY_ID, [])
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        static_service_call = all(
+            valid_entity_id(entity_id) for entity_id in entity_ids
+        )
+
+    return _PlannedAction(
+        action,
+        action_type,
+        None if action_type is None else f"_async_{action_type}_step",
+        action.get(CONF_CONTINUE_ON_ERROR, False),
+        static_service_call,
+    )
+
+
 def _set_result_unless_done(future: asyncio.Future[None]) -> None:
     """Set result of future unless it is done."""
     if not future.done():
@@ -406,6 +461,7 @@ class _ScriptRun:
     """Manage Script sequence run."""
 
     _action: dict[str, Any]
+    _planned_action: _PlannedAction
 
     def __init__(
         self,
@@ -457,7 +513,10 @@ class _ScriptRun:
 
         try:
             self._log("Running %s", self._script.running_description)
-            for self._step, self._action in enumerate(self._script.sequence):
+            for self._step, self._planned_action in enumerate(
+                self._script._action_plan  # noqa: SLF001
+            ):
+                self._action = self._planned_action.action
                 if self._stop.done():
                     script_execution_set("cancelled")
                     break
@@ -491,7 +550,8 @@ class _ScriptRun:
         return ScriptRunResult(self._conversation_response, response, self._variables)
 
     async def _async_step(self, log_exceptions: bool) -> None:
-        continue_on_error = self._action.get(CONF_CONTINUE_ON_ERROR, False)
+        planned_action = self._planned_action
+        continue_on_error = planned_action.continue_on_error
 
         with trace_path(str(self._step)):
             async with trace_action(
@@ -500,7 +560,9 @@ class _ScriptRun:
                 if self._stop.done():
                     return
 
-                action = cv.determine_script_action(self._action)
+                if (action := planned_action.action_type) is None:
+                    action = cv.determine_script_action(self._action)
+                handler = planned_action.handler or f"_async_{action}_step"
 
                 if CONF_ENABLED in self._action:
                     enabled = self._action[CONF_ENABLED]
@@ -521,7 +583,6 @@ class _ScriptRun:
                         trace_set_result(enabled=False)
                         return
 
-                handler = f"_async_{action}_step"
                 try:
                     await getattr(self, handler)()
                 except Exception as ex:  # noqa: BLE001
@@ -732,9 +793,26 @@ class _ScriptRun:
         """Call the service specified in the action."""
         self._step_log("call service")
 
-        params = service.async_prepare_call_from_config(
-            self._hass, self._action, self._variables
-        )
+        planned_action = self._planned_action
+        if (params := planned_action.service_params) is None:
+            params = service.async_prepare_call_from_config(
+                self._hass, self._action, self._variables
+            )
+            if planned_action.static_service_call:
+                # Shared by all runs, only the copies below are changed
+                planned_action.service_params = {
+                    "domain": params["domain"],
+                    "service": params["service"],
+                    "service_data": ReadOnlyDict(params["service_data"]),
+                    "target": ReadOnlyDict(params["target"] or {}),
+                }
+        # The service call updates service_data with the target
+        params = {
+            "domain": params["domain"],
+            "service": params["service"],
+            "service_data": dict(params["service_data"]),
+            "target": dict(params["target"]) if params["target"] else {},
+        }
 
         # Validate response data parameters. This check ignores services that do
         # not exist which will raise an appropriate error in the service call below.
@@ -1460,6 +1538,11 @@ class Script:
         self._variables_dynamic = template.is_complex(variables)
         self._copy_variables_on_run = copy_variables
 
+    @cached_property
+    def _action_plan(self) -> list[_PlannedAction]:
+        """Return the sequence with actions prepared for running."""
+        return [_plan_action(action) for action in self.sequence]
+
     @property
     def change_listener(self) -> Callable[..., Any] | None:
         """Return the change_listener."""
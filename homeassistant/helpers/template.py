@@ -792,8 +792,6 @@ class Template:
         if self.is_static:
             return self.template
 
-        compiled = self._compiled or self._ensure_compiled()
-
         variables = dict(variables or {})
         variables["value"] = value
 
@@ -802,6 +800,43 @@ class Template:
         except JSON_DECODE_EXCEPTIONS:
             pass
 
+        return self._async_render_value(value, error_value, variables, parse_result)
+
+    @callback
+    def async_render_with_value(
+        self,
+        value: Any,
+        error_value: Any = _SENTINEL,
+        variables: dict[str, Any] | None = None,
+        parse_result: bool = False,
+    ) -> Any:
+        """Render template with value exposed, without parsing it as JSON.
+
+        Callers which already parsed the value can pass value_json in variables.
+
+        This method must be run in the event loop.
+        """
+        self._renders += 1
+
+        if self.is_static:
+            return self.template
+
+        variables = dict(variables or {})
+        variables["value"] = value
+
+        return self._async_render_value(value, error_value, variables, parse_result)
+
+    @callback
+    def _async_render_value(
+        self,
+        value: Any,
+        error_value: Any,
+        variables: dict[str, Any],
+        parse_result: bool,
+    ) -> Any:
+        """Render template with the variables of a value."""
+        compiled = self._compiled or self._ensure_compiled()
+
         try:
             render_result = _render_with_context(
                 self.template, compiled, **variables
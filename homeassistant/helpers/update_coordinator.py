@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Generator
+from collections.abc import Awaitable, Callable, Coroutine, Generator, Mapping
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
 from random import randint
@@ -26,15 +27,33 @@ from homeassistant.exceptions import (
     ConfigEntryNotReady,
 )
 from homeassistant.util.dt import utcnow
+from homeassistant.util.hass_dict import HassKey
 
 from . import entity, event
 from .debounce import Debouncer
 from .frame import report
+from .singleton import singleton
 from .typing import UNDEFINED, UndefinedType
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
 
+# Maximum number of scheduled refreshes that share the same second
+# before the polling scheduler moves new refreshes to a later second.
+POLLING_SLOT_CAPACITY = 10
+# Refreshes are only moved by up to this fraction of their update interval.
+POLLING_MAX_SPREAD_FRACTION = 0.25
+# Growth factor of the update interval when data did not change between
+# two scheduled refreshes of a coordinator with a max_update_interval.
+POLLING_BACKOFF_FACTOR = 1.5
+# The update interval of a coordinator with a max_update_interval is kept
+# at least this many times the duration of its last refresh.
+POLLING_SLOW_REFRESH_FACTOR = 2
+
+DATA_POLLING_SCHEDULER: HassKey[PollingScheduler] = HassKey(
+    "update_coordinator_polling_scheduler"
+)
+
 _DataT = TypeVar("_DataT", default=dict[str, Any])
 _DataUpdateCoordinatorT = TypeVar(
     "_DataUpdateCoordinatorT",
@@ -47,6 +66,78 @@ class UpdateFailed(Exception):
     """Raised when an update has failed."""
 
 
+@dataclass(slots=True)
+class CoordinatorStats:
+    """Refresh statistics of a DataUpdateCoordinator."""
+
+    refreshes: int = 0
+    failures: int = 0
+    skipped: int = 0
+    last_latency: float | None = None
+    total_latency: float = 0.0
+
+    @property
+    def average_latency(self) -> float | None:
+        """Return the average duration of a refresh in seconds."""
+        if not self.refreshes:
+            return None
+        return self.total_latency / self.refreshes
+
+    @property
+    def error_rate(self) -> float:
+        """Return the fraction of refreshes that failed."""
+        if not self.refreshes:
+            return 0.0
+        return self.failures / self.refreshes
+
+
+class PollingScheduler:
+    """Spread the scheduled refreshes of all coordinators over time.
+
+    Each coordinator reserves the second its next refresh falls in. When
+    a second is already crowded, the refresh is moved to the next second
+    with room to avoid waking up hundreds of coordinators at once.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the polling scheduler."""
+        self._slots: dict[int, int] = {}
+
+    @callback
+    def async_reserve(self, when: float, interval: float) -> float:
+        """Reserve a slot for a refresh and return when it should run."""
+        slots = self._slots
+        earliest = int(when)
+        best = earliest
+        for slot in range(
+            earliest, earliest + int(interval * POLLING_MAX_SPREAD_FRACTION) + 1
+        ):
+            count = slots.get(slot, 0)
+            if count < POLLING_SLOT_CAPACITY:
+                best = slot
+                break
+            if count < slots[best]:
+                best = slot
+        slots[best] = slots.get(best, 0) + 1
+        return when + best - earliest
+
+    @callback
+    def async_release(self, when: float) -> None:
+        """Release the slot reserved for a refresh."""
+        slot = int(when)
+        if count := self._slots[slot] - 1:
+            self._slots[slot] = count
+        else:
+            del self._slots[slot]
+
+
+@callback
+@singleton(DATA_POLLING_SCHEDULER)
+def async_get_polling_scheduler(hass: HomeAssistant) -> PollingScheduler:
+    """Get the polling scheduler."""
+    return PollingScheduler()
+
+
 class BaseDataUpdateCoordinatorProtocol(Protocol):
     """Base protocol type for DataUpdateCoordinator."""
 
@@ -63,6 +154,16 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Setting :attr:`max_update_interval` allows the coordinator to poll less
+    often, up to that interval, while data does not change or while the
+    source is slow to respond. This has the same ``__eq__`` requirement.
+
+    Setting :attr:`keyed_listeners` to ``True`` treats the context of each
+    listener as the key of the data it depends on. When data is updated,
+    only listeners whose ``data[context]`` changed are called back. Listeners
+    without a context follow :attr:`always_update`. This requires that the
+    data is a mapping and that its values implement ``__eq__``.
     """
 
     def __init__(
@@ -77,6 +178,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         setup_method: Callable[[], Awaitable[None]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        max_update_interval: timedelta | None = None,
+        keyed_listeners: bool = False,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -85,6 +188,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self.update_method = update_method
         self.setup_method = setup_method
         self._update_interval_seconds: float | None = None
+        self._polling_interval_seconds: float | None = None
+        self._max_update_interval_seconds = (
+            max_update_interval.total_seconds() if max_update_interval else None
+        )
         self.update_interval = update_interval
         self._shutdown_requested = False
         if config_entry is UNDEFINED:
@@ -94,6 +201,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         else:
             self.config_entry = config_entry
         self.always_update = always_update
+        self.keyed_listeners = keyed_listeners
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -110,10 +218,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
         self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
         self._unsub_refresh: CALLBACK_TYPE | None = None
+        self._scheduled_refresh: float | None = None
         self._unsub_shutdown: CALLBACK_TYPE | None = None
         self._request_refresh_task: asyncio.TimerHandle | None = None
+        self._polling_scheduler: PollingScheduler | None = None
         self.last_update_success = True
         self.last_exception: Exception | None = None
+        self.stats = CoordinatorStats()
 
         if request_refresh_debouncer is None:
             request_refresh_debouncer = Debouncer(
@@ -175,6 +286,25 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         for update_callback, _ in list(self._listeners.values()):
             update_callback()
 
+    @callback
+    def _async_update_keyed_listeners(self, previous_data: _DataT | None) -> None:
+        """Update the listeners whose data changed."""
+        data: Mapping[Any, Any] = self.data  # type: ignore[assignment]
+        previous: Mapping[Any, Any] = previous_data or {}  # type: ignore[assignment]
+        update_unkeyed = self.always_update or previous != data
+        changed: dict[Any, bool] = {}
+        for update_callback, context in list(self._listeners.values()):
+            if context is None:
+                if update_unkeyed:
+                    update_callback()
+                continue
+            if (key_changed := changed.get(context)) is None:
+                key_changed = changed[context] = previous.get(context) != data.get(
+                    context
+                )
+            if key_changed:
+                update_callback()
+
     async def async_shutdown(self) -> None:
         """Cancel any scheduled call, and ignore new runs."""
         self._shutdown_requested = True
@@ -199,6 +329,14 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._unsub_refresh:
             self._unsub_refresh()
             self._unsub_refresh = None
+            self._async_release_scheduled_refresh()
+
+    @callback
+    def _async_release_scheduled_refresh(self) -> None:
+        """Release the polling scheduler slot of the scheduled refresh."""
+        if self._scheduled_refresh is not None and self._polling_scheduler:
+            self._polling_scheduler.async_release(self._scheduled_refresh)
+            self._scheduled_refresh = None
 
     def _async_unsub_shutdown(self) -> None:
         """Cancel any scheduled call."""
@@ -216,11 +354,34 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         """Set interval between updates."""
         self._update_interval = value
         self._update_interval_seconds = value.total_seconds() if value else None
+        self._polling_interval_seconds = self._update_interval_seconds
+
+    @callback
+    def _async_adapt_polling_interval(self, latency: float, unchanged: bool) -> None:
+        """Adapt the polling interval to how the data and the source behave."""
+        if (
+            self._max_update_interval_seconds is None
+            or self._update_interval_seconds is None
+            or self._polling_interval_seconds is None
+        ):
+            return
+        if unchanged:
+            interval = self._polling_interval_seconds * POLLING_BACKOFF_FACTOR
+        else:
+            interval = self._update_interval_seconds
+        interval = max(
+            interval,
+            latency * POLLING_SLOW_REFRESH_FACTOR,
+            self._update_interval_seconds,
+        )
+        self._polling_interval_seconds = min(
+            interval, self._max_update_interval_seconds
+        )
 
     @callback
     def _schedule_refresh(self) -> None:
         """Schedule a refresh."""
-        if self._update_interval_seconds is None:
+        if self._polling_interval_seconds is None:
             return
 
         if self.config_entry and self.config_entry.pref_disable_polling:
@@ -235,9 +396,12 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # calling dt_util.utcnow() on every update.
         hass = self.hass
         loop = hass.loop
+        if (scheduler := self._polling_scheduler) is None:
+            scheduler = self._polling_scheduler = async_get_polling_scheduler(hass)
 
-        next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
+        self._scheduled_refresh = next_refresh = scheduler.async_reserve(
+            int(loop.time()) + self._microsecond + self._polling_interval_seconds,
+            self._polling_interval_seconds,
         )
         self._unsub_refresh = loop.call_at(
             next_refresh, self.__wrap_handle_refresh_interval
@@ -263,6 +427,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
+        self._async_release_scheduled_refresh()
         await self._async_refresh(log_failures=True, scheduled=True)
 
     async def async_request_refresh(self) -> None:
@@ -357,11 +522,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._debounced_refresh.async_cancel()
 
         if self._shutdown_requested or scheduled and self.hass.is_stopping:
+            self.stats.skipped += 1
             return
 
-        if log_timing := self.logger.isEnabledFor(logging.DEBUG):
-            start = monotonic()
-
+        start = monotonic()
         auth_failed = False
         previous_update_success = self.last_update_success
         previous_data = self.data
@@ -446,13 +610,27 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                 self.logger.info("Fetching %s data recovered", self.name)
 
         finally:
-            if log_timing:
+            latency = monotonic() - start
+            stats = self.stats
+            stats.refreshes += 1
+            stats.last_latency = latency
+            stats.total_latency += latency
+            if not self.last_update_success:
+                stats.failures += 1
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
                     "Finished fetching %s data in %.3f seconds (success: %s)",
                     self.name,
-                    monotonic() - start,  # pylint: disable=possibly-used-before-assignment
+                    latency,
                     self.last_update_success,
                 )
+            if self._max_update_interval_seconds is not None:
+                self._async_adapt_polling_interval(
+                    latency,
+                    self.last_update_success
+                    and previous_update_success
+                    and previous_data == self.data,
+                )
             if not auth_failed and self._listeners and not self.hass.is_stopping:
                 self._schedule_refresh()
 
@@ -461,11 +639,11 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if not self.last_update_success and not previous_update_success:
             return
 
-        if (
-            self.always_update
-            or self.last_update_success != previous_update_success
-            or previous_data != self.data
-        ):
+        if self.last_update_success != previous_update_success:
+            self.async_update_listeners()
+        elif self.keyed_listeners:
+            self._async_update_keyed_listeners(previous_data)
+        elif self.always_update or previous_data != self.data:
             self.async_update_listeners()
 
     @callback
@@ -492,8 +670,11 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._async_unsub_refresh()
         self._debounced_refresh.async_cancel()
 
+        previous_data = self.data
+        previous_update_success = self.last_update_success
         self.data = data
         self.last_update_success = True
+        self._polling_interval_seconds = self._update_interval_seconds
         self.logger.debug(
             "Manually updated %s data",
             self.name,
@@ -502,7 +683,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._listeners:
             self._schedule_refresh()
 
-        self.async_update_listeners()
+        if self.keyed_listeners and previous_update_success:
+            self._async_update_keyed_listeners(previous_data)
+        else:
+            self.async_update_listeners()
 
 
 class TimestampDataUpdateCoordinator(DataUpdateCoordinator[_DataT]):
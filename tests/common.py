@@ -21,6 +21,7 @@ from functools import lru_cache
 from io import StringIO
 import json
 import logging
+import math
 import os
 import pathlib
 import time
@@ -492,6 +493,23 @@ def _async_fire_time_changed(
     hass: HomeAssistant, utc_datetime: datetime | None, fire_all: bool
 ) -> None:
     timestamp = dt_util.utc_to_timestamp(utc_datetime)
+    if wheel := hass.data.get(event._TIMER_WHEEL):
+        # Timers of the wheel are scheduled per slot, run them by their due time
+        with (
+            patch(
+                "homeassistant.helpers.event.time_tracker_utcnow",
+                return_value=utc_datetime,
+            ),
+            patch(
+                "homeassistant.helpers.event.time_tracker_timestamp",
+                return_value=timestamp,
+            ),
+        ):
+            wheel.async_run_due(
+                math.inf
+                if fire_all
+                else hass.loop.time() + _MONOTONIC_RESOLUTION + timestamp - time.time(),
+            )
     for task in list(get_scheduled_timer_handles(hass.loop)):
         if not isinstance(task, asyncio.TimerHandle):
             continue
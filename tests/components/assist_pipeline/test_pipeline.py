@@ -1,5 +1,6 @@
 """Websocket tests for Voice Assistant integration."""
 
+import array
 from collections.abc import AsyncGenerator
 from typing import Any
 from unittest.mock import ANY, patch
@@ -16,6 +17,7 @@ from homeassistant.components.assist_pipeline.pipeline import (
     PipelineData,
     PipelineStorageCollection,
     PipelineStore,
+    _multiply_volume,
     async_create_default_pipeline,
     async_get_pipeline,
     async_get_pipelines,
@@ -655,3 +657,17 @@ async def test_migrate_after_load(hass: HomeAssistant) -> None:
 
     assert pipeline_updated.stt_engine == "stt.test"
     assert pipeline_updated.tts_engine == "tts.test"
+
+
+def test_multiply_volume() -> None:
+    """Test multiplying 16-bit samples by a constant with clamping."""
+    samples = array.array("h", [0, 100, -100, 20000, -20000])
+    assert array.array("h", _multiply_volume(samples.tobytes(), 2.0)) == array.array(
+        "h", [0, 200, -200, 32767, -32768]
+    )
+
+    # Results are floored, negative values with a fraction round down
+    samples = array.array("h", [3, -3, 7, -7])
+    assert array.array("h", _multiply_volume(samples.tobytes(), 1.5)) == array.array(
+        "h", [4, -5, 10, -11]
+    )
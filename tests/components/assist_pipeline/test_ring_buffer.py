@@ -37,3 +37,14 @@ def test_ring_buffer_put_too_large() -> None:
     assert len(rb) == 10
     assert rb.pos == 2
     assert rb.getvalue() == bytes([3, 4, 5, 6, 7, 8, 9, 10, 11, 12])
+
+
+def test_ring_buffer_put_memoryview() -> None:
+    """Test putting a view of the data past the end of the buffer."""
+    rb = RingBuffer(10)
+    data = bytes(range(1, 13))
+    rb.put(memoryview(data)[:5])
+    rb.put(memoryview(data)[5:])
+    assert len(rb) == 10
+    assert rb.pos == 2
+    assert rb.getvalue() == bytes([3, 4, 5, 6, 7, 8, 9, 10, 11, 12])
@@ -40,7 +40,7 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import condition, device_registry as dr, trace
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.script import (
     SCRIPT_MODE_CHOICES,
@@ -322,6 +322,49 @@ async def test_two_conditions_with_and(
     assert len(calls) == 1
 
 
+async def test_conditions_checked_cheapest_first(
+    hass: HomeAssistant, calls: list[ServiceCall]
+) -> None:
+    """Test traced automation runs check cheap conditions first."""
+    entity_id = "test.entity"
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "triggers": [{"platform": "event", "event_type": "test_event"}],
+                "conditions": [
+                    "{{ states('test.entity') | int > 50 }}",
+                    {"condition": "state", "entity_id": entity_id, "state": "100"},
+                ],
+                "actions": {"action": "test.automation"},
+            }
+        },
+    )
+    async_template = condition.async_template
+    traced: list[bool] = []
+
+    def _async_template(*args: Any, **kwargs: Any) -> bool:
+        traced.append(trace.trace_cv.get() is not None)
+        return async_template(*args, **kwargs)
+
+    with patch(
+        "homeassistant.helpers.condition.async_template", side_effect=_async_template
+    ):
+        # The state condition is false, the template is not rendered
+        hass.states.async_set(entity_id, 101)
+        hass.bus.async_fire("test_event")
+        await hass.async_block_till_done()
+        assert len(calls) == 0
+        assert traced == []
+
+        hass.states.async_set(entity_id, 100)
+        hass.bus.async_fire("test_event")
+        await hass.async_block_till_done()
+        assert len(calls) == 1
+        assert traced == [True]
+
+
 async def test_shorthand_conditions_template(
     hass: HomeAssistant, calls: list[ServiceCall]
 ) -> None:
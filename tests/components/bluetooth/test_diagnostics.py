@@ -165,6 +165,7 @@ async def test_diagnostics(
                 },
                 "all_history": [],
                 "connectable_history": [],
+                "delivered_advertisements": {},
                 "scanners": [
                     {
                         "adapter": "hci0",
@@ -366,6 +367,7 @@ async def test_diagnostics_macos(
                         "tx_power": -127,
                     }
                 ],
+                "delivered_advertisements": {"44:44:33:11:23:45": 1},
                 "scanners": [
                     {
                         "adapter": "Core Bluetooth",
@@ -560,6 +562,7 @@ async def test_diagnostics_remote_adapter(
                         "tx_power": -127,
                     }
                 ],
+                "delivered_advertisements": {"44:44:33:11:23:45": 1},
                 "scanners": [
                     {
                         "adapter": "hci0",
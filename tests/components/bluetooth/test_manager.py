@@ -410,6 +410,41 @@ async def test_switching_adapters_based_on_stale_with_discovered_interval(
     )
 
 
+@pytest.mark.usefixtures("enable_bluetooth")
+async def test_delivered_advertisements_only_count_changes(
+    hass: HomeAssistant,
+    register_hci0_scanner: None,
+) -> None:
+    """Test only advertisements with changed data are delivered and counted."""
+    address = "44:44:33:11:23:45"
+    manager = _get_manager()
+    switchbot_device = generate_ble_device(address, "wohand")
+    switchbot_adv = generate_advertisement_data(
+        local_name="wohand", manufacturer_data={1: b"\x01"}, rssi=-60
+    )
+    inject_advertisement_with_source(hass, switchbot_device, switchbot_adv, "hci0")
+    # Only the rssi changed
+    switchbot_adv_rssi = generate_advertisement_data(
+        local_name="wohand", manufacturer_data={1: b"\x01"}, rssi=-80
+    )
+    inject_advertisement_with_source(hass, switchbot_device, switchbot_adv_rssi, "hci0")
+    diagnostics = await manager.async_diagnostics()
+    assert diagnostics["delivered_advertisements"] == {address: 1}
+
+    switchbot_adv_changed = generate_advertisement_data(
+        local_name="wohand", manufacturer_data={1: b"\x02"}, rssi=-80
+    )
+    inject_advertisement_with_source(
+        hass, switchbot_device, switchbot_adv_changed, "hci0"
+    )
+    diagnostics = await manager.async_diagnostics()
+    assert diagnostics["delivered_advertisements"] == {address: 2}
+
+    manager._address_disappeared(address)
+    diagnostics = await manager.async_diagnostics()
+    assert diagnostics["delivered_advertisements"] == {}
+
+
 @pytest.mark.usefixtures("one_adapter")
 async def test_restore_history_from_dbus(
     hass: HomeAssistant, disable_new_discovery_flows
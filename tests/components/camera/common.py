@@ -22,4 +22,5 @@ def mock_turbo_jpeg(
     ]
     mocked_turbo_jpeg.scale_with_quality.return_value = EMPTY_8_6_JPEG
     mocked_turbo_jpeg.encode.return_value = EMPTY_8_6_JPEG
+    mocked_turbo_jpeg.encode_from_yuv.return_value = EMPTY_8_6_JPEG
     return mocked_turbo_jpeg
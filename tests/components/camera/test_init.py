@@ -1,15 +1,18 @@
 """The tests for the camera component."""
 
+import asyncio
 from collections.abc import Generator
 from http import HTTPStatus
 import io
 from types import ModuleType
 from unittest.mock import AsyncMock, Mock, PropertyMock, mock_open, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import camera
 from homeassistant.components.camera.const import (
+    CAMERA_IMAGE_CACHE_TTL,
     DOMAIN,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
@@ -174,6 +177,45 @@ async def test_get_image_from_camera_not_jpeg(hass: HomeAssistant) -> None:
     assert image.content == b"png"
 
 
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_shares_fetches(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test concurrent and repeated requests share the camera fetch."""
+    release = asyncio.Event()
+
+    async def _camera_image(
+        width: int | None = None, height: int | None = None
+    ) -> bytes:
+        await release.wait()
+        return b"Test"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=_camera_image,
+    ) as mock_camera_image:
+        requests = [
+            hass.async_create_task(camera.async_get_image(hass, "camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        images = await asyncio.gather(*requests)
+        assert [image.content for image in images] == [b"Test"] * 3
+        assert mock_camera_image.call_count == 1
+
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"Test"
+        assert mock_camera_image.call_count == 1
+
+        await camera.async_get_image(hass, "camera.demo_camera", width=640, height=480)
+        assert mock_camera_image.call_count == 2
+
+        freezer.tick(CAMERA_IMAGE_CACHE_TTL)
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_camera_image.call_count == 3
+
+
 @pytest.mark.usefixtures("mock_camera")
 async def test_get_stream_source_from_camera(
     hass: HomeAssistant, mock_stream_source: AsyncMock
@@ -417,6 +417,26 @@ async def test_trigger_sentences(hass: HomeAssistant) -> None:
     assert len(callback.mock_calls) == 0
 
 
+@pytest.mark.usefixtures("init_components")
+async def test_prepare_before_recognition(hass: HomeAssistant) -> None:
+    """Test that preparing the agent does the work that doesn't need the text."""
+    agent = hass.data[DATA_DEFAULT_ENTITY]
+    assert isinstance(agent, default_agent.DefaultAgent)
+
+    agent.register_trigger(["It's party time"], AsyncMock(return_value="Cowabunga!"))
+    assert agent._trigger_intents is None
+
+    await agent.async_prepare(hass.config.language)
+
+    # Trigger intents are rebuilt and sentence templates are already parsed
+    assert agent._trigger_intents is not None
+    lang_intents = await agent.async_get_or_load_intents(hass.config.language)
+    assert lang_intents is not None
+    for intent_obj in lang_intents.intents.intents.values():
+        for intent_data in intent_obj.data:
+            assert "sentences" in intent_data.__dict__
+
+
 @pytest.mark.usefixtures("init_components", "sl_setup")
 async def test_shopping_list_add_item(hass: HomeAssistant) -> None:
     """Test adding an item to the shopping list through the default agent."""
@@ -1706,6 +1726,168 @@ async def test_empty_aliases(
         assert floors.values[0].text_in.text == floor_1.name
 
 
+@pytest.mark.usefixtures("init_components")
+async def test_all_names_list_prebuilt(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test that the fallback list of all entity names is built with slot lists."""
+    exposed_light = entity_registry.async_get_or_create("light", "demo", "1234")
+    exposed_light = entity_registry.async_update_entity(
+        exposed_light.entity_id, name="exposed light", aliases={"ceiling"}
+    )
+    hass.states.async_set(
+        exposed_light.entity_id,
+        "on",
+        attributes={ATTR_FRIENDLY_NAME: exposed_light.name},
+    )
+
+    unexposed_light = entity_registry.async_get_or_create("light", "demo", "5678")
+    unexposed_light = entity_registry.async_update_entity(
+        unexposed_light.entity_id, name="unexposed light"
+    )
+    hass.states.async_set(
+        unexposed_light.entity_id,
+        "on",
+        attributes={ATTR_FRIENDLY_NAME: unexposed_light.name},
+    )
+
+    hidden_light = entity_registry.async_get_or_create("light", "demo", "9012")
+    hidden_light = entity_registry.async_update_entity(
+        hidden_light.entity_id,
+        name="hidden light",
+        hidden_by=er.RegistryEntryHider.USER,
+    )
+    hass.states.async_set(
+        hidden_light.entity_id, "on", attributes={ATTR_FRIENDLY_NAME: hidden_light.name}
+    )
+
+    expose_entity(hass, exposed_light.entity_id, True)
+    expose_entity(hass, unexposed_light.entity_id, False)
+    expose_entity(hass, hidden_light.entity_id, False)
+
+    with patch(
+        "homeassistant.components.conversation.default_agent.DefaultAgent._recognize",
+        return_value=None,
+    ) as mock_recognize:
+        for _ in range(2):
+            await conversation.async_converse(
+                hass, "turn on unexposed light", None, Context(), None
+            )
+
+    # Slot lists are only built once for both requests
+    assert mock_recognize.call_count == 2
+    all_names = mock_recognize.call_args_list[0][0][5]
+    assert mock_recognize.call_args_list[1][0][5] is all_names
+
+    names = {value.text_in.text for value in all_names.values}
+    assert {"ceiling", "exposed light", "unexposed light"} <= names
+    assert "hidden light" not in names
+
+
+@pytest.mark.usefixtures("init_components")
+async def test_slot_lists_updated_incrementally(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test that entity changes only update the names of that entity."""
+    area_kitchen = area_registry.async_get_or_create("kitchen")
+    kitchen_light = entity_registry.async_get_or_create("light", "demo", "1234")
+    kitchen_light = entity_registry.async_update_entity(
+        kitchen_light.entity_id, name="kitchen light"
+    )
+    hass.states.async_set(
+        kitchen_light.entity_id, "on", attributes={ATTR_FRIENDLY_NAME: "kitchen light"}
+    )
+    hass.states.async_set(
+        "light.bedroom", "on", attributes={ATTR_FRIENDLY_NAME: "bedroom light"}
+    )
+    await hass.async_block_till_done()
+
+    agent = hass.data[DATA_DEFAULT_ENTITY]
+    slot_lists = agent._make_slot_lists()
+
+    def get_names(slot_lists: dict[str, Any]) -> list[str]:
+        return [value.value_out for value in slot_lists["name"].values]
+
+    assert {"kitchen light", "bedroom light"} <= set(get_names(slot_lists))
+
+    with patch.object(
+        agent, "_make_entity_names", wraps=agent._make_entity_names
+    ) as mock_make_entity_names:
+        # Alias added
+        entity_registry.async_update_entity(
+            kitchen_light.entity_id, aliases={"stove light"}
+        )
+        # Entity added
+        hass.states.async_set(
+            "light.garage", "on", attributes={ATTR_FRIENDLY_NAME: "garage light"}
+        )
+        # Entity removed
+        hass.states.async_remove("light.bedroom")
+        # Area renamed
+        area_registry.async_update(area_kitchen.id, name="cooking room")
+        await hass.async_block_till_done()
+
+        slot_lists = agent._make_slot_lists()
+
+    assert [
+        call.args[0].entity_id for call in mock_make_entity_names.call_args_list
+    ] == [kitchen_light.entity_id, "light.garage"]
+
+    names = get_names(slot_lists)
+    assert {"stove light", "kitchen light", "garage light"} <= set(names)
+    assert "bedroom light" not in names
+    assert [value.value_out for value in slot_lists["area"].values] == ["cooking room"]
+
+    # Same result as a full rebuild
+    agent._async_clear_slot_list()
+    assert get_names(agent._make_slot_lists()) == names
+
+
+@pytest.mark.usefixtures("init_components")
+async def test_slot_lists_entity_renamed(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test a rename is picked up from the state written after the registry update."""
+    kitchen_light = entity_registry.async_get_or_create("light", "demo", "1234")
+    hass.states.async_set(
+        kitchen_light.entity_id, "on", attributes={ATTR_FRIENDLY_NAME: "kitchen light"}
+    )
+    await hass.async_block_till_done()
+
+    agent = hass.data[DATA_DEFAULT_ENTITY]
+
+    def get_names() -> list[str]:
+        return [value.value_out for value in agent._make_slot_lists()["name"].values]
+
+    assert "kitchen light" in get_names()
+
+    # The registry update is handled before the entity writes its new name
+    entity_registry.async_update_entity(kitchen_light.entity_id, name="oven light")
+    await hass.async_block_till_done()
+    hass.states.async_set(
+        kitchen_light.entity_id, "on", attributes={ATTR_FRIENDLY_NAME: "oven light"}
+    )
+    await hass.async_block_till_done()
+
+    names = get_names()
+    assert "oven light" in names
+    assert "kitchen light" not in names
+
+    # Later state changes don't update the names again
+    with patch.object(
+        agent, "_make_entity_names", wraps=agent._make_entity_names
+    ) as mock_make_entity_names:
+        hass.states.async_set(
+            kitchen_light.entity_id,
+            "off",
+            attributes={ATTR_FRIENDLY_NAME: "oven light"},
+        )
+        await hass.async_block_till_done()
+    assert mock_make_entity_names.call_count == 0
+
+
 @pytest.mark.usefixtures("init_components")
 async def test_all_domains_loaded(hass: HomeAssistant) -> None:
     """Test that sentences for all domains are always loaded."""
@@ -273,6 +273,30 @@ async def test_registered_devices(
     )
 
 
+def test_index_integration_matchers_compiles_hostnames() -> None:
+    """Test hostname patterns are compiled when the matchers are indexed."""
+    integration_matchers = dhcp.async_index_integration_matchers(
+        [
+            {"domain": "mock-domain", "hostname": "connect*"},
+            {"domain": "mock-domain", "hostname": "nomatch*", "macaddress": "B8B7F1*"},
+            {"domain": "other-domain", "macaddress": "B8B7F1*"},
+            {"domain": "registered-domain", "registered_devices": True},
+        ]
+    )
+    assert integration_matchers.registered_devices_domains == {"registered-domain"}
+    (hostname_matcher,) = integration_matchers.no_oui_matchers["c"]
+    assert hostname_matcher.domain == "mock-domain"
+    assert hostname_matcher.hostname.match("connect-1")
+    assert not hostname_matcher.hostname.match("disconnect")
+    oui_matchers = integration_matchers.oui_matchers["B8B7F1"]
+    assert [matcher.domain for matcher in oui_matchers] == [
+        "mock-domain",
+        "other-domain",
+    ]
+    assert oui_matchers[0].hostname.match("nomatch-1")
+    assert oui_matchers[1].hostname is None
+
+
 async def test_dhcp_match_hostname(hass: HomeAssistant) -> None:
     """Test matching based on hostname only."""
     integration_matchers = dhcp.async_index_integration_matchers(
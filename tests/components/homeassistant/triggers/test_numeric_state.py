@@ -2004,3 +2004,193 @@ async def test_template_variable(
         assert len(service_calls) == 1
     else:
         assert len(service_calls) == 0
+
+
+async def test_shared_matcher(
+    hass: HomeAssistant, service_calls: list[ServiceCall]
+) -> None:
+    """Test automations with the same numeric state trigger share a matcher."""
+    hass.states.async_set("test.entity", 11)
+    await hass.async_block_till_done()
+
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "numeric_state",
+                        "entity_id": "test.entity",
+                        "below": 10,
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data": {"id": index},
+                    },
+                }
+                for index in range(3)
+            ]
+            + [
+                {
+                    "trigger": {
+                        "platform": "numeric_state",
+                        "entity_id": "test.entity",
+                        "value_template": "{{ state.state | float * 2 }}",
+                        "below": 10,
+                    },
+                    "action": {"service": "test.automation", "data": {"id": 3}},
+                }
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    indexes = hass.data[numeric_state_trigger.DATA_NUMERIC_STATE_INDEXES]
+    assert len(indexes["test.entity"].matchers) == 2
+
+    with patch(
+        "homeassistant.helpers.condition.async_numeric_state",
+        wraps=numeric_state_trigger.condition.async_numeric_state,
+    ) as mock_numeric_state:
+        hass.states.async_set("test.entity", 9)
+        await hass.async_block_till_done()
+    # Evaluated once for the shared matcher and once for the template trigger
+    assert mock_numeric_state.call_count == 2
+    assert sorted(call.data["id"] for call in service_calls) == [0, 1, 2]
+
+    hass.states.async_set("test.entity", 4)
+    await hass.async_block_till_done()
+    assert len(service_calls) == 4
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert not indexes
+
+
+async def test_threshold_index(
+    hass: HomeAssistant, service_calls: list[ServiceCall]
+) -> None:
+    """Test only triggers with a crossed threshold are evaluated."""
+    hass.states.async_set("test.entity", 0)
+    await hass.async_block_till_done()
+
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "numeric_state",
+                        "entity_id": "test.entity",
+                        "above": threshold,
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data": {"id": threshold},
+                    },
+                }
+                for threshold in range(0, 100, 10)
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.helpers.condition.async_numeric_state",
+        wraps=numeric_state_trigger.condition.async_numeric_state,
+    ) as mock_numeric_state:
+        # The first state change evaluates all triggers
+        hass.states.async_set("test.entity", 5)
+        await hass.async_block_till_done()
+        assert mock_numeric_state.call_count == 10
+        assert [call.data["id"] for call in service_calls] == [0]
+
+        mock_numeric_state.reset_mock()
+        hass.states.async_set("test.entity", 6)
+        await hass.async_block_till_done()
+        assert mock_numeric_state.call_count == 0
+
+        hass.states.async_set("test.entity", 25)
+        await hass.async_block_till_done()
+        assert mock_numeric_state.call_count == 2
+        assert [call.data["id"] for call in service_calls] == [0, 10, 20]
+
+        mock_numeric_state.reset_mock()
+        hass.states.async_set("test.entity", 20)
+        await hass.async_block_till_done()
+        assert mock_numeric_state.call_count == 1
+
+        mock_numeric_state.reset_mock()
+        hass.states.async_set("test.entity", 21)
+        await hass.async_block_till_done()
+        assert mock_numeric_state.call_count == 1
+        assert [call.data["id"] for call in service_calls] == [0, 10, 20, 20]
+
+        # Non-numeric states evaluate all triggers
+        mock_numeric_state.reset_mock()
+        hass.states.async_set("test.entity", STATE_UNAVAILABLE)
+        await hass.async_block_till_done()
+        assert mock_numeric_state.call_count == 10
+
+        mock_numeric_state.reset_mock()
+        hass.states.async_set("test.entity", 95)
+        await hass.async_block_till_done()
+        assert mock_numeric_state.call_count == 10
+        assert len(service_calls) == 14
+
+
+async def test_attach_trigger_string_entity_id(hass: HomeAssistant) -> None:
+    """Test attaching a trigger with an unvalidated string entity_id."""
+    calls = []
+    hass.states.async_set("test.entity", 11)
+
+    unsub = await numeric_state_trigger.async_attach_trigger(
+        hass,
+        {"platform": "numeric_state", "entity_id": "test.entity", "below": 10},
+        lambda run_variables, context: calls.append(run_variables),
+        {"trigger_data": {}, "variables": {}, "name": "test"},
+    )
+
+    hass.states.async_set("test.entity", 9)
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert calls[0]["trigger"]["entity_id"] == "test.entity"
+
+    unsub()
+    assert not hass.data[numeric_state_trigger.DATA_NUMERIC_STATE_INDEXES]
+
+
+async def test_shared_matcher_outlives_trigger(hass: HomeAssistant) -> None:
+    """Test a shared matcher does not depend on the trigger which created it."""
+    calls = []
+    hass.states.async_set("test.entity", 11)
+    config = {"platform": "numeric_state", "entity_id": ["test.entity"], "below": 10}
+
+    unsub_first = await numeric_state_trigger.async_attach_trigger(
+        hass,
+        config,
+        lambda run_variables, context: calls.append("first"),
+        {"trigger_data": {}, "variables": {"first": True}, "name": "first"},
+    )
+    unsub_second = await numeric_state_trigger.async_attach_trigger(
+        hass,
+        config,
+        lambda run_variables, context: calls.append("second"),
+        {"trigger_data": {}, "variables": {}, "name": "second"},
+    )
+    unsub_first()
+
+    index = hass.data[numeric_state_trigger.DATA_NUMERIC_STATE_INDEXES]["test.entity"]
+    (matcher,) = index.matchers.values()
+    assert matcher._check.func is numeric_state_trigger._async_check_thresholds
+
+    hass.states.async_set("test.entity", 9)
+    await hass.async_block_till_done()
+    assert calls == ["second"]
+    unsub_second()
@@ -1771,3 +1771,79 @@ async def test_variables_priority(
     await hass.async_block_till_done()
     assert len(service_calls) == 2
     assert service_calls[1].data["some"] == "test.entity_2 - 0:00:10"
+
+
+async def test_shared_matcher(
+    hass: HomeAssistant, service_calls: list[ServiceCall]
+) -> None:
+    """Test automations with the same state trigger share a matcher."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "to": ["world", "planet"],
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data": {"id": index},
+                    },
+                }
+                for index in range(3)
+            ]
+            + [
+                {
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "to": "planet",
+                    },
+                    "action": {"service": "test.automation", "data": {"id": 3}},
+                }
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    matchers = hass.data[state_trigger.DATA_STATE_MATCHERS]
+    assert len(matchers) == 2
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    assert sorted(call.data["id"] for call in service_calls) == [0, 1, 2]
+
+    hass.states.async_set("test.entity", "planet")
+    await hass.async_block_till_done()
+    assert len(service_calls) == 7
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert not matchers
+
+
+async def test_attach_trigger_string_entity_id(hass: HomeAssistant) -> None:
+    """Test attaching a trigger with an unvalidated string entity_id."""
+    calls = []
+
+    unsub = await state_trigger.async_attach_trigger(
+        hass,
+        {"platform": "state", "entity_id": "test.entity", "to": "world"},
+        lambda run_variables, context: calls.append(run_variables),
+        {"trigger_data": {}, "variables": {}, "name": "test"},
+    )
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert calls[0]["trigger"]["entity_id"] == "test.entity"
+
+    unsub()
+    assert not hass.data[state_trigger.DATA_STATE_MATCHERS]
@@ -1,12 +1,14 @@
 """The tests for http static files."""
 
+import gzip
 from http import HTTPStatus
 from pathlib import Path
+from unittest.mock import patch
 
 from aiohttp.test_utils import TestClient
 import pytest
 
-from homeassistant.components.http import StaticPathConfig
+from homeassistant.components.http import StaticPathConfig, static
 from homeassistant.components.http.static import CachingStaticResource
 from homeassistant.const import EVENT_HOMEASSISTANT_START
 from homeassistant.core import HomeAssistant
@@ -63,3 +65,89 @@ async def test_async_register_static_paths(
     assert resp.status == HTTPStatus.OK
     resp = await client.get("/something_else/__init__.py")
     assert resp.status == HTTPStatus.OK
+
+
+async def test_static_resource_hashed_files_from_memory(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test small hashed files are served from memory."""
+    app = hass.http.app
+
+    resource = CachingStaticResource("/assets", tmp_path, memory_cache=True)
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+
+    content = "console.log('hello');" * 10
+    (tmp_path / "app.0123456789abcdef.js").write_text(content)
+    (tmp_path / "app.0123456789abcdef.js.gz").write_bytes(
+        gzip.compress(content.encode())
+    )
+    (tmp_path / "large.0123456789abcdef.js").write_bytes(
+        b"x" * (static.MEMORY_CACHE_MAX_FILE_SIZE + 1)
+    )
+
+    with patch.object(
+        static, "_read_small_file", wraps=static._read_small_file
+    ) as mock_read:
+        for _ in range(3):
+            resp = await mock_http_client.get(
+                "/assets/app.0123456789abcdef.js", headers={"Accept-Encoding": "gzip"}
+            )
+            assert resp.status == HTTPStatus.OK
+            assert resp.headers["Content-Encoding"] == "gzip"
+            assert resp.headers["Cache-Control"] == static.CACHE_HEADER
+            assert resp.content_type == "text/javascript"
+            assert await resp.text() == content
+
+        # First request resolves the path, the second reads the file
+        assert mock_read.call_count == 1
+
+        # Uncompressed variant
+        resp = await mock_http_client.get(
+            "/assets/app.0123456789abcdef.js", headers={"Accept-Encoding": "identity"}
+        )
+        assert resp.status == HTTPStatus.OK
+        assert "Content-Encoding" not in resp.headers
+        assert await resp.text() == content
+        etag = resp.headers["ETag"]
+
+        resp = await mock_http_client.get(
+            "/assets/app.0123456789abcdef.js",
+            headers={"Accept-Encoding": "identity", "If-None-Match": etag},
+        )
+        assert resp.status == HTTPStatus.NOT_MODIFIED
+        assert mock_read.call_count == 2
+
+        # Large files are streamed from disk
+        for _ in range(2):
+            resp = await mock_http_client.get("/assets/large.0123456789abcdef.js")
+            assert resp.status == HTTPStatus.OK
+            assert len(await resp.read()) == static.MEMORY_CACHE_MAX_FILE_SIZE + 1
+        assert mock_read.call_count == 3
+
+
+async def test_static_resource_memory_cache_opt_in(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test files are only served from memory by resources which opt in."""
+    await hass.http.async_register_static_paths(
+        [StaticPathConfig("/local", str(tmp_path))]
+    )
+
+    snapshot = tmp_path / "snapshot.20241019.jpg"
+    snapshot.write_bytes(b"old")
+    with patch.object(
+        static, "_read_small_file", wraps=static._read_small_file
+    ) as mock_read:
+        for _ in range(2):
+            resp = await mock_http_client.get("/local/snapshot.20241019.jpg")
+            assert resp.status == HTTPStatus.OK
+            assert await resp.read() == b"old"
+
+        # An overwritten file is served with its new content
+        snapshot.write_bytes(b"new")
+        resp = await mock_http_client.get("/local/snapshot.20241019.jpg")
+        assert resp.status == HTTPStatus.OK
+        assert await resp.read() == b"new"
+
+    assert mock_read.call_count == 0
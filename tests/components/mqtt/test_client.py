@@ -629,6 +629,40 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert recorded_calls[0].payload == "test-payload"
 
 
+async def test_subscribe_overlapping_wildcard_topics(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test overlapping wildcard subscriptions are matched and removed."""
+    await mqtt_mock_entry()
+    unsub_level = await mqtt.async_subscribe(hass, "test-topic/+/state", record_calls)
+    unsub_subtree = await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    await mqtt.async_subscribe(hass, "#", record_calls)
+
+    async_fire_mqtt_message(hass, "test-topic/bier/state", "test-payload")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 3
+
+    recorded_calls.clear()
+    unsub_level()
+    async_fire_mqtt_message(hass, "test-topic/bier/state", "test-payload")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 2
+
+    recorded_calls.clear()
+    unsub_subtree()
+    async_fire_mqtt_message(hass, "test-topic/bier/state", "test-payload")
+    async_fire_mqtt_message(hass, "$SYS/broker/uptime", "test-payload")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 1
+    assert recorded_calls[0].topic == "test-topic/bier/state"
+
+    with pytest.raises(HomeAssistantError):
+        unsub_subtree()
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
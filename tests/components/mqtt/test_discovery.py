@@ -619,6 +619,44 @@ async def test_rediscover(
     assert state is not None
 
 
+async def test_unchanged_discovery_payload_ignored(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a re-published unchanged discovery payload is ignored."""
+    await mqtt_mock_entry()
+    config = '{ "name": "Beer", "state_topic": "test-topic" }'
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", config)
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is not None
+
+    with patch(
+        "homeassistant.components.mqtt.discovery.json_loads_object"
+    ) as json_loads_mock:
+        async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", config)
+        await hass.async_block_till_done()
+    assert not json_loads_mock.called
+    assert "Ignoring unchanged discovery payload for: binary_sensor bla" in caplog.text
+
+    # A changed payload is still processed
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Milk", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer").name == "Milk"
+
+    # The original payload is processed again after the component was removed
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", "")
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is None
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", config)
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is not None
+
+
 async def test_rapid_rediscover(
     hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
 ) -> None:
@@ -111,6 +111,52 @@ async def test_setting_sensor_value_via_mqtt_message(
     assert state.attributes.get("unit_of_measurement") == "fav unit"
 
 
+@pytest.mark.parametrize(
+    "hass_config",
+    [
+        {
+            mqtt.DOMAIN: {
+                sensor.DOMAIN: [
+                    {
+                        "name": "temperature",
+                        "state_topic": "test-topic",
+                        "value_template": "{{ value_json.temperature }}",
+                    },
+                    {
+                        "name": "humidity",
+                        "state_topic": "test-topic",
+                        "value_template": "{{ value_json.humidity }}",
+                    },
+                ]
+            }
+        }
+    ],
+)
+async def test_setting_sensor_values_share_payload_json(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test sensors on the same topic parse the JSON payload once."""
+    await mqtt_mock_entry()
+
+    with patch(
+        "homeassistant.components.mqtt.models.json_loads",
+        wraps=mqtt.models.json_loads,
+    ) as json_loads_mock:
+        async_fire_mqtt_message(
+            hass, "test-topic", '{"temperature": 21.5, "humidity": 40}'
+        )
+        await hass.async_block_till_done()
+
+    assert json_loads_mock.call_count == 1
+    assert hass.states.get("sensor.temperature").state == "21.5"
+    assert hass.states.get("sensor.humidity").state == "40"
+
+    async_fire_mqtt_message(hass, "test-topic", '{"temperature": 22, "humidity": 41}')
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.temperature").state == "22"
+    assert hass.states.get("sensor.humidity").state == "41"
+
+
 @pytest.mark.parametrize(
     "hass_config",
     [
@@ -432,6 +432,100 @@ async def test_hls_max_segments(
     await stream.stop()
 
 
+async def test_hls_segment_memory_limit(
+    hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
+) -> None:
+    """Test old segments are dropped when segments exceed the memory limit."""
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+
+    hls_client = await hls_stream(stream)
+
+    with patch(
+        "homeassistant.components.stream.core.SEGMENT_MEMORY_LIMIT",
+        2 * len(FAKE_PAYLOAD),
+    ):
+        for sequence in range(MAX_SEGMENTS):
+            segment = Segment(sequence=sequence, init=INIT_BYTES)
+            hls.put(segment)
+            await hass.async_block_till_done()
+            segment.async_add_part(
+                Part(duration=1, has_keyframe=True, data=FAKE_PAYLOAD), 0
+            )
+            segment.async_add_part(
+                Part(duration=1, has_keyframe=False, data=FAKE_PAYLOAD),
+                SEGMENT_DURATION,
+            )
+
+    # Segments listed in the playlist are kept
+    assert hls.sequences == list(
+        range(MAX_SEGMENTS - NUM_PLAYLIST_SEGMENTS - 1, MAX_SEGMENTS)
+    )
+
+    # Complete segments are joined once and their parts are views of that data
+    segment = hls.get_segment(MAX_SEGMENTS - 1)
+    assert segment.get_data() == FAKE_PAYLOAD * 2
+    assert isinstance(segment.parts[1].data, memoryview)
+
+    segment_response = await hls_client.get(f"/segment/{MAX_SEGMENTS - 1}.m4s")
+    assert segment_response.status == HTTPStatus.OK
+    assert await segment_response.read() == FAKE_PAYLOAD * 2
+
+    stream_worker_sync.resume()
+    await stream.stop()
+
+
+async def test_hls_segment_memory_limit_streams(
+    hass: HomeAssistant, setup_component
+) -> None:
+    """Test the segment memory limit is shared by the outputs of all streams."""
+    streams = [
+        create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+        for _ in range(3)
+    ]
+    first, second, third = (stream.add_provider(HLS_PROVIDER) for stream in streams)
+    payload = FAKE_PAYLOAD * 2
+
+    def _segment(sequence: int, seconds: int) -> Segment:
+        return Segment(
+            sequence=sequence,
+            init=INIT_BYTES,
+            start_time=FAKE_TIME + timedelta(seconds=seconds),
+            duration=SEGMENT_DURATION,
+            parts=[Part(duration=SEGMENT_DURATION, has_keyframe=True, data=payload)],
+        )
+
+    with patch(
+        "homeassistant.components.stream.core.SEGMENT_MEMORY_LIMIT",
+        7 * len(payload),
+    ):
+        # The same segments are held by two outputs, they are counted once
+        for sequence in range(MAX_SEGMENTS):
+            segment = _segment(sequence, sequence)
+            first.put(segment)
+            second.put(segment)
+            await hass.async_block_till_done()
+        for sequence in range(3):
+            third.put(_segment(sequence, 10 + sequence))
+            await hass.async_block_till_done()
+
+        # The oldest segment is only freed once both outputs dropped it
+        assert first.sequences == [1, 2, 3, 4]
+        assert second.sequences == [1, 2, 3, 4]
+        assert third.sequences == [0, 1, 2]
+
+        # Segments listed in the playlists are kept over the limit
+        third.put(_segment(3, 13))
+        await hass.async_block_till_done()
+        assert first.sequences == [1, 2, 3, 4]
+        assert second.sequences == [1, 2, 3, 4]
+        assert third.sequences == [0, 1, 2, 3]
+
+    for stream in streams:
+        await stream.stop()
+
+
 async def test_hls_playlist_view_discontinuity(
     hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
 ) -> None:
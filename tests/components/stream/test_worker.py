@@ -1058,7 +1058,8 @@ async def test_get_image_rotated(hass: HomeAssistant, h264_video, filename) -> N
         "homeassistant.components.camera.img_util.TurboJPEGSingleton"
     ) as mock_turbo_jpeg_singleton:
         mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
-        for orientation in (Orientation.NO_TRANSFORM, Orientation.ROTATE_RIGHT):
+        # Untransformed images are encoded from the decoded planes instead
+        for orientation in (Orientation.ROTATE_180, Orientation.ROTATE_RIGHT):
             stream = create_stream(hass, h264_video, {}, dynamic_stream_settings())
             stream.dynamic_stream_settings.orientation = orientation
 
@@ -1079,3 +1080,68 @@ async def test_get_image_rotated(hass: HomeAssistant, h264_video, filename) -> N
                 0
             ][0]
         ).all()
+
+
+async def test_get_image_from_yuv(hass: HomeAssistant, h264_video, filename) -> None:
+    """Test untransformed images are encoded from the decoded planes."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    # Since libjpeg-turbo is not installed on the CI runner, we use a mock
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton"
+    ) as mock_turbo_jpeg_singleton:
+        turbo_jpeg = mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
+        stream = create_stream(hass, h264_video, {}, dynamic_stream_settings())
+
+    with patch.object(hass.config, "is_allowed_path", return_value=True):
+        await stream.async_record(filename)
+
+    assert await stream.async_get_image() == EMPTY_8_6_JPEG
+    assert turbo_jpeg.encode.call_count == 0
+    assert turbo_jpeg.encode_from_yuv.call_count == 1
+    yuv, height, width = turbo_jpeg.encode_from_yuv.call_args[0]
+    assert (height, width) == (320, 480)
+    # The Y plane is followed by the U and V planes of half the resolution
+    assert yuv.shape == (480, 480)
+
+    # Requests before the next keyframe share the image without decoding again
+    with patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as mock_executor_job:
+        assert await stream.async_get_image() == EMPTY_8_6_JPEG
+    assert mock_executor_job.call_count == 0
+    assert turbo_jpeg.encode_from_yuv.call_count == 1
+
+    await stream.stop()
+
+
+async def test_get_image_odd_size(hass: HomeAssistant, h264_video, filename) -> None:
+    """Test images with an unaligned size are encoded from a BGR array."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    # Since libjpeg-turbo is not installed on the CI runner, we use a mock
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton"
+    ) as mock_turbo_jpeg_singleton:
+        turbo_jpeg = mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
+        stream = create_stream(hass, h264_video, {}, dynamic_stream_settings())
+
+    with patch.object(hass.config, "is_allowed_path", return_value=True):
+        await stream.async_record(filename)
+    packet = stream._keyframe_converter._packet
+
+    # 4:2:0 planes need an even width and height
+    assert await stream.async_get_image(width=241, height=161) == EMPTY_8_6_JPEG
+    assert turbo_jpeg.encode_from_yuv.call_count == 0
+    assert turbo_jpeg.encode.call_count == 1
+    assert turbo_jpeg.encode.call_args[0][0].shape == (161, 241, 3)
+
+    # An even width which is not a multiple of 8 gives chroma rows which are
+    # not padded to 4 bytes, as TurboJPEG expects
+    stream._keyframe_converter._packet = packet
+    assert await stream.async_get_image(width=500, height=320) == EMPTY_8_6_JPEG
+    assert turbo_jpeg.encode_from_yuv.call_count == 0
+    assert turbo_jpeg.encode.call_count == 2
+    assert turbo_jpeg.encode.call_args[0][0].shape == (320, 500, 3)
+
+    await stream.stop()
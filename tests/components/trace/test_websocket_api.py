@@ -602,6 +602,65 @@ async def test_trace_overflow(
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_memory_budget(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain: str
+) -> None:
+    """Test the oldest finished traces are dropped when over the memory limit."""
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": {"event": "some_event"},
+    }
+    moon_config = {
+        "id": "moon",
+        "triggers": {"platform": "event", "event_type": "test_event2"},
+        "actions": {"event": "another_event"},
+    }
+    with patch("homeassistant.components.trace.TRACE_MEMORY_LIMIT", 1):
+        await _setup_automation_or_script(hass, domain, [sun_config, moon_config])
+
+    client = await hass_ws_client()
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], domain, "sun")) == 1
+
+    # The newest trace is kept even though it is over the limit on its own
+    await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 2, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], domain, "sun")) == 0
+    assert len(_find_traces(response["result"], domain, "moon")) == 1
+
+    # The finished trace is rebuilt from its compact form
+    run_id = _find_run_id(response["result"], domain, "moon")
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "trace/get",
+            "domain": domain,
+            "item_id": "moon",
+            "run_id": run_id,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    trace = response["result"]
+    assert trace["run_id"] == run_id
+    assert trace["state"] == "stopped"
+    assert trace["script_execution"] == "finished"
+    assert trace["config"]["id" if domain == "automation" else "sequence"]
+    assert trace["trace"]
+
+
 @pytest.mark.parametrize(
     ("domain", "num_restored_moon_traces"), [("automation", 3), ("script", 1)]
 )
@@ -1,11 +1,13 @@
 """The tests for the TTS component."""
 
 import asyncio
+from collections.abc import AsyncGenerator
 from http import HTTPStatus
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+from aiohttp import ClientPayloadError
 from freezegun.api import FrozenDateTimeFactory
 import pytest
 
@@ -1970,3 +1972,152 @@ async def test_default_engine_prefer_cloud_entity(
     provider_engine = tts.async_resolve_engine(hass, "test")
     assert provider_engine == "test"
     assert tts.async_default_engine(hass) == "tts.cloud_tts_entity"
+
+
+async def test_stream_audio_while_synthesizing(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    tts_mutagen_mock: MagicMock,
+) -> None:
+    """Test audio chunks are sent to the player while they are synthesized."""
+    next_chunk = asyncio.Event()
+
+    class StreamingTTSEntity(MockTTSEntity):
+        """Test entity that synthesizes audio in chunks."""
+
+        async def async_stream_tts_audio(
+            self, message: str, language: str, options: dict[str, Any]
+        ) -> tts.TtsAudioStreamType:
+            """Stream the audio in two chunks."""
+
+            async def audio_chunks() -> AsyncGenerator[bytes]:
+                yield b"first"
+                await next_chunk.wait()
+                yield b"second"
+
+            return "mp3", audio_chunks()
+
+    await mock_config_entry_setup(hass, StreamingTTSEntity(DEFAULT_LANG))
+    url = await get_media_source_url(
+        hass,
+        tts.generate_media_source_id(hass, "There is someone at the door.", "tts.test"),
+    )
+
+    client = await hass_client()
+    with patch(
+        "homeassistant.components.tts.SpeechManager.id3_header",
+        return_value=b"ID3",
+    ) as mock_id3_header:
+        req = await client.get(url)
+        assert req.status == HTTPStatus.OK
+        assert await req.content.readexactly(8) == b"ID3first"
+
+        next_chunk.set()
+        assert await req.content.read() == b"second"
+
+    # Once synthesized, the same audio is served from the cache
+    req = await client.get(url)
+    assert req.status == HTTPStatus.OK
+    assert await req.read() == b"ID3firstsecond"
+    assert mock_id3_header.call_count == 1
+    assert tts_mutagen_mock.call_count == 0
+
+
+async def test_stream_audio_error_while_synthesizing(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test the streamed audio is aborted when the synthesis fails."""
+
+    class FailingTTSEntity(MockTTSEntity):
+        """Test entity that fails after the first chunk."""
+
+        async def async_stream_tts_audio(
+            self, message: str, language: str, options: dict[str, Any]
+        ) -> tts.TtsAudioStreamType:
+            """Stream one chunk and fail."""
+
+            async def audio_chunks() -> AsyncGenerator[bytes]:
+                yield b"first"
+                raise HomeAssistantError("Lost connection")
+
+            return "mp3", audio_chunks()
+
+    await mock_config_entry_setup(hass, FailingTTSEntity(DEFAULT_LANG))
+    url = await get_media_source_url(
+        hass,
+        tts.generate_media_source_id(hass, "There is someone at the door.", "tts.test"),
+    )
+
+    client = await hass_client()
+    req = await client.get(url)
+    assert req.status == HTTPStatus.OK
+    with pytest.raises(ClientPayloadError):
+        await req.read()
+
+    # The failed audio is not cached
+    await hass.async_block_till_done()
+    req = await client.get(url)
+    assert req.status == HTTPStatus.NOT_FOUND
+
+
+async def test_mem_cache_drops_least_recently_used(hass: HomeAssistant) -> None:
+    """Test the memory cache keeps recently used audio within its size limit."""
+
+    class MessageTTSEntity(MockTTSEntity):
+        """Test entity that returns the message as audio."""
+
+        def get_tts_audio(
+            self, message: str, language: str, options: dict[str, Any]
+        ) -> tts.TtsAudioType:
+            """Return the message as audio."""
+            return ("mp3", message.encode())
+
+    entity = MessageTTSEntity(DEFAULT_LANG)
+    with patch("homeassistant.components.tts.MEM_CACHE_MAX_SIZE", 12):
+        await mock_config_entry_setup(hass, entity)
+    mem_cache = hass.data[tts.DATA_TTS_MANAGER].mem_cache
+
+    async def get_audio(message: str) -> bytes:
+        media_id = tts.generate_media_source_id(hass, message, "tts.test", cache=False)
+        return (await tts.async_get_media_source_audio(hass, media_id))[1]
+
+    with patch.object(
+        entity, "get_tts_audio", wraps=entity.get_tts_audio
+    ) as mock_get_tts_audio:
+        assert await get_audio("first") == b"first"
+        assert await get_audio("second") == b"second"
+        assert await get_audio("first") == b"first"
+        assert mock_get_tts_audio.call_count == 2
+        assert mem_cache.size == 11
+
+        # The least recently used audio is dropped to make room
+        assert await get_audio("third") == b"third"
+        assert mem_cache.size == 10
+        assert await get_audio("first") == b"first"
+        assert mock_get_tts_audio.call_count == 3
+        assert await get_audio("second") == b"second"
+        assert mock_get_tts_audio.call_count == 4
+
+    assert mem_cache.hits == 2
+    assert mem_cache.misses == 4
+
+
+async def test_mem_cache_counts_each_request_once(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test resolving and reading the URL of a message counts one lookup."""
+    await mock_config_entry_setup(hass, MockTTSEntity(DEFAULT_LANG))
+    mem_cache = hass.data[tts.DATA_TTS_MANAGER].mem_cache
+    client = await hass_client()
+    media_id = tts.generate_media_source_id(
+        hass, "There is someone at the door.", "tts.test"
+    )
+
+    for _ in range(2):
+        url = await get_media_source_url(hass, media_id)
+        req = await client.get(url)
+        assert req.status == HTTPStatus.OK
+
+    assert mem_cache.hits == 1
+    assert mem_cache.misses == 1
@@ -258,13 +258,21 @@ async def test_and_condition_with_template(hass: HomeAssistant) -> None:
     config = await condition.async_validate_condition_config(hass, config)
     test = await condition.async_from_config(hass, config)
 
+    # The numeric state condition is checked before the template
     hass.states.async_set("sensor.temperature", 120)
     assert not test(hass)
     assert_condition_trace(
         {
             "": [{"result": {"result": False}}],
-            "conditions/0": [
-                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            "conditions/1": [{"result": {"result": False}}],
+            "conditions/1/entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": 120.0,
+                        "wanted_state_below": 110.0,
+                    }
+                }
             ],
         }
     )
@@ -276,6 +284,122 @@ async def test_and_condition_with_template(hass: HomeAssistant) -> None:
     assert test(hass)
 
 
+async def test_conditions_check_cheapest_first(hass: HomeAssistant) -> None:
+    """Test and/or conditions check cheap conditions first."""
+    config = {
+        "condition": "and",
+        "conditions": [
+            {
+                "condition": "template",
+                "value_template": '{{ states.sensor.temperature.state == "100" }}',
+            },
+            {
+                "condition": "or",
+                "conditions": [
+                    {
+                        "condition": "template",
+                        "value_template": "{{ false }}",
+                    },
+                    {
+                        "condition": "state",
+                        "entity_id": "sensor.humidity",
+                        "state": "50",
+                    },
+                ],
+            },
+            {
+                "condition": "state",
+                "entity_id": "sensor.temperature",
+                "state": "100",
+            },
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("sensor.temperature", 120)
+    hass.states.async_set("sensor.humidity", 50)
+    trace.trace_cv.set(None)
+    with patch(
+        "homeassistant.helpers.condition.async_template",
+        wraps=condition.async_template,
+    ) as async_template_mock:
+        # The state condition is false, the templates are not rendered
+        assert not test(hass)
+        assert async_template_mock.call_count == 0
+
+        # The state condition of the or condition is true
+        hass.states.async_set("sensor.temperature", 100)
+        assert test(hass)
+        assert async_template_mock.call_count == 1
+
+    # No trace was created
+    assert trace.trace_cv.get() is None
+
+    # Traced conditions are checked in the same order with their declared paths
+    trace.trace_clear()
+    with patch(
+        "homeassistant.helpers.condition.async_template",
+        wraps=condition.async_template,
+    ) as async_template_mock:
+        assert test(hass)
+        assert async_template_mock.call_count == 1
+    assert list(trace.trace_get(clear=False)) == [
+        "",
+        "conditions/2",
+        "conditions/2/entity_id/0",
+        "conditions/0",
+        "conditions/1",
+        "conditions/1/conditions/1",
+        "conditions/1/conditions/1/entity_id/0",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("conditions", "expected_order"),
+    [
+        (["template", "state", "sun", "time"], [1, 3, 2, 0]),
+        (["template", "device", "state"], [0, 1, 2]),
+        (["template", "state", "light.mock", "sun", "time"], [1, 0, 2, 4, 3]),
+        (["template", "and_device", "state"], [0, 1, 2]),
+    ],
+)
+def test_conditions_not_moved_across_device_conditions(
+    conditions: list[str], expected_order: list[int]
+) -> None:
+    """Test conditions are not moved across device and platform conditions."""
+    configs = [
+        {"condition": "and", "conditions": [{"condition": "device"}]}
+        if name == "and_device"
+        else {"condition": name}
+        for name in conditions
+    ]
+    checks = [lambda hass, variables: True for _ in configs]
+    assert [
+        index for index, _ in condition._checks_by_cost(configs, checks)
+    ] == expected_order
+
+
+async def test_condition_errors_order(hass: HomeAssistant) -> None:
+    """Test errors of conditions keep their declared order."""
+    config = {
+        "condition": "and",
+        "conditions": [
+            {"condition": "template", "value_template": "{{ undefined_fn() }}"},
+            {"condition": "state", "entity_id": "sensor.missing", "state": "on"},
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    trace.trace_cv.set(None)
+    with pytest.raises(ConditionError) as err:
+        test(hass)
+    assert [error.index for error in err.value.errors] == [0, 1]
+
+
 async def test_and_condition_shorthand(hass: HomeAssistant) -> None:
     """Test the 'and' condition shorthand."""
     config = {
@@ -300,13 +424,21 @@ async def test_and_condition_shorthand(hass: HomeAssistant) -> None:
     assert config["alias"] == "And Condition Shorthand"
     assert "and" not in config
 
+    # The numeric state condition is checked before the template
     hass.states.async_set("sensor.temperature", 120)
     assert not test(hass)
     assert_condition_trace(
         {
             "": [{"result": {"result": False}}],
-            "conditions/0": [
-                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            "conditions/1": [{"result": {"result": False}}],
+            "conditions/1/entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": 120.0,
+                        "wanted_state_below": 110.0,
+                    }
+                }
             ],
         }
     )
@@ -342,13 +474,21 @@ async def test_and_condition_list_shorthand(hass: HomeAssistant) -> None:
     assert config["alias"] == "And Condition List Shorthand"
     assert "and" not in config
 
+    # The numeric state condition is checked before the template
     hass.states.async_set("sensor.temperature", 120)
     assert not test(hass)
     assert_condition_trace(
         {
             "": [{"result": {"result": False}}],
-            "conditions/0": [
-                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            "conditions/1": [{"result": {"result": False}}],
+            "conditions/1/entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": 120.0,
+                        "wanted_state_below": 110.0,
+                    }
+                }
             ],
         }
     )
@@ -21,12 +21,14 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    EVENT_STATE_REPORTED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     EntityCategory,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HassJobType,
     HomeAssistant,
     ReleaseChannel,
@@ -2652,3 +2654,92 @@ async def test_async_write_ha_state_thread_safety_always(
     ):
         await hass.async_add_executor_job(ent2.async_write_ha_state)
     assert not hass.states.get(ent2.entity_id)
+
+
+async def test_state_dirty_tracking(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the state is only calculated when an _attr_ changed."""
+    calculations = 0
+
+    class DirtyTrackingEntity(entity.Entity):
+        """Entity which opts in to dirty tracking."""
+
+        _state_dirty_tracking = True
+
+        @property
+        def state_attributes(self) -> dict[str, Any] | None:
+            """Count state calculations."""
+            nonlocal calculations
+            calculations += 1
+            return None
+
+    ent = DirtyTrackingEntity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_state = "on"
+    ent.async_write_ha_state()
+    assert calculations == 1
+    state = hass.states.get("hello.world")
+    assert state.state == "on"
+
+    reported_events = []
+
+    @callback
+    def _listener(event: Event) -> None:
+        reported_events.append(event)
+
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED, _listener, event_filter=callback(lambda _: True)
+    )
+
+    # Nothing changed, the state is reported again without calculating it
+    freezer.tick(1)
+    ent.async_write_ha_state()
+    await hass.async_block_till_done()
+    assert calculations == 1
+    assert hass.states.get("hello.world") is state
+    assert state.last_reported > state.last_updated
+    assert len(reported_events) == 1
+
+    # Setting an _attr_ to the same value does not mark the state dirty
+    ent._attr_state = "on"
+    ent.async_write_ha_state()
+    assert calculations == 1
+
+    ent._attr_state = "off"
+    ent.async_write_ha_state()
+    assert calculations == 2
+    assert hass.states.get("hello.world").state == "off"
+
+    # The state is calculated if it was changed by someone else
+    hass.states.async_set("hello.world", "on")
+    ent.async_write_ha_state()
+    assert calculations == 3
+    assert hass.states.get("hello.world").state == "off"
+
+    # The state is calculated if the availability changed
+    with patch.object(
+        DirtyTrackingEntity, "available", PropertyMock(return_value=False)
+    ):
+        ent.async_write_ha_state()
+    assert hass.states.get("hello.world").state == STATE_UNAVAILABLE
+
+
+async def test_state_dirty_tracking_disabled(hass: HomeAssistant) -> None:
+    """Test the state is always calculated without dirty tracking."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_state = "on"
+    ent.async_write_ha_state()
+
+    with patch.object(
+        entity.Entity,
+        "capability_attributes",
+        PropertyMock(return_value=None),
+    ) as capability_attributes:
+        ent.async_write_ha_state()
+        ent.async_write_ha_state()
+
+    assert capability_attributes.call_count == 2
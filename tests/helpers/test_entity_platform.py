@@ -1247,6 +1247,69 @@ async def test_device_info_not_overrides(
     assert device2.model == "test-model"
 
 
+async def test_device_info_shared_by_entities(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test the device is only created once for entities with equal device info."""
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    config_entry.add_to_hass(hass)
+
+    def _device_info(identifier: str) -> dr.DeviceInfo:
+        return {
+            "identifiers": {("hue", identifier)},
+            "manufacturer": "test-manufacturer",
+            "name": f"Device {identifier}",
+        }
+
+    async def async_setup_entry(
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Mock setup entry method."""
+        async_add_entities(
+            [
+                MockEntity(unique_id="1", device_info=_device_info("1234")),
+                MockEntity(unique_id="2", device_info=_device_info("5678")),
+                MockEntity(unique_id="3", device_info=_device_info("1234")),
+                MockEntity(unique_id="4", device_info=_device_info("5678")),
+                MockEntity(
+                    unique_id="5",
+                    device_info=_device_info("1234") | {"model": "test-model"},
+                ),
+            ]
+        )
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    entity_platform = MockEntityPlatform(
+        hass, platform_name=config_entry.domain, platform=platform
+    )
+
+    with patch.object(
+        device_registry,
+        "async_get_or_create",
+        wraps=device_registry.async_get_or_create,
+    ) as mock_get_or_create:
+        assert await entity_platform.async_setup_entry(config_entry)
+        await hass.async_block_till_done()
+
+    assert len(hass.states.async_entity_ids()) == 5
+    # The device info of the last entity differs and is not taken from the cache
+    assert mock_get_or_create.call_count == 3
+
+    device1 = device_registry.async_get_device(identifiers={("hue", "1234")})
+    device2 = device_registry.async_get_device(identifiers={("hue", "5678")})
+    assert device1.model == "test-model"
+    entities = entity_platform.entities.values()
+    assert [entity.device_entry.id for entity in entities] == [
+        device1.id,
+        device2.id,
+        device1.id,
+        device2.id,
+        device1.id,
+    ]
+
+
 async def test_device_info_homeassistant_url(
     hass: HomeAssistant,
     device_registry: dr.DeviceRegistry,
@@ -23,9 +23,11 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.exceptions import TemplateError
+from homeassistant.helpers import event
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    TIMER_WHEEL_TICK,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
@@ -52,6 +54,7 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.template import Template, result_as_boolean
 from homeassistant.setup import async_setup_component
+from homeassistant.util.async_ import get_scheduled_timer_handles
 import homeassistant.util.dt as dt_util
 
 from tests.common import async_fire_time_changed, async_fire_time_changed_exact
@@ -4978,3 +4981,158 @@ async def test_async_track_template_result_no_hass_deprecated(
     )
     assert message not in caplog.text
     caplog.clear()
+
+
+def _wheel_handles(hass: HomeAssistant) -> list[asyncio.TimerHandle]:
+    """Return the pending event loop handles of the timer wheel."""
+    wheel = event._async_get_timer_wheel(hass)
+    return sorted(
+        (
+            handle
+            for handle in get_scheduled_timer_handles(hass.loop)
+            if not handle.cancelled() and handle._callback == wheel._async_run_slot  # noqa: SLF001
+        ),
+        key=lambda handle: handle.when(),
+    )
+
+
+def _run_wheel_handle(handle: asyncio.TimerHandle) -> None:
+    """Run a timer wheel handle like the event loop would when it is due."""
+    handle._run()
+    handle.cancel()
+
+
+async def test_timer_wheel_groups_timers_per_tick(hass: HomeAssistant) -> None:
+    """Test timers due in the same tick share one event loop handle."""
+    wheel = event._async_get_timer_wheel(hass)
+    calls: list[str] = []
+    # Start of a tick well in the future
+    start = (int(hass.loop.time() / TIMER_WHEEL_TICK) + 100) * TIMER_WHEEL_TICK
+    first = start + TIMER_WHEEL_TICK * 0.2
+    second = start + TIMER_WHEEL_TICK * 0.8
+    next_tick = start + TIMER_WHEEL_TICK * 1.5
+
+    wheel.async_schedule(first, lambda: calls.append("first"))
+    wheel.async_schedule(second, lambda: calls.append("second"))
+    wheel.async_schedule(next_tick, lambda: calls.append("next_tick"))
+
+    handles = _wheel_handles(hass)
+    assert len(handles) == 2
+    # Timers never run early, and at most one tick late
+    for handle, due in ((handles[0], (first, second)), (handles[1], (next_tick,))):
+        for when in due:
+            assert when <= handle.when() < when + TIMER_WHEEL_TICK
+
+    _run_wheel_handle(handles[0])
+    assert calls == ["first", "second"]
+    assert _wheel_handles(hass) == [handles[1]]
+
+    _run_wheel_handle(handles[1])
+    assert calls == ["first", "second", "next_tick"]
+    assert not _wheel_handles(hass)
+
+
+async def test_timer_wheel_cancel_and_rearm(hass: HomeAssistant) -> None:
+    """Test cancelling and rearming timers of the timer wheel."""
+    wheel = event._async_get_timer_wheel(hass)
+    calls: list[str] = []
+    start = (int(hass.loop.time() / TIMER_WHEEL_TICK) + 100) * TIMER_WHEEL_TICK
+
+    cancel_first = wheel.async_schedule(
+        start + TIMER_WHEEL_TICK * 0.2, lambda: calls.append("first")
+    )
+    cancel_second = wheel.async_schedule(
+        start + TIMER_WHEEL_TICK * 0.8, lambda: calls.append("second")
+    )
+    (handle,) = _wheel_handles(hass)
+
+    # Cancelling a timer keeps the handle while its slot has other timers
+    cancel_first()
+    assert _wheel_handles(hass) == [handle]
+    # Cancelling twice is a no-op
+    cancel_first()
+
+    # Rearming moves the timer to the slot of its new due time
+    cancel_second()
+    assert handle.cancelled()
+    assert not _wheel_handles(hass)
+    rearmed = start + TIMER_WHEEL_TICK * 10.5
+    wheel.async_schedule(rearmed, lambda: calls.append("second"))
+    (handle,) = _wheel_handles(hass)
+    assert rearmed <= handle.when() < rearmed + TIMER_WHEEL_TICK
+
+    _run_wheel_handle(handle)
+    assert calls == ["second"]
+
+
+async def test_timer_wheel_cancel_from_timer(hass: HomeAssistant) -> None:
+    """Test a timer cancelled by another timer of its slot does not run."""
+    wheel = event._async_get_timer_wheel(hass)
+    calls: list[str] = []
+    start = (int(hass.loop.time() / TIMER_WHEEL_TICK) + 100) * TIMER_WHEEL_TICK
+
+    def _first() -> None:
+        calls.append("first")
+        cancel_second()
+
+    wheel.async_schedule(start + TIMER_WHEEL_TICK * 0.2, _first)
+    cancel_second = wheel.async_schedule(
+        start + TIMER_WHEEL_TICK * 0.8, lambda: calls.append("second")
+    )
+    (handle,) = _wheel_handles(hass)
+    _run_wheel_handle(handle)
+
+    assert calls == ["first"]
+    assert not _wheel_handles(hass)
+
+    # Timers run ahead of their slot can cancel each other too
+    wheel.async_schedule(start + TIMER_WHEEL_TICK * 0.2, _first)
+    cancel_second = wheel.async_schedule(
+        start + TIMER_WHEEL_TICK * 0.8, lambda: calls.append("second")
+    )
+    wheel.async_run_due(start + TIMER_WHEEL_TICK)
+
+    assert calls == ["first", "first"]
+    assert not _wheel_handles(hass)
+
+
+async def test_timer_wheel_error(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a failing timer does not prevent other timers of its slot."""
+    wheel = event._async_get_timer_wheel(hass)
+    calls: list[str] = []
+    start = (int(hass.loop.time() / TIMER_WHEEL_TICK) + 100) * TIMER_WHEEL_TICK
+
+    def _raise_exception() -> None:
+        raise RuntimeError("timer failed")
+
+    wheel.async_schedule(start + TIMER_WHEEL_TICK * 0.2, _raise_exception)
+    wheel.async_schedule(start + TIMER_WHEEL_TICK * 0.8, lambda: calls.append("ok"))
+    (handle,) = _wheel_handles(hass)
+    _run_wheel_handle(handle)
+
+    assert calls == ["ok"]
+    assert "timer failed" in caplog.text
+
+
+async def test_track_point_in_utc_time_same_tick(hass: HomeAssistant) -> None:
+    """Test point in time listeners due in the same tick share a wakeup."""
+    calls: list[datetime] = []
+    now = dt_util.utcnow()
+    first = now + timedelta(seconds=10)
+    second = first + timedelta(seconds=TIMER_WHEEL_TICK / 10)
+    for point_in_time in (first, second):
+        async_track_point_in_utc_time(hass, calls.append, point_in_time)
+
+    # The two points share a slot unless they are on either side of a tick
+    assert 1 <= len(_wheel_handles(hass)) <= 2
+
+    async_fire_time_changed_exact(hass, first + timedelta(milliseconds=1))
+    await hass.async_block_till_done()
+    assert calls == [first]
+
+    async_fire_time_changed_exact(hass, second + timedelta(milliseconds=1))
+    await hass.async_block_till_done()
+    assert calls == [first, second]
+    assert not _wheel_handles(hass)
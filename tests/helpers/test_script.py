@@ -7,6 +7,7 @@ from functools import reduce
 import logging
 import operator
 from types import MappingProxyType
+from typing import Any
 from unittest import mock
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
@@ -38,6 +39,7 @@ from homeassistant.helpers import (
     device_registry as dr,
     entity_registry as er,
     script,
+    service,
     template,
     trace,
 )
@@ -280,6 +282,66 @@ async def test_calling_service_basic(
     )
 
 
+@pytest.mark.parametrize(
+    ("action", "prepare_calls"),
+    [
+        (
+            {
+                "action": "test.script",
+                "target": {"entity_id": "light.kitchen"},
+                "data": {"hello": "world"},
+            },
+            1,
+        ),
+        (
+            {
+                "action": "test.script",
+                "target": {"entity_id": "light.kitchen"},
+                "data": {"hello": "{{ 'world' }}"},
+            },
+            2,
+        ),
+        (
+            {
+                "action": "test.script",
+                "target": {"entity_id": "registry_id"},
+                "data": {"hello": "world"},
+            },
+            2,
+        ),
+    ],
+)
+async def test_calling_service_static_params(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    action: dict[str, Any],
+    prepare_calls: int,
+) -> None:
+    """Test service call parameters without templates are only prepared once."""
+    calls = async_mock_service(hass, "test", "script")
+    entry = entity_registry.async_get_or_create(
+        "light", "hue", "1234", suggested_object_id="kitchen"
+    )
+    if action["target"]["entity_id"] == "registry_id":
+        action["target"]["entity_id"] = entry.id
+
+    sequence = cv.SCRIPT_SCHEMA(action)
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    with patch(
+        "homeassistant.helpers.service.async_prepare_call_from_config",
+        wraps=service.async_prepare_call_from_config,
+    ) as mock_prepare:
+        await script_obj.async_run(context=Context())
+        await script_obj.async_run(context=Context())
+        await hass.async_block_till_done()
+
+    assert mock_prepare.call_count == prepare_calls
+    assert len(calls) == 2
+    for call in calls:
+        assert call.data == {"hello": "world", "entity_id": ["light.kitchen"]}
+
+
 async def test_calling_service_template(hass: HomeAssistant) -> None:
     """Test the calling of a service."""
     context = Context()
@@ -1808,6 +1808,34 @@ def test_render_with_possible_json_value_with_valid_json(hass: HomeAssistant) ->
     assert tpl.async_render_with_possible_json_value('{"hello": "world"}') == "world"
 
 
+def test_render_with_possible_json_value_overrides_value_json(
+    hass: HomeAssistant,
+) -> None:
+    """Render with possible JSON value parses the value over passed variables."""
+    tpl = template.Template("{{ value_json.hello }}", hass)
+    assert (
+        tpl.async_render_with_possible_json_value(
+            '{"hello": "world"}', variables={"value_json": {"hello": "other"}}
+        )
+        == "world"
+    )
+
+
+def test_render_with_value(hass: HomeAssistant) -> None:
+    """Render with value does not parse the value as JSON."""
+    tpl = template.Template("{{ value_json is defined }}", hass)
+    assert tpl.async_render_with_value('{"hello": "world"}') == "False"
+    tpl = template.Template("{{ value_json.hello }}", hass)
+    assert (
+        tpl.async_render_with_value(
+            '{"hello": "world"}', variables={"value_json": {"hello": "parsed"}}
+        )
+        == "parsed"
+    )
+    tpl = template.Template("{{ non_existing.variable }}", hass)
+    assert tpl.async_render_with_value("hello", "-") == "-"
+
+
 def test_render_with_possible_json_value_with_invalid_json(hass: HomeAssistant) -> None:
     """Render with possible JSON value with invalid JSON."""
     tpl = template.Template("{{ value_json }}", hass)
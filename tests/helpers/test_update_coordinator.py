@@ -848,3 +848,214 @@ async def test_config_entry(hass: HomeAssistant) -> None:
         hass, _LOGGER, name="test", config_entry=another_entry
     )
     assert crd.config_entry is another_entry
+
+
+async def test_refresh_stats(
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test refresh statistics are recorded."""
+    assert crd.stats.refreshes == 0
+    assert crd.stats.average_latency is None
+    assert crd.stats.error_rate == 0.0
+
+    await crd.async_refresh()
+    assert crd.stats.refreshes == 1
+    assert crd.stats.failures == 0
+    assert crd.stats.last_latency is not None
+    assert crd.stats.average_latency is not None
+
+    crd.update_method = AsyncMock(side_effect=update_coordinator.UpdateFailed)
+    await crd.async_refresh()
+    assert crd.stats.refreshes == 2
+    assert crd.stats.failures == 1
+    assert crd.stats.error_rate == 0.5
+
+    await crd.async_shutdown()
+    await crd.async_refresh()
+    assert crd.stats.refreshes == 2
+    assert crd.stats.skipped == 1
+
+
+async def test_polling_scheduler_spreads_refreshes(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test refreshes are moved to a later second when a second is crowded."""
+    crd1 = get_crd(hass, timedelta(seconds=10))
+    crd2 = get_crd(hass, timedelta(seconds=10))
+    scheduler = update_coordinator.async_get_polling_scheduler(hass)
+
+    with patch.object(update_coordinator, "POLLING_SLOT_CAPACITY", 1):
+        unsub1 = crd1.async_add_listener(Mock())
+        unsub2 = crd2.async_add_listener(Mock())
+
+    assert sum(scheduler._slots.values()) == 2
+
+    freezer.tick(timedelta(seconds=10))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert crd1.data == 1
+    assert crd2.data is None
+
+    freezer.tick(timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert crd1.data == 1
+    assert crd2.data == 1
+
+    unsub1()
+    unsub2()
+    assert not scheduler._slots
+
+
+def test_polling_scheduler_reserve() -> None:
+    """Test the polling scheduler picks the least crowded slot."""
+    scheduler = update_coordinator.PollingScheduler()
+
+    with patch.object(update_coordinator, "POLLING_SLOT_CAPACITY", 2):
+        assert scheduler.async_reserve(100.25, 8) == 100.25
+        assert scheduler.async_reserve(100.25, 8) == 100.25
+        assert scheduler.async_reserve(100.25, 8) == 101.25
+        assert scheduler.async_reserve(100.25, 8) == 101.25
+        assert scheduler.async_reserve(100.25, 8) == 102.25
+        assert scheduler.async_reserve(100.25, 8) == 102.25
+        # All slots within the spread are full, the least crowded one is used
+        assert scheduler.async_reserve(100.25, 8) == 100.25
+
+    scheduler.async_release(100.25)
+    scheduler.async_release(101.25)
+    scheduler.async_release(101.25)
+    assert scheduler.async_reserve(101.5, 8) == 101.5
+
+
+async def test_max_update_interval(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test polling backs off while data does not change."""
+    value = 1
+    update_method = AsyncMock(side_effect=lambda: value)
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        config_entry=None,
+        name="test",
+        update_method=update_method,
+        update_interval=timedelta(seconds=10),
+        max_update_interval=timedelta(seconds=20),
+    )
+    unsub = crd.async_add_listener(Mock())
+
+    async def _tick(seconds: int) -> None:
+        freezer.tick(timedelta(seconds=seconds))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    # First refresh changes data, interval stays at 10 seconds
+    await _tick(10)
+    assert update_method.call_count == 1
+    await _tick(10)
+    assert update_method.call_count == 2
+
+    # Data did not change, interval grows to 15 seconds
+    await _tick(10)
+    assert update_method.call_count == 2
+    await _tick(5)
+    assert update_method.call_count == 3
+
+    # Data did not change again, interval is capped at 20 seconds
+    await _tick(15)
+    assert update_method.call_count == 3
+    await _tick(5)
+    assert update_method.call_count == 4
+
+    # Data changed, interval resets to 10 seconds
+    value = 2
+    await _tick(20)
+    assert update_method.call_count == 5
+    await _tick(10)
+    assert update_method.call_count == 6
+
+    unsub()
+
+
+async def test_max_update_interval_slow_source(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test polling backs off when the source is slow to respond."""
+    value = 0
+
+    def _update() -> int:
+        nonlocal value
+        value += 1
+        return value
+
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        config_entry=None,
+        name="test",
+        update_method=AsyncMock(side_effect=_update),
+        update_interval=timedelta(seconds=10),
+        max_update_interval=timedelta(seconds=60),
+    )
+    unsub = crd.async_add_listener(Mock())
+
+    with patch.object(update_coordinator, "monotonic", side_effect=[0, 12]):
+        await crd.async_refresh()
+
+    assert crd.stats.last_latency == 12
+    assert crd._polling_interval_seconds == 24
+
+    unsub()
+
+
+async def test_keyed_listeners(hass: HomeAssistant) -> None:
+    """Test only listeners whose data changed are called back."""
+    data = {"a": 1, "b": 1}
+    crd = update_coordinator.DataUpdateCoordinator[dict[str, int]](
+        hass,
+        _LOGGER,
+        config_entry=None,
+        name="test",
+        update_method=AsyncMock(side_effect=lambda: dict(data)),
+        keyed_listeners=True,
+        always_update=False,
+    )
+    listener_a = Mock()
+    listener_b = Mock()
+    listener_all = Mock()
+    crd.async_add_listener(listener_a, "a")
+    crd.async_add_listener(listener_b, "b")
+    crd.async_add_listener(listener_all)
+
+    await crd.async_refresh()
+    assert listener_a.call_count == 1
+    assert listener_b.call_count == 1
+    assert listener_all.call_count == 1
+
+    await crd.async_refresh()
+    assert listener_a.call_count == 1
+    assert listener_b.call_count == 1
+    assert listener_all.call_count == 1
+
+    data["a"] = 2
+    await crd.async_refresh()
+    assert listener_a.call_count == 2
+    assert listener_b.call_count == 1
+    assert listener_all.call_count == 2
+
+    crd.async_set_updated_data({"a": 2, "b": 3})
+    assert listener_a.call_count == 2
+    assert listener_b.call_count == 2
+    assert listener_all.call_count == 3
+
+    # Availability changes are sent to all listeners
+    crd.update_method = AsyncMock(side_effect=update_coordinator.UpdateFailed)
+    await crd.async_refresh()
+    assert listener_a.call_count == 3
+    assert listener_b.call_count == 3
+    assert listener_all.call_count == 4
+
+    crd.async_set_updated_data({"a": 2, "b": 3})
+    assert listener_a.call_count == 4
+    assert listener_b.call_count == 4
+    assert listener_all.call_count == 5